@@ -0,0 +1,193 @@
+"""End-to-end client benchmarks against a local stand-in server.
+
+Starts ``benchmarks/standin.py`` in a child process and measures
+``MetquayClient`` on the hot paths: authentication, single-page lists,
+``paginate_all`` (serial and concurrent), iterating large pages (whole and
+streamed), creates and updates.  For each scenario it reports requests/s,
+records/s and the client's peak traced memory, and writes everything as
+JSON so runs can be compared release to release.  The client's rate
+limiter is disabled; its retry policy is left at the default.
+
+Usage::
+
+    python benchmarks/bench_client.py [--records 5000] [--iterations 200]
+        [--latency-ms 0] [--page-cap N] [--large-page 1000]
+        [--output results.json] [--compare previous.json]
+
+Run from the repository root with the package installed (``pip install -e .``).
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from standin import StandInServer
+
+from openapi_client.models.work_request import WorkRequest
+from pymetquay import MetquayClient, __version__
+
+Scenario = Callable[[MetquayClient], int]
+"""Runs one scenario and returns the number of records it handled."""
+
+
+def scenarios(
+    args: argparse.Namespace, work_ids: List[int]
+) -> List[Tuple[str, Scenario]]:
+    n = args.iterations
+    page_size = args.page_size
+    request = WorkRequest(customer_instrument_id=1, remarks="benchmark")
+
+    def authenticate(client: MetquayClient) -> int:
+        for _ in range(n):
+            client.authenticate()
+        return 0
+
+    def list_page(client: MetquayClient) -> int:
+        return sum(
+            len(client.list_works(first=0, limit=page_size)) for _ in range(n)
+        )
+
+    def paginate_all(concurrency: int) -> Scenario:
+        def run(client: MetquayClient) -> int:
+            return len(client.list_works(paginate_all=True, concurrency=concurrency))
+
+        return run
+
+    def iterate(stream: bool) -> Scenario:
+        def run(client: MetquayClient) -> int:
+            works = client.iter_works(page_size=args.large_page, stream=stream)
+            return sum(1 for _ in works)
+
+        return run
+
+    def create(client: MetquayClient) -> int:
+        for _ in range(n):
+            client.create_work(request)
+        return n
+
+    def update(client: MetquayClient) -> int:
+        for metquay_id in work_ids[:n]:
+            client.update_work(metquay_id, request)
+        return len(work_ids[:n])
+
+    return [
+        ("authenticate", authenticate),
+        ("list_page", list_page),
+        ("paginate_all", paginate_all(1)),
+        ("paginate_all_concurrent", paginate_all(args.concurrency)),
+        ("iter_large_pages", iterate(False)),
+        ("iter_large_pages_streamed", iterate(True)),
+        ("create", create),
+        ("update", update),
+    ]
+
+
+def _requests(server: StandInServer) -> int:
+    return sum(server.stats().values())
+
+
+def measure(
+    server: StandInServer, client: MetquayClient, name: str, scenario: Scenario
+) -> Dict[str, Any]:
+    client.authenticate()  # keep token acquisition out of the measurement
+    before = _requests(server)
+    start = time.perf_counter()
+    records = scenario(client)
+    seconds = time.perf_counter() - start
+    requests = _requests(server) - before
+
+    # Peak memory comes from a second, traced run: tracing slows the client
+    # down too much to share a run with the timing.
+    tracemalloc.start()
+    scenario(client)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "name": name,
+        "requests": requests,
+        "records": records,
+        "seconds": seconds,
+        "requests_per_second": requests / seconds,
+        "records_per_second": records / seconds,
+        "peak_memory_bytes": peak,
+    }
+
+
+def compare(results: List[Dict[str, Any]], path: str) -> None:
+    with open(path, encoding="utf-8") as handle:
+        previous = {r["name"]: r for r in json.load(handle)["results"]}
+    print("\nCompared with {0}:".format(path))
+    for result in results:
+        old = previous.get(result["name"])
+        if old is None or not old["requests_per_second"]:
+            continue
+        print(
+            "{0:<26} requests/s {1:>6.2f}x   peak memory {2:>6.2f}x".format(
+                result["name"],
+                result["requests_per_second"] / old["requests_per_second"],
+                result["peak_memory_bytes"] / max(old["peak_memory_bytes"], 1),
+            )
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=5000)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--page-cap", type=int, default=None)
+    parser.add_argument("--large-page", type=int, default=1000)
+    parser.add_argument("--output", default=None, help="write results as JSON")
+    parser.add_argument("--compare", default=None, help="earlier --output file")
+    args = parser.parse_args(argv)
+
+    results = []
+    with StandInServer(
+        records=args.records, latency=args.latency_ms / 1000, page_cap=args.page_cap
+    ) as server:
+        client = MetquayClient(
+            access_key="bench",
+            secret_key="bench",
+            host=server.url,
+            rate_limit_per_minute=None,
+        )
+        with client:
+            work_ids = [
+                work.id
+                for work in client.list_works(first=0, limit=args.iterations)
+                if work.id is not None
+            ]
+            for name, scenario in scenarios(args, work_ids):
+                result = measure(server, client, name, scenario)
+                results.append(result)
+                print(
+                    "{name:<26} {requests:>6} req {requests_per_second:>9,.0f} req/s "
+                    "{records_per_second:>10,.0f} rec/s "
+                    "{peak_mib:>8.1f} MiB peak".format(
+                        peak_mib=result["peak_memory_bytes"] / 2**20, **result
+                    )
+                )
+
+    if args.output:
+        meta = {
+            "pymetquay": __version__,
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "arguments": {k: v for k, v in vars(args).items() if k != "compare"},
+        }
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump({"meta": meta, "results": results}, handle, indent=2)
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Micro-benchmark for the date parsing used by the response models.
+
+Compares the old validator body (``strptime`` with each format in turn)
+with ``openapi_client.dates.parse_api_date`` on a stream of date strings
+drawn from a small pool of distinct dates, which is how dates repeat across
+a full works dump.  The cold run clears the cache first.
+
+Usage::
+
+    python benchmarks/bench_dates.py [--values 80000] [--distinct 2000]
+
+Run from the repository root with the package installed (``pip install -e .``).
+"""
+
+import argparse
+import random
+import time
+from datetime import date, datetime, timedelta
+from typing import Callable, List, Optional
+
+from openapi_client.dates import DATE_FORMATS, parse_api_date
+
+
+def strptime_parse(value: str) -> Optional[date]:
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+def _time(fn: Callable[[str], object], values: List[str]) -> float:
+    start = time.perf_counter()
+    for value in values:
+        fn(value)
+    return time.perf_counter() - start
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--values", type=int, default=80000)
+    parser.add_argument("--distinct", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(0)
+    start = date(2015, 1, 1)
+    pool = [start + timedelta(days=rng.randrange(4000)) for _ in range(args.distinct)]
+    # Mostly the API's MM-dd-yyyy, with some ISO dates mixed in.
+    formats = ["%m-%d-%Y"] * 9 + ["%Y-%m-%d"]
+    values = [
+        rng.choice(pool).strftime(rng.choice(formats)) for _ in range(args.values)
+    ]
+
+    baseline = _time(strptime_parse, values)
+    parse_api_date.cache_clear()
+    cold = _time(parse_api_date, values)
+    warm = _time(parse_api_date, values)
+    parse_api_date.cache_clear()
+    uncached = _time(parse_api_date.__wrapped__, values)
+
+    print("{0:,} values, {1:,} distinct dates".format(args.values, args.distinct))
+    for label, seconds in [
+        ("strptime (before)", baseline),
+        ("parse_api_date, no cache", uncached),
+        ("parse_api_date, cold cache", cold),
+        ("parse_api_date, warm cache", warm),
+    ]:
+        print(
+            "{0:<28} {1:>12,.0f} values/s {2:>7.1f}x".format(
+                label, args.values / seconds, baseline / seconds
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
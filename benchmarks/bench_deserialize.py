@@ -0,0 +1,150 @@
+"""Benchmark list-response deserialization for each response model.
+
+Compares the old path (stdlib ``json.loads`` on decoded text, then
+``Model.from_dict`` for every element) with ``ApiClient.deserialize``, which
+parses the raw bytes with the configured JSON codec and validates a whole
+page in one pass.  The ``lazy`` column wraps the parsed rows in
+``pymetquay.proxy.LazyRecord`` proxies and reads ``--touch`` fields of each
+(default 3), the way ``list_*_lazy`` callers do; the ``fields`` column
+validates the same fields into a ``pymetquay.projection`` model, as
+``list_*(fields=[...])`` does.
+No network access or credentials are needed; pages are synthetic records
+with every field populated.
+
+Usage::
+
+    python benchmarks/bench_deserialize.py [--records 1000] [--repeat 5] [--codec auto]
+        [--touch 3]
+
+Run from the repository root with the package installed (``pip install -e .``).
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from pydantic import ValidationError
+
+from openapi_client.api_client import ApiClient
+from openapi_client.json_codec import get_json_codec
+from openapi_client.models.customer_instrument_response import (
+    CustomerInstrumentResponse,
+)
+from openapi_client.models.customer_response import CustomerResponse
+from openapi_client.models.work_response import WorkResponse
+from pymetquay.projection import project_rows, projection
+from pymetquay.proxy import LazyRecord, lazy_records
+
+MODELS = [CustomerResponse, CustomerInstrumentResponse, WorkResponse]
+
+
+def synthetic_record(model: type, index: int) -> Dict[str, Any]:
+    """A JSON-ready record with a plausible value for every field."""
+    record: Dict[str, Any] = {}
+    for name, field in model.model_fields.items():
+        annotation = str(field.annotation)
+        if "List" in annotation:
+            value: Any = ["alpha", "beta"]
+        elif "date" in annotation:
+            value = "{0:02d}-{1:02d}-2025".format(index % 12 + 1, index % 28 + 1)
+        elif "bool" in annotation:
+            value = index % 2 == 0
+        elif "float" in annotation:
+            value = index * 1.5
+        elif "int" in annotation:
+            value = index
+        else:
+            value = "{0}-{1}".format(name, index)
+        record[field.alias or name] = value
+    # Fields with enum or pattern validators reject the generic value; null
+    # those out rather than hard-coding per-model vocabularies.
+    try:
+        model.from_dict(record)
+    except ValidationError as exc:
+        for error in exc.errors():
+            record[str(error["loc"][0])] = None
+    return record
+
+
+def _best_of(repeat: int, fn: Callable[[], object]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--codec", default="auto")
+    parser.add_argument("--touch", type=int, default=3, help="fields read per row")
+    args = parser.parse_args(argv)
+
+    api_client = ApiClient()
+    api_client.configuration.json_codec = get_json_codec(args.codec)
+    print("codec: {0}".format(api_client.configuration.json_codec.name))
+    print(
+        "{0:<28} {1:>14} {2:>14} {3:>8} {4:>14} {5:>14}".format(
+            "model",
+            "from_dict rec/s",
+            "bulk rec/s",
+            "speedup",
+            "lazy rec/s",
+            "fields rec/s",
+        )
+    )
+    for model in MODELS:
+        raw = json.dumps(
+            [synthetic_record(model, i) for i in range(args.records)]
+        ).encode("utf-8")
+        response_type = "List[{0}]".format(model.__name__)
+
+        def per_record() -> object:
+            return [model.from_dict(item) for item in json.loads(raw.decode("utf-8"))]
+
+        def bulk() -> object:
+            return api_client.deserialize(raw, response_type, "application/json")
+
+        # Fields shadowed by a LazyRecord attribute (``model``) read that
+        # attribute instead, so they are left out.
+        touched = [
+            name for name in model.model_fields if not hasattr(LazyRecord, name)
+        ][: args.touch]
+
+        def lazy() -> object:
+            rows = lazy_records(model, api_client.configuration.json_codec.loads(raw))
+            return [[getattr(row, name) for name in touched] for row in rows]
+
+        projected = projection(model, touched)
+
+        def fields() -> object:
+            parsed = api_client.configuration.json_codec.loads(raw)
+            return [
+                [getattr(row, name) for name in touched]
+                for row in project_rows(projected, parsed)
+            ]
+
+        assert per_record() == bulk()
+        assert lazy() == fields()
+        before = _best_of(args.repeat, per_record)
+        after = _best_of(args.repeat, bulk)
+        proxies = _best_of(args.repeat, lazy)
+        slim = _best_of(args.repeat, fields)
+        print(
+            "{0:<28} {1:>14,.0f} {2:>14,.0f} {3:>7.2f}x {4:>14,.0f} {5:>14,.0f}".format(
+                model.__name__,
+                args.records / before,
+                args.records / after,
+                before / after,
+                args.records / proxies,
+                args.records / slim,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
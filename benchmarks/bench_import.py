@@ -0,0 +1,92 @@
+"""Import-time benchmark for ``pymetquay``.
+
+Each statement runs in a fresh interpreter, several times, and the median
+wall time and number of modules loaded are reported.  ``--max-ms`` makes
+the script exit non-zero when ``import pymetquay`` or importing
+``MetquayClient`` gets slower than the budget, so it can guard the lazy
+imports in CI.
+
+Usage::
+
+    python benchmarks/bench_import.py [--runs 9] [--max-ms 80]
+
+Run from the repository root with the package installed (``pip install -e .``).
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from typing import List, Optional, Tuple
+
+# Statements that must stay within --max-ms.
+BUDGETED = ["import pymetquay", "from pymetquay import MetquayClient"]
+
+STATEMENTS = [
+    "import pymetquay",
+    "from pymetquay import MetquayClient",
+    "from pymetquay import MetquayClient; MetquayClient('k', 's', host='x.test')",
+    "import pymetquay; pymetquay.WorkResponse",
+    "import openapi_client",
+    "from openapi_client import WorksApi",
+]
+
+_PROBE = (
+    "import sys, time\n"
+    "start = time.perf_counter()\n"
+    "{0}\n"
+    "print(time.perf_counter() - start, len(sys.modules))\n"
+)
+
+
+def measure(statement: str, runs: int) -> Tuple[float, int]:
+    """Median seconds and modules loaded for ``statement`` in a new process."""
+    seconds: List[float] = []
+    modules = 0
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(statement)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.split()
+        seconds.append(float(output[0]))
+        modules = int(output[1])
+    return statistics.median(seconds), modules
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=9)
+    parser.add_argument(
+        "--max-ms",
+        type=float,
+        default=None,
+        help="fail if importing pymetquay or MetquayClient takes longer",
+    )
+    args = parser.parse_args(argv)
+
+    results = {}
+    for statement in STATEMENTS:
+        seconds, modules = measure(statement, args.runs)
+        results[statement] = seconds
+        print(
+            "{0:>8.1f} ms {1:>5} modules  {2}".format(
+                seconds * 1000, modules, statement
+            )
+        )
+
+    if args.max_ms is not None:
+        over = [
+            "`{0}` took {1:.1f} ms (budget {2:.0f} ms)".format(
+                statement, results[statement] * 1000, args.max_ms
+            )
+            for statement in BUDGETED
+            if results[statement] * 1000 > args.max_ms
+        ]
+        if over:
+            sys.exit("\n".join(over))
+
+
+if __name__ == "__main__":
+    main()
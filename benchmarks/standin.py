@@ -0,0 +1,73 @@
+"""Local stand-in for the Metquay API, for offline benchmarks.
+
+Runs :class:`pymetquay.fake_server.FakeMetquayServer` (the spec-driven fake)
+seeded with synthetic customers, customer instruments and works, with
+optional per-request latency and a cap on page size.  Throttling is off so
+the client's own overhead is what gets measured.
+
+The server runs in a child process so its CPU time and allocations do not
+show up in the client's measurements::
+
+    with StandInServer(records=5000, latency=0.005) as server:
+        client = MetquayClient("key", "secret", host=server.url)
+
+To run the fake on its own, use ``python -m pymetquay.fake_server``.
+"""
+
+import json
+import multiprocessing
+import urllib.request
+from typing import Any, Dict, Optional
+
+from pymetquay.fake_server import FakeMetquayServer
+
+
+def serve(
+    *,
+    records: int,
+    latency: float,
+    page_cap: Optional[int],
+    ready: Any,
+) -> None:
+    server = FakeMetquayServer(
+        seed_records=records,
+        rate_limit_per_minute=None,
+        latency=latency,
+        page_cap=page_cap,
+    )
+    ready.put(server.url)
+    server.serve_forever()
+
+
+class StandInServer:
+    """Runs the fake server in a child process for the duration of a ``with``."""
+
+    def __init__(
+        self,
+        *,
+        records: int = 1000,
+        latency: float = 0.0,
+        page_cap: Optional[int] = None,
+    ) -> None:
+        self._kwargs = dict(records=records, latency=latency, page_cap=page_cap)
+        self._process: Optional[multiprocessing.Process] = None
+        self.url = ""
+
+    def __enter__(self) -> "StandInServer":
+        ready: "multiprocessing.Queue[str]" = multiprocessing.Queue()
+        self._process = multiprocessing.Process(
+            target=serve, kwargs=dict(self._kwargs, ready=ready), daemon=True
+        )
+        self._process.start()
+        self.url = ready.get(timeout=120)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join()
+
+    def stats(self) -> Dict[str, int]:
+        """Requests served so far, keyed by operationId."""
+        with urllib.request.urlopen(self.url + "/__fake__/stats") as response:
+            return json.loads(response.read())["requests"]
@@ -13,6 +13,9 @@ npx @openapitools/openapi-generator-cli generate \
   --additional-properties=packageName=openapi_client \
   -o .
 
+# The fake server loads the spec from the installed package.
+cp 1.0.json pymetquay/openapi.json
+
 python generate_integration_tests.py
 
 ruff check . --fix
@@ -46,47 +46,81 @@ __all__ = [
     "WorkResponse",
 ]
 
-# import apis into sdk package
-from openapi_client.api.authenticate_api import AuthenticateApi as AuthenticateApi
-from openapi_client.api.customerinstruments_api import (
-    CustomerinstrumentsApi as CustomerinstrumentsApi,
-)
-from openapi_client.api.customers_api import CustomersApi as CustomersApi
-from openapi_client.api.instrumentcategories_api import (
-    InstrumentcategoriesApi as InstrumentcategoriesApi,
-)
-from openapi_client.api.works_api import WorksApi as WorksApi
-from openapi_client.api_client import ApiClient as ApiClient
+from typing import TYPE_CHECKING
 
-# import ApiClient
-from openapi_client.api_response import ApiResponse as ApiResponse
-from openapi_client.configuration import Configuration as Configuration
-from openapi_client.exceptions import ApiAttributeError as ApiAttributeError
-from openapi_client.exceptions import ApiException as ApiException
-from openapi_client.exceptions import ApiKeyError as ApiKeyError
-from openapi_client.exceptions import ApiTypeError as ApiTypeError
-from openapi_client.exceptions import ApiValueError as ApiValueError
-from openapi_client.exceptions import OpenApiException as OpenApiException
+from openapi_client._lazy import attach
 
-# import models into sdk package
-from openapi_client.models.authentication_request import (
-    AuthenticationRequest as AuthenticationRequest,
-)
-from openapi_client.models.authentication_response import (
-    AuthenticationResponse as AuthenticationResponse,
-)
-from openapi_client.models.created_response import CreatedResponse as CreatedResponse
-from openapi_client.models.customer_instrument_request import (
-    CustomerInstrumentRequest as CustomerInstrumentRequest,
-)
-from openapi_client.models.customer_instrument_response import (
-    CustomerInstrumentResponse as CustomerInstrumentResponse,
-)
-from openapi_client.models.customer_request import CustomerRequest as CustomerRequest
-from openapi_client.models.customer_response import CustomerResponse as CustomerResponse
-from openapi_client.models.error_response import ErrorResponse as ErrorResponse
-from openapi_client.models.instrument_category_request import (
-    InstrumentCategoryRequest as InstrumentCategoryRequest,
-)
-from openapi_client.models.work_request import WorkRequest as WorkRequest
-from openapi_client.models.work_response import WorkResponse as WorkResponse
+# Public name -> defining module; loaded on first access (see _lazy).
+_EXPORTS = {
+    "AuthenticateApi": "openapi_client.api.authenticate_api",
+    "CustomerinstrumentsApi": "openapi_client.api.customerinstruments_api",
+    "CustomersApi": "openapi_client.api.customers_api",
+    "InstrumentcategoriesApi": "openapi_client.api.instrumentcategories_api",
+    "WorksApi": "openapi_client.api.works_api",
+    "ApiClient": "openapi_client.api_client",
+    "ApiResponse": "openapi_client.api_response",
+    "Configuration": "openapi_client.configuration",
+    "ApiAttributeError": "openapi_client.exceptions",
+    "ApiException": "openapi_client.exceptions",
+    "ApiKeyError": "openapi_client.exceptions",
+    "ApiTypeError": "openapi_client.exceptions",
+    "ApiValueError": "openapi_client.exceptions",
+    "OpenApiException": "openapi_client.exceptions",
+    "AuthenticationRequest": "openapi_client.models.authentication_request",
+    "AuthenticationResponse": "openapi_client.models.authentication_response",
+    "CreatedResponse": "openapi_client.models.created_response",
+    "CustomerInstrumentRequest": "openapi_client.models.customer_instrument_request",
+    "CustomerInstrumentResponse": "openapi_client.models.customer_instrument_response",
+    "CustomerRequest": "openapi_client.models.customer_request",
+    "CustomerResponse": "openapi_client.models.customer_response",
+    "ErrorResponse": "openapi_client.models.error_response",
+    "InstrumentCategoryRequest": "openapi_client.models.instrument_category_request",
+    "WorkRequest": "openapi_client.models.work_request",
+    "WorkResponse": "openapi_client.models.work_response",
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
+
+if TYPE_CHECKING:
+    # import apis into sdk package
+    from openapi_client.api.authenticate_api import AuthenticateApi as AuthenticateApi
+    from openapi_client.api.customerinstruments_api import (
+        CustomerinstrumentsApi as CustomerinstrumentsApi,
+    )
+    from openapi_client.api.customers_api import CustomersApi as CustomersApi
+    from openapi_client.api.instrumentcategories_api import (
+        InstrumentcategoriesApi as InstrumentcategoriesApi,
+    )
+    from openapi_client.api.works_api import WorksApi as WorksApi
+    from openapi_client.api_client import ApiClient as ApiClient
+    # import ApiClient
+    from openapi_client.api_response import ApiResponse as ApiResponse
+    from openapi_client.configuration import Configuration as Configuration
+    from openapi_client.exceptions import ApiAttributeError as ApiAttributeError
+    from openapi_client.exceptions import ApiException as ApiException
+    from openapi_client.exceptions import ApiKeyError as ApiKeyError
+    from openapi_client.exceptions import ApiTypeError as ApiTypeError
+    from openapi_client.exceptions import ApiValueError as ApiValueError
+    from openapi_client.exceptions import OpenApiException as OpenApiException
+    # import models into sdk package
+    from openapi_client.models.authentication_request import (
+        AuthenticationRequest as AuthenticationRequest,
+    )
+    from openapi_client.models.authentication_response import (
+        AuthenticationResponse as AuthenticationResponse,
+    )
+    from openapi_client.models.created_response import CreatedResponse as CreatedResponse
+    from openapi_client.models.customer_instrument_request import (
+        CustomerInstrumentRequest as CustomerInstrumentRequest,
+    )
+    from openapi_client.models.customer_instrument_response import (
+        CustomerInstrumentResponse as CustomerInstrumentResponse,
+    )
+    from openapi_client.models.customer_request import CustomerRequest as CustomerRequest
+    from openapi_client.models.customer_response import CustomerResponse as CustomerResponse
+    from openapi_client.models.error_response import ErrorResponse as ErrorResponse
+    from openapi_client.models.instrument_category_request import (
+        InstrumentCategoryRequest as InstrumentCategoryRequest,
+    )
+    from openapi_client.models.work_request import WorkRequest as WorkRequest
+    from openapi_client.models.work_response import WorkResponse as WorkResponse
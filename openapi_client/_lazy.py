@@ -0,0 +1,45 @@
+# coding: utf-8
+
+"""Lazy package exports (PEP 562 module ``__getattr__``).
+
+Importing every API class and model up front costs hundreds of
+milliseconds, mostly pydantic building validators, which short-lived
+processes pay even if they make one call.  Packages instead declare where
+each public name lives and load it on first access::
+
+    _EXPORTS = {"WorksApi": "openapi_client.api.works_api"}
+    __getattr__, __dir__ = attach(__name__, _EXPORTS)
+
+Type checkers do not run ``__getattr__``, so packages also import the same
+names under ``if TYPE_CHECKING:``.
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def attach(
+    package: str, exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Return ``(__getattr__, __dir__)`` for ``package``.
+
+    :param package: The package's ``__name__``.
+    :param exports: Public name -> module that defines it.
+    """
+
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(
+                "module {0!r} has no attribute {1!r}".format(package, name)
+            )
+        value = getattr(importlib.import_module(module), name)
+        # Later lookups find the name directly, without calling back here.
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
@@ -1,8 +1,24 @@
 # flake8: noqa
 
-# import apis into api package
-from openapi_client.api.authenticate_api import AuthenticateApi
-from openapi_client.api.customerinstruments_api import CustomerinstrumentsApi
-from openapi_client.api.customers_api import CustomersApi
-from openapi_client.api.instrumentcategories_api import InstrumentcategoriesApi
-from openapi_client.api.works_api import WorksApi
+from typing import TYPE_CHECKING
+
+from openapi_client._lazy import attach
+
+# Public name -> defining module; loaded on first access (see _lazy).
+_EXPORTS = {
+    "AuthenticateApi": "openapi_client.api.authenticate_api",
+    "CustomerinstrumentsApi": "openapi_client.api.customerinstruments_api",
+    "CustomersApi": "openapi_client.api.customers_api",
+    "InstrumentcategoriesApi": "openapi_client.api.instrumentcategories_api",
+    "WorksApi": "openapi_client.api.works_api",
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
+
+if TYPE_CHECKING:
+    # import apis into api package
+    from openapi_client.api.authenticate_api import AuthenticateApi
+    from openapi_client.api.customerinstruments_api import CustomerinstrumentsApi
+    from openapi_client.api.customers_api import CustomersApi
+    from openapi_client.api.instrumentcategories_api import InstrumentcategoriesApi
+    from openapi_client.api.works_api import WorksApi
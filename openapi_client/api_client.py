@@ -15,17 +15,19 @@ Do not edit the class manually.
 
 import datetime
 import decimal
+import functools
 import json
 import mimetypes
 import os
 import re
 import tempfile
+import threading
+import time
 from enum import Enum
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 from urllib.parse import quote
 
-from dateutil.parser import parse
-from pydantic import SecretStr
+from pydantic import BaseModel, SecretStr, TypeAdapter
 
 import openapi_client.models
 from openapi_client import rest
@@ -33,10 +35,26 @@ from openapi_client.api_response import ApiResponse
 from openapi_client.api_response import T as ApiResponseT
 from openapi_client.configuration import Configuration
 from openapi_client.exceptions import ApiException, ApiValueError
+from openapi_client.instrumentation import RequestEvent, RequestMetrics, run_hooks
+from openapi_client.json_codec import iter_json_array
+from openapi_client.rate_limiter import RateLimiter
+from openapi_client.retry import RetryStats
 
 RequestSerialized = Tuple[str, str, Dict[str, str], Optional[str], List[str]]
 
 
+def _as_text(response_text: Union[str, bytes]) -> str:
+    if isinstance(response_text, bytes):
+        return response_text.decode("utf-8")
+    return response_text
+
+
+@functools.lru_cache(maxsize=None)
+def _list_adapter(klass: type) -> "TypeAdapter[List[Any]]":
+    """Validator for a whole ``List[klass]`` page, built once per model."""
+    return TypeAdapter(List[Optional[klass]])  # type: ignore[valid-type]
+
+
 class ApiClient:
     """Generic API client for OpenAPI client library builds.
 
@@ -76,6 +94,20 @@ class ApiClient:
         self.configuration = configuration
 
         self.rest_client = rest.RESTClientObject(configuration)
+        self.rate_limiter: Optional[RateLimiter] = None
+        if configuration.rate_limit_per_minute is not None:
+            self.rate_limiter = RateLimiter(
+                configuration.rate_limit_per_minute,
+                burst=configuration.rate_limit_burst,
+            )
+        self.retry_stats = RetryStats()
+        self.metrics = RequestMetrics()
+        # Called with the rejected Authorization header when a request gets
+        # 401; returning True resends it once with the configuration's auth.
+        self.on_unauthorized: Optional[Callable[[str], bool]] = None
+        # The event started by param_serialize, waiting for call_api on the
+        # same thread.
+        self._pending = threading.local()
         self.default_headers = {}
         if header_name is not None:
             self.default_headers[header_name] = header_value
@@ -88,7 +120,11 @@ class ApiClient:
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
-        pass
+        self.close()
+
+    def close(self) -> None:
+        """Close this client's pooled connections (not a shared pool's)."""
+        self.rest_client.close()
 
     @property
     def user_agent(self):
@@ -165,6 +201,8 @@ class ApiClient:
             body, post_params, files)
         """
 
+        started = time.perf_counter()
+        event = RequestEvent(method, "{0} {1}".format(method, resource_path))
         config = self.configuration
 
         # header parameters
@@ -224,8 +262,30 @@ class ApiClient:
             url_query = self.parameters_to_url_query(query_params, collection_formats)
             url += "?" + url_query
 
+        event.serialize_seconds = time.perf_counter() - started
+        self._pending.event = event
         return method, url, header_params, body, post_params
 
+    def begin_request(self, method: str, url: str) -> RequestEvent:
+        """Take the event ``param_serialize`` started on this thread.
+
+        Must be called before anything else runs on the thread, which for an
+        event loop means before the first ``await``.  Requests that did not
+        go through ``param_serialize`` get a fresh event.
+        """
+        event = getattr(self._pending, "event", None)
+        self._pending.event = None
+        if event is None or event.method != method:
+            event = RequestEvent(method, "{0} {1}".format(method, url.split("?")[0]))
+        event.url = url
+        event.sent_at = time.perf_counter()
+        return event
+
+    def end_request(self, event: RequestEvent) -> None:
+        """Record a finished event and pass it to the configured hooks."""
+        self.metrics.record(event)
+        run_hooks(self.configuration.request_hooks, event)
+
     def call_api(
         self,
         method,
@@ -247,22 +307,83 @@ class ApiClient:
         :return: RESTResponse
         """
 
-        try:
-            # perform request and return response
-            response_data = self.rest_client.request(
+        retry_policy = self.configuration.retry_policy
+        event = self.begin_request(method, url)
+        attempt = 0
+        reauthorized = False
+        while True:
+            if self.rate_limiter is not None:
+                waited = time.perf_counter()
+                self.rate_limiter.acquire()
+                event.rate_limit_seconds += time.perf_counter() - waited
+
+            event.attempts += 1
+            try:
+                # perform request and return response
+                response_data = self.rest_client.request(
+                    method,
+                    url,
+                    headers=header_params,
+                    body=body,
+                    post_params=post_params,
+                    _request_timeout=_request_timeout,
+                )
+
+            except Exception as e:
+                event.error = e
+                event.network_seconds = event.elapsed_network()
+                self.end_request(event)
+                raise e
+
+            if response_data.status == 401 and not reauthorized:
+                reauthorized_headers = self._reauthorized_headers(header_params)
+                if reauthorized_headers is not None:
+                    response_data.response.drain_conn()
+                    header_params = reauthorized_headers
+                    reauthorized = True
+                    continue
+
+            if retry_policy is None or not retry_policy.should_retry(
+                method, response_data.status, attempt
+            ):
+                break
+
+            delay = retry_policy.backoff(
+                attempt, response_data.getheader("Retry-After")
+            )
+            # Return the connection to the pool before backing off.
+            response_data.response.drain_conn()
+            self.retry_stats.record(response_data.status, delay)
+            self.configuration.logger["package_logger"].info(
+                "%s %s returned %s; retrying in %.2fs (attempt %d of %d)",
                 method,
                 url,
-                headers=header_params,
-                body=body,
-                post_params=post_params,
-                _request_timeout=_request_timeout,
+                response_data.status,
+                delay,
+                attempt + 1,
+                retry_policy.max_retries,
             )
+            retry_policy.sleep(delay)
+            event.backoff_seconds += delay
+            attempt += 1
 
-        except ApiException as e:
-            raise e
-
+        # Finished by response_deserialize, once the body has been read.
+        response_data.request_event = event
         return response_data
 
+    def _reauthorized_headers(self, header_params) -> Optional[Dict[str, Any]]:
+        """Headers to resend a request the API rejected with 401, if any."""
+        rejected = (header_params or {}).get("Authorization")
+        if rejected is None or self.on_unauthorized is None:
+            return None
+        if not self.on_unauthorized(rejected):
+            return None
+        headers = dict(header_params)
+        for auth_setting in self.configuration.auth_settings().values():
+            if auth_setting["in"] == "header":
+                headers[auth_setting["key"]] = auth_setting["value"]
+        return headers
+
     def response_deserialize(
         self,
         response_data: rest.RESTResponse,
@@ -273,20 +394,33 @@ class ApiClient:
         :param response_types_map: dict of response types.
         :return: ApiResponse
         """
+        event = response_data.request_event
+        if event is None:
+            return self._response_deserialize(response_data, response_types_map)
+        response_data.request_event = None
+
+        started = time.perf_counter()
+        event.network_seconds = event.elapsed_network(started)
+        event.status = response_data.status
+        event.response_bytes = len(response_data.data or b"")
+        try:
+            return self._response_deserialize(response_data, response_types_map)
+        except Exception as e:
+            event.error = e
+            raise
+        finally:
+            event.deserialize_seconds = time.perf_counter() - started
+            self.end_request(event)
 
+    def _response_deserialize(
+        self,
+        response_data: rest.RESTResponse,
+        response_types_map: Optional[Dict[str, ApiResponseT]] = None,
+    ) -> ApiResponse[ApiResponseT]:
         msg = "RESTResponse.read() must be called before passing it to response_deserialize()"
         assert response_data.data is not None, msg
 
-        response_type = response_types_map.get(str(response_data.status), None)
-        if (
-            not response_type
-            and isinstance(response_data.status, int)
-            and 100 <= response_data.status <= 599
-        ):
-            # if not found, look for '1XX', '2XX', etc.
-            response_type = response_types_map.get(
-                str(response_data.status)[0] + "XX", None
-            )
+        response_type = self._response_type(response_data, response_types_map)
 
         # deserialize response data
         response_text = None
@@ -302,10 +436,20 @@ class ApiClient:
                 if content_type is not None:
                     match = re.search(r"charset=([a-zA-Z\-\d]+)[\s;]?", content_type)
                 encoding = match.group(1) if match else "utf-8"
-                response_text = response_data.data.decode(encoding)
-                return_data = self.deserialize(
-                    response_text, response_type, content_type
-                )
+                if 200 <= response_data.status <= 299 and encoding.lower() in (
+                    "utf-8",
+                    "utf8",
+                ):
+                    # The JSON codec parses UTF-8 bytes directly; skip the
+                    # intermediate str for successful responses.
+                    return_data = self.deserialize(
+                        response_data.data, response_type, content_type
+                    )
+                else:
+                    response_text = response_data.data.decode(encoding)
+                    return_data = self.deserialize(
+                        response_text, response_type, content_type
+                    )
         finally:
             if not 200 <= response_data.status <= 299:
                 raise ApiException.from_response(
@@ -321,6 +465,120 @@ class ApiClient:
             raw_data=response_data.data,
         )
 
+    @staticmethod
+    def _response_type(
+        response_data: rest.RESTResponse,
+        response_types_map: Dict[str, ApiResponseT],
+    ) -> Optional[ApiResponseT]:
+        response_type = response_types_map.get(str(response_data.status), None)
+        if (
+            not response_type
+            and isinstance(response_data.status, int)
+            and 100 <= response_data.status <= 599
+        ):
+            # if not found, look for '1XX', '2XX', etc.
+            response_type = response_types_map.get(
+                str(response_data.status)[0] + "XX", None
+            )
+        return response_type
+
+    def iter_response_items(
+        self,
+        response_data: rest.RESTResponse,
+        response_types_map: Dict[str, Optional[str]],
+        chunk_size: int = 64 * 1024,
+    ) -> Iterator[Any]:
+        """Deserializes a ``List[...]`` response one element at a time.
+
+        Call this instead of ``response_data.read()``.  The body is parsed
+        from the connection as it arrives with
+        :func:`~openapi_client.json_codec.iter_json_array`, and each element
+        is deserialized once it is complete, so the page is never in memory
+        whole.  Responses that cannot be streamed (error statuses, other
+        response types, charsets other than UTF-8) are read and deserialized
+        as usual, which raises :class:`ApiException` for errors.
+
+        The connection returns to the pool once the items are exhausted.
+        Closing the iterator early closes the connection instead, since the
+        rest of the body is never read.
+
+        :param response_data: RESTResponse from :meth:`call_api`, unread.
+        :param response_types_map: dict of response types.
+        :param chunk_size: bytes read from the connection at a time.
+        :return: iterator of deserialized elements.
+        """
+        response_type = self._response_type(response_data, response_types_map)
+        content_type = response_data.getheader("content-type") or "application/json"
+        list_type = re.match(r"List\[(.*)]", response_type or "")
+        if (
+            not 200 <= response_data.status <= 299
+            or list_type is None
+            or not re.match(
+                r"^application/json\s*(;\s*charset=utf-?8\s*)?$",
+                content_type,
+                re.IGNORECASE,
+            )
+        ):
+            response_data.read()
+            data = self.response_deserialize(response_data, response_types_map).data
+            return iter(data or ())
+
+        sub_kls = list_type.group(1)
+        model = getattr(openapi_client.models, sub_kls, None)
+        if isinstance(model, type) and issubclass(model, BaseModel):
+            model_class = model
+
+            def convert(item: Any) -> Any:
+                return self.__deserialize_model_list([item], model_class)[0]
+
+        else:
+
+            def convert(item: Any) -> Any:
+                return self.__deserialize(item, sub_kls)
+
+        event = response_data.request_event
+        response_data.request_event = None
+        if event is not None:
+            event.network_seconds = event.elapsed_network()
+            event.status = response_data.status
+        return self.__stream_items(response_data, convert, event, chunk_size)
+
+    def __stream_items(
+        self,
+        response_data: rest.RESTResponse,
+        convert: Callable[[Any], Any],
+        event: Optional[RequestEvent],
+        chunk_size: int,
+    ) -> Iterator[Any]:
+        http_resp = response_data.response
+        started = time.perf_counter()
+        received = 0
+        finished = False
+
+        def chunks() -> Iterator[bytes]:
+            nonlocal received
+            for chunk in http_resp.stream(chunk_size):
+                received += len(chunk)
+                yield chunk
+
+        try:
+            for item in iter_json_array(chunks()):
+                yield convert(item)
+            finished = True
+        except Exception as e:
+            if event is not None:
+                event.error = e
+            raise
+        finally:
+            if not finished:
+                http_resp.close()
+            http_resp.release_conn()
+            if event is not None:
+                # Reading and parsing interleave, so both count here.
+                event.response_bytes = received
+                event.deserialize_seconds = time.perf_counter() - started
+                self.end_request(event)
+
     def sanitize_for_serialization(self, obj):
         """Builds a JSON POST object.
 
@@ -372,11 +630,14 @@ class ApiClient:
         }
 
     def deserialize(
-        self, response_text: str, response_type: str, content_type: Optional[str]
+        self,
+        response_text: Union[str, bytes],
+        response_type: str,
+        content_type: Optional[str],
     ):
         """Deserializes response into an object.
 
-        :param response: RESTResponse object to be deserialized.
+        :param response_text: response body, as text or UTF-8 bytes.
         :param response_type: class literal for
             deserialized object, or string of class name.
         :param content_type: content type of response.
@@ -384,23 +645,24 @@ class ApiClient:
         :return: deserialized object.
         """
 
+        json_codec = self.configuration.json_codec
         # fetch data from response object
         if content_type is None:
             try:
-                data = json.loads(response_text)
+                data = json_codec.loads(response_text)
             except ValueError:
-                data = response_text
+                data = _as_text(response_text)
         elif re.match(
             r"^application/(json|[\w!#$&.+-^_]+\+json)\s*(;|$)",
             content_type,
             re.IGNORECASE,
         ):
-            if response_text == "":
+            if not response_text:
                 data = ""
             else:
-                data = json.loads(response_text)
+                data = json_codec.loads(response_text)
         elif re.match(r"^text\/[a-z.+-]+\s*(;|$)", content_type, re.IGNORECASE):
-            data = response_text
+            data = _as_text(response_text)
         else:
             raise ApiException(
                 status=0, reason="Unsupported content type: {0}".format(content_type)
@@ -424,6 +686,9 @@ class ApiClient:
                 m = re.match(r"List\[(.*)]", klass)
                 assert m is not None, "Malformed List type definition"
                 sub_kls = m.group(1)
+                model = getattr(openapi_client.models, sub_kls, None)
+                if isinstance(model, type) and issubclass(model, BaseModel):
+                    return self.__deserialize_model_list(data, model)
                 return [self.__deserialize(sub_data, sub_kls) for sub_data in data]
 
             if klass.startswith("Dict["):
@@ -698,6 +963,8 @@ class ApiClient:
         :return: date.
         """
         try:
+            from dateutil.parser import parse
+
             return parse(string).date()
         except ImportError:
             return string
@@ -715,6 +982,8 @@ class ApiClient:
         :return: datetime.
         """
         try:
+            from dateutil.parser import parse
+
             return parse(string)
         except ImportError:
             return string
@@ -747,3 +1016,22 @@ class ApiClient:
         """
 
         return klass.from_dict(data)
+
+    def __deserialize_model_list(self, data, klass):
+        """Deserializes a list of dicts to models in a single validation pass.
+
+        Equivalent to calling ``klass.from_dict`` on every element, without
+        building an intermediate dict per record.
+
+        :param data: list.
+        :param klass: model class.
+        :return: list of model objects.
+        """
+        items = _list_adapter(klass).validate_python(data)
+        # ``from_dict`` passes every property explicitly, so every field
+        # counts as set; keep ``exclude_unset`` dumps identical.
+        fields = frozenset(klass.model_fields)
+        for item in items:
+            if item is not None:
+                object.__setattr__(item, "__pydantic_fields_set__", set(fields))
+        return items
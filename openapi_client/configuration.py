@@ -24,6 +24,10 @@ from typing import Any, ClassVar, Dict, List, Literal, Optional, TypedDict, Unio
 import urllib3
 from typing_extensions import NotRequired, Self
 
+from openapi_client.instrumentation import RequestHook
+from openapi_client.json_codec import JsonCodec, get_json_codec
+from openapi_client.retry import RetryPolicy
+
 JSON_SCHEMA_VALIDATION_KEYWORDS = {
     "multipleOf",
     "maximum",
@@ -308,6 +312,34 @@ class Configuration:
         self.retries = retries
         """Adding retries to override urllib3 default value 3
         """
+        self.rate_limit_per_minute: Optional[float] = 100
+        """Client-side request rate limit shared by every call made through
+           one ApiClient. The API allows 100 requests per minute per client.
+           Set to None to disable pacing.
+        """
+        self.rate_limit_burst = 1
+        """Number of requests that may start back to back before pacing
+           applies.
+        """
+        self.retry_policy: Optional[RetryPolicy] = RetryPolicy()
+        """Retries idempotent requests (GET, PUT, DELETE) answered with 429
+           or 5xx, with jittered exponential backoff honoring Retry-After.
+           POST is never retried. Set to None to disable.
+        """
+        self.json_codec: JsonCodec = get_json_codec()
+        """JSON backend for request and response bodies. Defaults to the
+           fastest available (orjson, then pydantic-core, then the standard
+           library); see ``openapi_client.json_codec.get_json_codec``.
+        """
+        self.request_hooks: List[RequestHook] = []
+        """Callables receiving a ``RequestEvent`` (timings, status, response
+           size) after every operation; see ``openapi_client.instrumentation``.
+        """
+        self.pool_manager: Optional[urllib3.PoolManager] = None
+        """A urllib3 pool manager to send requests through instead of one
+           built from the settings above, so several clients can share
+           connections; see ``openapi_client.transport.Transport``.
+        """
         # Enable client side validation
         self.client_side_validation = True
 
@@ -328,8 +360,10 @@ class Configuration:
         result = cls.__new__(cls)
         memo[id(self)] = result
         for k, v in self.__dict__.items():
-            if k not in ("logger", "logger_file_handler"):
+            if k not in ("logger", "logger_file_handler", "pool_manager"):
                 setattr(result, k, copy.deepcopy(v, memo))
+        # the pool manager is shared, not copied
+        result.pool_manager = self.pool_manager
         # shallow copy of loggers
         result.logger = copy.copy(self.logger)
         # use setters to configure loggers
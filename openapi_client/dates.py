@@ -0,0 +1,56 @@
+# coding: utf-8
+
+"""Shared date parsing for the hand-modified response models.
+
+The API sends dates as ``MM-dd-yyyy`` (occasionally ISO ``yyyy-MM-dd``).  A
+work record carries eight date fields and the same few thousand distinct
+dates repeat across a full dump, so :func:`parse_api_date` memoizes its
+results in a bounded cache and parses the fixed-width formats without
+``strptime``.
+"""
+
+import functools
+from datetime import date, datetime
+from typing import Optional
+
+DATE_FORMATS = ("%m-%d-%Y", "%Y-%m-%d")
+"""Accepted formats, in the order they are tried."""
+
+_CACHE_SIZE = 4096
+
+
+def _fixed_width(value: str) -> Optional[date]:
+    """Parse zero-padded ``MM-dd-yyyy`` or ``yyyy-MM-dd`` by slicing."""
+    if len(value) != 10 or not value.isascii():
+        return None
+    if value[2] == "-" and value[5] == "-":
+        month, day, year = value[0:2], value[3:5], value[6:10]
+    elif value[4] == "-" and value[7] == "-":
+        year, month, day = value[0:4], value[5:7], value[8:10]
+    else:
+        return None
+    if not (year.isdigit() and month.isdigit() and day.isdigit()):
+        return None
+    try:
+        return date(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def parse_api_date(value: str) -> Optional[date]:
+    """Parse an API date string, or return None if no format matches.
+
+    Equivalent to trying ``datetime.strptime`` with each of
+    :data:`DATE_FORMATS` in turn.
+    """
+    parsed = _fixed_width(value)
+    if parsed is not None:
+        return parsed
+    # strptime also accepts unpadded fields such as "3-1-2025".
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            continue
+    return None
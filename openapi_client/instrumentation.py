@@ -0,0 +1,287 @@
+# coding: utf-8
+
+"""Per-request timings and metrics for ApiClient.
+
+Every request made through ``ApiClient`` produces a :class:`RequestEvent`
+that splits its wall time into phases:
+
+* ``serialize_seconds`` -- building the request (``param_serialize``);
+* ``rate_limit_seconds`` -- waiting for the client-side rate limiter;
+* ``network_seconds`` -- sending the request and reading the response,
+  across every attempt;
+* ``backoff_seconds`` -- sleeping between retries;
+* ``deserialize_seconds`` -- turning the response into models.
+
+Finished events are added to ``ApiClient.metrics`` (a :class:`RequestMetrics`
+with per-operation latency histograms) and passed to every callable in
+``Configuration.request_hooks``.  Hooks run on the thread that made the
+request and should be quick; exceptions they raise are logged and ignored.
+"""
+
+import bisect
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+"""Upper bounds, in seconds, of the latency histogram buckets."""
+
+PHASES = ("serialize", "rate_limit", "network", "backoff", "deserialize")
+
+
+class RequestEvent:
+    """Timings and outcome of one API operation, including its retries.
+
+    :param method: HTTP method.
+    :param operation: Method and path template, e.g. ``GET /works/{metquayId}``.
+    """
+
+    def __init__(self, method: str, operation: str) -> None:
+        self.method = method
+        """HTTP method."""
+        self.operation = operation
+        """Method and path template; stable across calls, unlike ``url``."""
+        self.url: Optional[str] = None
+        """Full request URL, including the query string."""
+        self.status: Optional[int] = None
+        """HTTP status of the final attempt; None if no response arrived."""
+        self.attempts = 0
+        """Requests sent, counting retries."""
+        self.response_bytes = 0
+        """Size of the final response body."""
+        self.error: Optional[BaseException] = None
+        """Exception the operation raised, if any."""
+        self.started_at = time.time()
+        """Wall-clock start (``time.time()``), for adapters that need
+        absolute timestamps such as tracing spans."""
+        self.serialize_seconds = 0.0
+        self.rate_limit_seconds = 0.0
+        self.network_seconds = 0.0
+        self.backoff_seconds = 0.0
+        self.deserialize_seconds = 0.0
+        self.sent_at: Optional[float] = None
+        """``time.perf_counter()`` when the request was handed to the
+        transport; used to derive ``network_seconds``."""
+
+    def elapsed_network(self, now: Optional[float] = None) -> float:
+        """Seconds since ``sent_at``, less rate-limit waits and backoff."""
+        if self.sent_at is None:
+            return 0.0
+        if now is None:
+            now = time.perf_counter()
+        elapsed = now - self.sent_at - self.rate_limit_seconds - self.backoff_seconds
+        return max(0.0, elapsed)
+
+    @property
+    def duration(self) -> float:
+        """Total seconds across all phases."""
+        return (
+            self.serialize_seconds
+            + self.rate_limit_seconds
+            + self.network_seconds
+            + self.backoff_seconds
+            + self.deserialize_seconds
+        )
+
+    @property
+    def retries(self) -> int:
+        return max(0, self.attempts - 1)
+
+    def phases(self) -> Dict[str, float]:
+        """Seconds spent in each phase, keyed by phase name."""
+        return {name: getattr(self, name + "_seconds") for name in PHASES}
+
+    def __repr__(self) -> str:
+        return "RequestEvent({0!r}, status={1}, duration={2:.4f}s)".format(
+            self.operation, self.status, self.duration
+        )
+
+
+RequestHook = Callable[[RequestEvent], None]
+"""Called with every finished :class:`RequestEvent`."""
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram of durations, in seconds.
+
+    Not thread-safe on its own; :class:`RequestMetrics` guards it.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        """Observations per bucket; the last one counts values above every
+        bound."""
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Estimate the ``q``-th percentile (0-100) as its bucket's upper bound.
+
+        The estimate is capped at the largest value observed, so it is exact
+        for the overflow bucket and never exceeds ``max``.
+        """
+        if not 0 <= q <= 100:
+            raise ValueError("q must be between 0 and 100")
+        if not self.count or self.max is None:
+            return 0.0
+        rank = q / 100.0 * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                if index < len(self.buckets):
+                    return min(self.buckets[index], self.max)
+                break
+        return self.max
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "min": self.min or 0.0,
+            "max": self.max or 0.0,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+            "buckets": dict(zip(list(self.buckets) + [float("inf")], self.counts)),
+        }
+
+
+class OperationMetrics:
+    """Aggregates for one operation (see :attr:`RequestEvent.operation`)."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.requests = 0
+        """Operations completed, successful or not."""
+        self.errors = 0
+        """Operations that raised."""
+        self.retries = 0
+        self.response_bytes = 0
+        self.by_status: Dict[int, int] = {}
+        self.latency = LatencyHistogram(buckets)
+        """Total duration per operation."""
+        self.phases = {name: LatencyHistogram(buckets) for name in PHASES}
+        """Duration of each phase per operation."""
+
+    def record(self, event: RequestEvent) -> None:
+        self.requests += 1
+        self.retries += event.retries
+        self.response_bytes += event.response_bytes
+        if event.error is not None:
+            self.errors += 1
+        if event.status is not None:
+            self.by_status[event.status] = self.by_status.get(event.status, 0) + 1
+        self.latency.observe(event.duration)
+        for name, seconds in event.phases().items():
+            self.phases[name].observe(seconds)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "response_bytes": self.response_bytes,
+            "by_status": dict(self.by_status),
+            "latency": self.latency.as_dict(),
+            "phases": {name: h.as_dict() for name, h in self.phases.items()},
+        }
+
+
+class RequestMetrics:
+    """Thread-safe in-process summary of the requests made by one ApiClient."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self._lock = threading.Lock()
+        self._buckets = tuple(buckets)
+        self.operations: Dict[str, OperationMetrics] = {}
+        """Aggregates keyed by operation (method and path template)."""
+
+    def record(self, event: RequestEvent) -> None:
+        with self._lock:
+            metrics = self.operations.get(event.operation)
+            if metrics is None:
+                metrics = self.operations[event.operation] = OperationMetrics(
+                    self._buckets
+                )
+            metrics.record(event)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.operations = {}
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """A JSON-serializable snapshot, keyed by operation."""
+        with self._lock:
+            return {name: m.as_dict() for name, m in self.operations.items()}
+
+    def format(self) -> str:
+        """A plain-text table: one line per operation, times in milliseconds."""
+        header = "{0:<36} {1:>7} {2:>5} {3:>8} {4:>8} {5:>9} {6:>9} {7:>9}".format(
+            "operation", "count", "err", "p50", "p95", "serialize", "network", "deser."
+        )
+        lines: List[str] = [header]
+        for name, stats in sorted(self.summary().items()):
+            phases = stats["phases"]
+            lines.append(
+                "{0:<36} {1:>7} {2:>5} {3:>8.2f} {4:>8.2f} {5:>9.2f} {6:>9.2f} "
+                "{7:>9.2f}".format(
+                    name,
+                    stats["requests"],
+                    stats["errors"],
+                    stats["latency"]["p50"] * 1000,
+                    stats["latency"]["p95"] * 1000,
+                    phases["serialize"]["mean"] * 1000,
+                    phases["network"]["mean"] * 1000,
+                    phases["deserialize"]["mean"] * 1000,
+                )
+            )
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        with self._lock:
+            total = sum(m.requests for m in self.operations.values())
+        return "RequestMetrics(operations={0}, requests={1})".format(
+            len(self.operations), total
+        )
+
+
+def run_hooks(hooks: Sequence[RequestHook], event: RequestEvent) -> None:
+    """Call each hook with ``event``, logging (not raising) their errors."""
+    for hook in hooks:
+        try:
+            hook(event)
+        except Exception:
+            logger.exception("Request hook %r failed for %r", hook, event)
@@ -0,0 +1,216 @@
+# coding: utf-8
+
+"""Pluggable JSON encoding and decoding for request and response bodies.
+
+Parsing list responses is the largest CPU cost of a full dump, so the client
+uses the fastest JSON backend available.  Every codec's ``loads`` accepts
+the raw response ``bytes`` as well as ``str``, so responses are parsed
+without first being decoded to text.
+
+* ``"orjson"`` -- the optional ``orjson`` package (``pip install orjson``).
+* ``"pydantic"`` -- pydantic-core's Rust parser, always present alongside
+  pydantic >= 2.5.
+* ``"json"`` -- the standard library.
+
+``get_json_codec("auto")`` picks the first available in that order.
+
+:func:`iter_json_array` parses a list body element by element as its bytes
+arrive, so a page never has to be held in memory whole.
+"""
+
+import codecs
+import json
+import re
+from typing import Any, Iterable, Iterator, Union
+
+JsonInput = Union[str, bytes, bytearray]
+
+
+class JsonCodec:
+    """Standard library codec; also the interface other codecs implement."""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> str:
+        """Serialize ``obj`` (already sanitized to JSON types) to a string."""
+        return json.dumps(obj)
+
+    def loads(self, data: JsonInput) -> Any:
+        """Parse a JSON document from ``str`` or UTF-8 ``bytes``.
+
+        :raises ValueError: if ``data`` is not valid JSON.
+        """
+        return json.loads(data)
+
+    def __repr__(self) -> str:
+        return "{0}()".format(type(self).__name__)
+
+
+class OrjsonCodec(JsonCodec):
+    """Codec backed by the optional ``orjson`` package."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+
+    def dumps(self, obj: Any) -> str:
+        return self._dumps(obj).decode("utf-8")
+
+    def loads(self, data: JsonInput) -> Any:
+        return self._loads(data)
+
+
+class PydanticJsonCodec(JsonCodec):
+    """Codec backed by pydantic-core's ``from_json`` / ``to_json``."""
+
+    name = "pydantic"
+
+    def __init__(self) -> None:
+        import pydantic_core
+
+        self._from_json = pydantic_core.from_json
+        self._to_json = pydantic_core.to_json
+
+    def dumps(self, obj: Any) -> str:
+        return self._to_json(obj).decode("utf-8")
+
+    def loads(self, data: JsonInput) -> Any:
+        return self._from_json(data)
+
+
+_CODECS = {
+    "orjson": OrjsonCodec,
+    "pydantic": PydanticJsonCodec,
+    "json": JsonCodec,
+}
+
+
+def get_json_codec(name: str = "auto") -> JsonCodec:
+    """Return a codec by name, or the fastest available one for ``"auto"``.
+
+    :raises ValueError: if ``name`` is not a known codec.
+    :raises ImportError: if the named codec's backend is not installed.
+    """
+    if name != "auto":
+        if name not in _CODECS:
+            raise ValueError(
+                "Unknown JSON codec {0!r}; expected one of {1}".format(
+                    name, ", ".join(["auto"] + list(_CODECS))
+                )
+            )
+        return _CODECS[name]()
+    for codec_class in _CODECS.values():
+        try:
+            return codec_class()
+        except ImportError:
+            continue
+    return JsonCodec()
+
+
+# -- Incremental parsing -------------------------------------------------
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER_TAIL = re.compile(r"[0-9eE.+-]*")
+_DECODER = json.JSONDecoder()
+
+
+def _skip(pattern: "re.Pattern[str]", text: str, pos: int) -> int:
+    """Position after the run of ``pattern`` starting at ``pos``."""
+    match = pattern.match(text, pos)
+    return pos if match is None else match.end()
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """Yield the elements of a JSON array from its UTF-8 body in pieces.
+
+    Only the unparsed tail of the body and the current element are held in
+    memory.  A ``null`` body yields nothing, as list endpoints may send it
+    for no results.  Elements are parsed with the standard library, since
+    none of the faster codecs can parse part of a document.
+
+    :param chunks: The body, split anywhere (e.g. ``HTTPResponse.stream()``).
+    :raises ValueError: if the body is not a UTF-8 JSON array; elements
+        before the error have already been yielded.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    pieces = iter(chunks)
+    buf = ""
+    pos = 0
+    eof = False
+
+    def fill() -> bool:
+        """Append the next piece of text, dropping what has been parsed."""
+        nonlocal buf, pos, eof
+        while not eof:
+            piece = next(pieces, None)
+            if piece is None:
+                eof = True
+                text = decoder.decode(b"", final=True)
+            else:
+                text = decoder.decode(piece)
+            if text:
+                buf = buf[pos:] + text
+                pos = 0
+                return True
+        return False
+
+    def skip_whitespace() -> bool:
+        """Move to the next significant character; False at the end."""
+        nonlocal pos
+        while True:
+            pos = _skip(_WHITESPACE, buf, pos)
+            if pos < len(buf):
+                return True
+            if not fill():
+                return False
+
+    def value() -> Any:
+        nonlocal pos
+        while True:
+            try:
+                result, end = _DECODER.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if fill():
+                    continue
+                raise
+            # A number followed only by number characters may continue in
+            # the next piece (``12`` then ``3``, ``1`` then ``e5``); parse it
+            # again once more text has arrived.
+            if (
+                isinstance(result, (int, float))
+                and _skip(_NUMBER_TAIL, buf, end) == len(buf)
+                and fill()
+            ):
+                continue
+            pos = end
+            return result
+
+    if not skip_whitespace():
+        raise json.JSONDecodeError("Expecting value", buf, pos)
+    if buf[pos] == "[":
+        pos += 1
+        if not skip_whitespace():
+            raise json.JSONDecodeError("Unterminated array", buf, pos)
+        if buf[pos] == "]":
+            pos += 1
+        else:
+            while True:
+                yield value()
+                if not skip_whitespace():
+                    raise json.JSONDecodeError("Unterminated array", buf, pos)
+                if buf[pos] == "]":
+                    pos += 1
+                    break
+                if buf[pos] != ",":
+                    raise json.JSONDecodeError("Expecting ',' delimiter", buf, pos)
+                pos += 1
+                if not skip_whitespace():
+                    raise json.JSONDecodeError("Expecting value", buf, pos)
+    elif value() is not None:
+        raise json.JSONDecodeError("Expecting '['", buf, 0)
+    if skip_whitespace():
+        raise json.JSONDecodeError("Extra data", buf, pos)
@@ -13,17 +13,39 @@ Generated by OpenAPI Generator (https://openapi-generator.tech)
 Do not edit the class manually.
 """  # noqa: E501
 
-# import models into model package
-from openapi_client.models.authentication_request import AuthenticationRequest
-from openapi_client.models.authentication_response import AuthenticationResponse
-from openapi_client.models.created_response import CreatedResponse
-from openapi_client.models.customer_instrument_request import CustomerInstrumentRequest
-from openapi_client.models.customer_instrument_response import (
-    CustomerInstrumentResponse,
-)
-from openapi_client.models.customer_request import CustomerRequest
-from openapi_client.models.customer_response import CustomerResponse
-from openapi_client.models.error_response import ErrorResponse
-from openapi_client.models.instrument_category_request import InstrumentCategoryRequest
-from openapi_client.models.work_request import WorkRequest
-from openapi_client.models.work_response import WorkResponse
+from typing import TYPE_CHECKING
+
+from openapi_client._lazy import attach
+
+# Public name -> defining module; loaded on first access (see _lazy).
+_EXPORTS = {
+    "AuthenticationRequest": "openapi_client.models.authentication_request",
+    "AuthenticationResponse": "openapi_client.models.authentication_response",
+    "CreatedResponse": "openapi_client.models.created_response",
+    "CustomerInstrumentRequest": "openapi_client.models.customer_instrument_request",
+    "CustomerInstrumentResponse": "openapi_client.models.customer_instrument_response",
+    "CustomerRequest": "openapi_client.models.customer_request",
+    "CustomerResponse": "openapi_client.models.customer_response",
+    "ErrorResponse": "openapi_client.models.error_response",
+    "InstrumentCategoryRequest": "openapi_client.models.instrument_category_request",
+    "WorkRequest": "openapi_client.models.work_request",
+    "WorkResponse": "openapi_client.models.work_response",
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
+
+if TYPE_CHECKING:
+    # import models into model package
+    from openapi_client.models.authentication_request import AuthenticationRequest
+    from openapi_client.models.authentication_response import AuthenticationResponse
+    from openapi_client.models.created_response import CreatedResponse
+    from openapi_client.models.customer_instrument_request import CustomerInstrumentRequest
+    from openapi_client.models.customer_instrument_response import (
+        CustomerInstrumentResponse,
+    )
+    from openapi_client.models.customer_request import CustomerRequest
+    from openapi_client.models.customer_response import CustomerResponse
+    from openapi_client.models.error_response import ErrorResponse
+    from openapi_client.models.instrument_category_request import InstrumentCategoryRequest
+    from openapi_client.models.work_request import WorkRequest
+    from openapi_client.models.work_response import WorkResponse
@@ -18,7 +18,7 @@ from __future__ import annotations
 import json
 import pprint
 import re  # noqa: F401
-from datetime import date, datetime
+from datetime import date
 from typing import Any, ClassVar, Dict, List, Optional, Set
 
 from pydantic import (
@@ -32,6 +32,8 @@ from pydantic import (
 )
 from typing_extensions import Self
 
+from openapi_client.dates import parse_api_date
+
 
 class WorkResponse(BaseModel):
     """
@@ -255,14 +257,10 @@ class WorkResponse(BaseModel):
     @classmethod
     def _parse_date(cls, value):
         """Parse MM-dd-yyyy date strings from the API."""
-        if value is None or isinstance(value, date):
-            return value
         if isinstance(value, str):
-            for fmt in ("%m-%d-%Y", "%Y-%m-%d"):
-                try:
-                    return datetime.strptime(value, fmt).date()
-                except ValueError:
-                    continue
+            parsed = parse_api_date(value)
+            if parsed is not None:
+                return parsed
         return value
 
     model_config = ConfigDict(
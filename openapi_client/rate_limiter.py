@@ -0,0 +1,87 @@
+# coding: utf-8
+
+"""Client-side request pacing for the Metquay API.
+
+The API allows 100 requests per minute per client and answers anything beyond
+that with ``429 Too Many Requests``.  :class:`RateLimiter` is a thread-safe
+token bucket that :class:`~openapi_client.api_client.ApiClient` consults
+before every request, so all calls made through one client share one budget.
+"""
+
+import threading
+import time
+from typing import Callable
+
+
+class RateLimiter:
+    """Thread-safe token bucket.
+
+    Tokens refill continuously at ``rate_per_minute / 60`` per second up to
+    ``burst``.  Each request takes one token; when the bucket is empty the
+    caller waits for the next one.  Reservations are handed out in call
+    order, so waiting callers are served first come, first served.
+
+    :param rate_per_minute: Sustained request rate.
+    :param burst: Maximum number of requests that may start back to back
+        after an idle period.
+    """
+
+    def __init__(
+        self,
+        rate_per_minute: float,
+        burst: int = 1,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate_per_minute <= 0:
+            raise ValueError("rate_per_minute must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.rate_per_minute = rate_per_minute
+        self.burst = burst
+        self._rate = rate_per_minute / 60.0
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated = clock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self._rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Take a token and return how many seconds to wait before using it.
+
+        Never blocks, which makes it usable from event loops
+        (``await asyncio.sleep(limiter.reserve())``).
+        """
+        with self._lock:
+            self._refill(self._clock())
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self._rate
+
+    def acquire(self) -> float:
+        """Block until a request may start; return the time spent waiting."""
+        delay = self.reserve()
+        if delay > 0:
+            self._sleep(delay)
+        return delay
+
+    @property
+    def wait_time(self) -> float:
+        """Seconds a request issued now would have to wait for a token."""
+        with self._lock:
+            self._refill(self._clock())
+            if self._tokens >= 1.0:
+                return 0.0
+            return (1.0 - self._tokens) / self._rate
+
+    def __repr__(self) -> str:
+        return "RateLimiter(rate_per_minute={0!r}, burst={1!r})".format(
+            self.rate_per_minute, self.burst
+        )
@@ -14,13 +14,14 @@ Do not edit the class manually.
 
 
 import io
-import json
 import re
 import ssl
+from typing import Optional
 
 import urllib3
 
 from openapi_client.exceptions import ApiException, ApiValueError
+from openapi_client.instrumentation import RequestEvent
 
 SUPPORTED_SOCKS_PROXIES = {"socks5", "socks5h", "socks4", "socks4a"}
 RESTResponseType = urllib3.HTTPResponse
@@ -43,6 +44,8 @@ class RESTResponse(io.IOBase):
         self.status = resp.status
         self.reason = resp.reason
         self.data = None
+        # Set by ApiClient.call_api; see openapi_client.instrumentation.
+        self.request_event: Optional[RequestEvent] = None
 
     def read(self):
         if self.data is None:
@@ -63,58 +66,81 @@ class RESTResponse(io.IOBase):
         return self.response.headers.get(name, default)
 
 
-class RESTClientObject:
+def build_pool_manager(configuration, **pool_kw) -> urllib3.PoolManager:
+    """Build the urllib3 pool manager ``configuration`` describes.
 
-    def __init__(self, configuration) -> None:
-        # urllib3.PoolManager will pass all kw parameters to connectionpool
-        # https://github.com/shazow/urllib3/blob/f9409436f83aeb79fbaf090181cd81b784f1b8ce/urllib3/poolmanager.py#L75  # noqa: E501
-        # https://github.com/shazow/urllib3/blob/f9409436f83aeb79fbaf090181cd81b784f1b8ce/urllib3/connectionpool.py#L680  # noqa: E501
-        # Custom SSL certificates and client certificates: http://urllib3.readthedocs.io/en/latest/advanced-usage.html  # noqa: E501
-
-        # cert_reqs
-        if configuration.verify_ssl:
-            cert_reqs = ssl.CERT_REQUIRED
-        else:
-            cert_reqs = ssl.CERT_NONE
+    :param configuration: TLS, proxy and pool size settings.
+    :param pool_kw: Extra or overriding connection pool arguments, e.g.
+        ``block=True``.
+    """
+    # urllib3.PoolManager will pass all kw parameters to connectionpool
+    # https://github.com/shazow/urllib3/blob/f9409436f83aeb79fbaf090181cd81b784f1b8ce/urllib3/poolmanager.py#L75  # noqa: E501
+    # https://github.com/shazow/urllib3/blob/f9409436f83aeb79fbaf090181cd81b784f1b8ce/urllib3/connectionpool.py#L680  # noqa: E501
+    # Custom SSL certificates and client certificates: http://urllib3.readthedocs.io/en/latest/advanced-usage.html  # noqa: E501
 
-        pool_args = {
-            "cert_reqs": cert_reqs,
-            "ca_certs": configuration.ssl_ca_cert,
-            "cert_file": configuration.cert_file,
-            "key_file": configuration.key_file,
-            "ca_cert_data": configuration.ca_cert_data,
-        }
-        if configuration.assert_hostname is not None:
-            pool_args["assert_hostname"] = configuration.assert_hostname
+    # cert_reqs
+    if configuration.verify_ssl:
+        cert_reqs = ssl.CERT_REQUIRED
+    else:
+        cert_reqs = ssl.CERT_NONE
 
-        if configuration.retries is not None:
-            pool_args["retries"] = configuration.retries
+    pool_args = {
+        "cert_reqs": cert_reqs,
+        "ca_certs": configuration.ssl_ca_cert,
+        "cert_file": configuration.cert_file,
+        "key_file": configuration.key_file,
+        "ca_cert_data": configuration.ca_cert_data,
+    }
+    if configuration.assert_hostname is not None:
+        pool_args["assert_hostname"] = configuration.assert_hostname
 
-        if configuration.tls_server_name:
-            pool_args["server_hostname"] = configuration.tls_server_name
+    if configuration.retries is not None:
+        pool_args["retries"] = configuration.retries
 
-        if configuration.socket_options is not None:
-            pool_args["socket_options"] = configuration.socket_options
+    if configuration.tls_server_name:
+        pool_args["server_hostname"] = configuration.tls_server_name
 
-        if configuration.connection_pool_maxsize is not None:
-            pool_args["maxsize"] = configuration.connection_pool_maxsize
+    if configuration.socket_options is not None:
+        pool_args["socket_options"] = configuration.socket_options
 
-        # https pool manager
-        self.pool_manager: urllib3.PoolManager
+    if configuration.connection_pool_maxsize is not None:
+        pool_args["maxsize"] = configuration.connection_pool_maxsize
 
-        if configuration.proxy:
-            if is_socks_proxy_url(configuration.proxy):
-                from urllib3.contrib.socks import SOCKSProxyManager
+    pool_args.update(pool_kw)
 
-                pool_args["proxy_url"] = configuration.proxy
-                pool_args["headers"] = configuration.proxy_headers
-                self.pool_manager = SOCKSProxyManager(**pool_args)
-            else:
-                pool_args["proxy_url"] = configuration.proxy
-                pool_args["proxy_headers"] = configuration.proxy_headers
-                self.pool_manager = urllib3.ProxyManager(**pool_args)
+    # https pool manager
+    if configuration.proxy:
+        if is_socks_proxy_url(configuration.proxy):
+            from urllib3.contrib.socks import SOCKSProxyManager
+
+            pool_args["proxy_url"] = configuration.proxy
+            pool_args["headers"] = configuration.proxy_headers
+            return SOCKSProxyManager(**pool_args)
         else:
-            self.pool_manager = urllib3.PoolManager(**pool_args)
+            pool_args["proxy_url"] = configuration.proxy
+            pool_args["proxy_headers"] = configuration.proxy_headers
+            return urllib3.ProxyManager(**pool_args)
+    else:
+        return urllib3.PoolManager(**pool_args)
+
+
+class RESTClientObject:
+
+    def __init__(self, configuration) -> None:
+        self.json_codec = configuration.json_codec
+
+        # A pool manager from the configuration belongs to a shared
+        # Transport, which outlives this client; see
+        # openapi_client.transport.
+        self.pool_manager: urllib3.PoolManager = configuration.pool_manager
+        self._owns_pool_manager = self.pool_manager is None
+        if self.pool_manager is None:
+            self.pool_manager = build_pool_manager(configuration)
+
+    def close(self) -> None:
+        """Close pooled connections, unless the pool manager is shared."""
+        if self._owns_pool_manager:
+            self.pool_manager.clear()
 
     def request(
         self,
@@ -169,7 +195,7 @@ class RESTClientObject:
                 if not content_type or re.search("json", content_type, re.IGNORECASE):
                     request_body = None
                     if body is not None:
-                        request_body = json.dumps(body)
+                        request_body = self.json_codec.dumps(body)
                     r = self.pool_manager.request(
                         method,
                         url,
@@ -195,7 +221,7 @@ class RESTClientObject:
                     del headers["Content-Type"]
                     # Ensures that dict objects are serialized
                     post_params = [
-                        (a, json.dumps(b)) if isinstance(b, dict) else (a, b)
+                        (a, self.json_codec.dumps(b)) if isinstance(b, dict) else (a, b)
                         for a, b in post_params
                     ]
                     r = self.pool_manager.request(
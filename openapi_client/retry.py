@@ -0,0 +1,129 @@
+# coding: utf-8
+
+"""API-level retries for transient Metquay errors.
+
+urllib3 (``Configuration.retries``) only retries failed connections.  This
+module decides when a completed request that came back ``429`` or ``5xx``
+should be sent again.  Per the API spec, PUT and DELETE are idempotent and
+safe to retry; POST is not (a retried create may duplicate the resource), so
+POST is never retried.
+"""
+
+import datetime
+import email.utils
+import random
+import threading
+import time
+from typing import Callable, Dict, FrozenSet, Iterable, Optional
+
+DEFAULT_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header (delta-seconds or HTTP-date).
+
+    :return: seconds to wait, or None if the header is absent or invalid.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=datetime.timezone.utc)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return max(0.0, (when - now).total_seconds())
+
+
+class RetryPolicy:
+    """When and how long to back off before retrying a request.
+
+    Backoff uses "full jitter": attempt ``n`` (from 0) waits a random time
+    between 0 and ``min(max_backoff, backoff_factor * 2 ** n)`` seconds.  A
+    ``Retry-After`` header from the server raises the wait to at least the
+    time it asks for.
+
+    :param max_retries: Retries per request after the first attempt.
+    :param backoff_factor: Base of the exponential backoff, in seconds.
+    :param max_backoff: Upper bound on the jittered backoff, in seconds.
+    :param retry_statuses: HTTP statuses treated as transient.
+    :param retry_methods: HTTP methods that may be retried.  Must not include
+        POST unless the caller guarantees idempotency.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 5,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 60.0,
+        retry_statuses: Iterable[int] = DEFAULT_RETRY_STATUSES,
+        retry_methods: Iterable[str] = IDEMPOTENT_METHODS,
+        *,
+        random_fn: Callable[[], float] = random.random,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if max_retries < 0:
+            raise ValueError("max_retries must not be negative")
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.retry_statuses: FrozenSet[int] = frozenset(retry_statuses)
+        self.retry_methods: FrozenSet[str] = frozenset(
+            m.upper() for m in retry_methods
+        )
+        self.random_fn = random_fn
+        self.sleep = sleep
+
+    def should_retry(self, method: str, status: int, attempt: int) -> bool:
+        """Whether a response with ``status`` on try ``attempt`` is retried."""
+        return (
+            attempt < self.max_retries
+            and method.upper() in self.retry_methods
+            and status in self.retry_statuses
+        )
+
+    def backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Seconds to wait before retry number ``attempt + 1``."""
+        ceiling = min(self.max_backoff, self.backoff_factor * (2**attempt))
+        delay = self.random_fn() * ceiling
+        server_delay = parse_retry_after(retry_after)
+        if server_delay is not None:
+            delay = max(delay, server_delay)
+        return delay
+
+
+class RetryStats:
+    """Thread-safe counters for retries made by one ApiClient."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.retries = 0
+        """Number of requests re-sent after a transient error."""
+        self.backoff_seconds = 0.0
+        """Total time spent sleeping between attempts."""
+        self.by_status: Dict[int, int] = {}
+        """Retries broken down by the status that triggered them."""
+
+    def record(self, status: int, delay: float) -> None:
+        with self._lock:
+            self.retries += 1
+            self.backoff_seconds += delay
+            self.by_status[status] = self.by_status.get(status, 0) + 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self.retries = 0
+            self.backoff_seconds = 0.0
+            self.by_status = {}
+
+    def __repr__(self) -> str:
+        return "RetryStats(retries={0}, backoff_seconds={1:.3f}, by_status={2})".format(
+            self.retries, self.backoff_seconds, self.by_status
+        )
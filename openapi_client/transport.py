@@ -0,0 +1,160 @@
+# coding: utf-8
+
+"""Connection pools shared between API clients.
+
+Every ``ApiClient`` normally builds its own urllib3 pool manager.  An
+application with one client per workspace or credential then pays a TCP
+and TLS handshake per client, and has no limit on sockets overall.  A
+:class:`Transport` is built once and its pool manager handed to each
+client's configuration::
+
+    transport = Transport(max_connections=8)
+    configuration.pool_manager = transport.pool_manager
+
+Its pools block once ``max_connections`` connections to a host are in use,
+so extra requests wait for a free connection instead of opening more, and
+:attr:`Transport.stats` counts connections opened, reused and waited for.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import urllib3
+
+from openapi_client.configuration import Configuration
+from openapi_client.rest import build_pool_manager
+
+
+class PoolStats:
+    """Thread-safe counters for connection checkouts from one Transport."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.opened = 0
+        """Checkouts that had to open a new connection."""
+        self.reused = 0
+        """Checkouts that got an already open connection."""
+        self.waited = 0
+        """Checkouts that found every connection busy and blocked."""
+        self.wait_seconds = 0.0
+        """Total time spent blocked waiting for a connection."""
+        self.in_use = 0
+        """Connections checked out right now."""
+        self.peak_in_use = 0
+        """Most connections checked out at once."""
+
+    def checkout(self, reused: bool, wait_seconds: Optional[float]) -> None:
+        with self._lock:
+            if reused:
+                self.reused += 1
+            else:
+                self.opened += 1
+            if wait_seconds is not None:
+                self.waited += 1
+                self.wait_seconds += wait_seconds
+            self.in_use += 1
+            self.peak_in_use = max(self.peak_in_use, self.in_use)
+
+    def checkin(self) -> None:
+        with self._lock:
+            self.in_use -= 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "opened": self.opened,
+                "reused": self.reused,
+                "waited": self.waited,
+                "wait_seconds": self.wait_seconds,
+                "in_use": self.in_use,
+                "peak_in_use": self.peak_in_use,
+            }
+
+    def __repr__(self) -> str:
+        return (
+            "PoolStats(opened={opened}, reused={reused}, waited={waited}, "
+            "wait_seconds={wait_seconds:.3f}, in_use={in_use}, "
+            "peak_in_use={peak_in_use})".format(**self.as_dict())
+        )
+
+
+class _CountingPool:
+    """Mixin for urllib3 connection pools that reports to ``stats``."""
+
+    stats: PoolStats
+    pool_timeout: Optional[float]
+    pool: Any
+
+    def _get_conn(self, timeout: Optional[float] = None) -> Any:
+        if timeout is None:
+            timeout = self.pool_timeout
+        # Approximate under contention: another thread may return a
+        # connection between the check and the get.
+        busy = self.pool is not None and self.pool.empty()
+        started = time.perf_counter()
+        conn = super()._get_conn(timeout)  # type: ignore[misc]
+        # A pooled connection that is still connected has a socket; new
+        # ones, and dropped ones being reset, connect on first use.
+        self.stats.checkout(
+            reused=getattr(conn, "sock", None) is not None,
+            wait_seconds=time.perf_counter() - started if busy else None,
+        )
+        return conn
+
+    def _put_conn(self, conn: Any) -> None:
+        self.stats.checkin()
+        super()._put_conn(conn)  # type: ignore[misc]
+
+
+class Transport:
+    """A connection pool manager that any number of clients can share.
+
+    :param configuration: TLS and proxy settings; defaults to a fresh
+        :class:`Configuration`.  Its ``connection_pool_maxsize`` is ignored.
+    :param max_connections: Connections kept open per host.  Once all are
+        in use, further requests wait for one to be returned.
+    :param pool_timeout: Seconds to wait for a free connection before
+        raising ``urllib3.exceptions.EmptyPoolError``; None waits forever.
+    """
+
+    def __init__(
+        self,
+        configuration: Optional[Configuration] = None,
+        *,
+        max_connections: int = 10,
+        pool_timeout: Optional[float] = None,
+    ) -> None:
+        if max_connections < 1:
+            raise ValueError("max_connections must be at least 1")
+        self.max_connections = max_connections
+        self.stats = PoolStats()
+        """Connections opened, reused and waited for, across all clients."""
+        self.pool_manager: urllib3.PoolManager = build_pool_manager(
+            configuration or Configuration(),
+            maxsize=max_connections,
+            block=True,
+        )
+        # Counting subclasses of whatever pools the manager would build
+        # (plain, TLS, SOCKS), bound to this transport.
+        attributes = {"stats": self.stats, "pool_timeout": pool_timeout}
+        pool_classes = self.pool_manager.pool_classes_by_scheme
+        self.pool_manager.pool_classes_by_scheme = {
+            scheme: type(pool_class.__name__, (_CountingPool, pool_class), attributes)
+            for scheme, pool_class in pool_classes.items()
+        }
+
+    def close(self) -> None:
+        """Close every pooled connection; later requests open new ones."""
+        self.pool_manager.clear()
+
+    def __enter__(self) -> "Transport":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return "Transport(max_connections={0}, stats={1!r})".format(
+            self.max_connections, self.stats
+        )
@@ -1,44 +1,148 @@
 """pymetquay - Convenience wrapper for the Metquay CRUD API."""
 
-from openapi_client.api.authenticate_api import AuthenticateApi
-from openapi_client.api.customerinstruments_api import CustomerinstrumentsApi
-from openapi_client.api.customers_api import CustomersApi
-from openapi_client.api.instrumentcategories_api import InstrumentcategoriesApi
-from openapi_client.api.works_api import WorksApi
-from openapi_client.api_client import ApiClient
-from openapi_client.api_response import ApiResponse
-from openapi_client.configuration import Configuration
-from openapi_client.exceptions import (
-    ApiAttributeError,
-    ApiException,
-    ApiKeyError,
-    ApiTypeError,
-    ApiValueError,
-    OpenApiException,
-)
-from openapi_client.models.authentication_request import AuthenticationRequest
-from openapi_client.models.authentication_response import AuthenticationResponse
-from openapi_client.models.created_response import CreatedResponse
-from openapi_client.models.customer_instrument_request import CustomerInstrumentRequest
-from openapi_client.models.customer_instrument_response import (
-    CustomerInstrumentResponse,
-)
-from openapi_client.models.customer_request import CustomerRequest
-from openapi_client.models.customer_response import CustomerResponse
-from openapi_client.models.error_response import ErrorResponse
-from openapi_client.models.instrument_category_request import InstrumentCategoryRequest
-from openapi_client.models.work_request import WorkRequest
-from openapi_client.models.work_response import WorkResponse
+from typing import TYPE_CHECKING
+
+from openapi_client._lazy import attach
 from pymetquay._version import __version__
-from pymetquay.client import MetquayClient
+
+# Public name -> defining module, loaded on first access so that
+# ``import pymetquay`` stays cheap (see openapi_client._lazy).
+_EXPORTS = {
+    "AuthenticateApi": "openapi_client.api.authenticate_api",
+    "CustomerinstrumentsApi": "openapi_client.api.customerinstruments_api",
+    "CustomersApi": "openapi_client.api.customers_api",
+    "InstrumentcategoriesApi": "openapi_client.api.instrumentcategories_api",
+    "WorksApi": "openapi_client.api.works_api",
+    "ApiClient": "openapi_client.api_client",
+    "ApiResponse": "openapi_client.api_response",
+    "Configuration": "openapi_client.configuration",
+    "ApiAttributeError": "openapi_client.exceptions",
+    "ApiException": "openapi_client.exceptions",
+    "ApiKeyError": "openapi_client.exceptions",
+    "ApiTypeError": "openapi_client.exceptions",
+    "ApiValueError": "openapi_client.exceptions",
+    "OpenApiException": "openapi_client.exceptions",
+    "AuthenticationRequest": "openapi_client.models.authentication_request",
+    "AuthenticationResponse": "openapi_client.models.authentication_response",
+    "CreatedResponse": "openapi_client.models.created_response",
+    "CustomerInstrumentRequest": "openapi_client.models.customer_instrument_request",
+    "CustomerInstrumentResponse": "openapi_client.models.customer_instrument_response",
+    "CustomerRequest": "openapi_client.models.customer_request",
+    "CustomerResponse": "openapi_client.models.customer_response",
+    "ErrorResponse": "openapi_client.models.error_response",
+    "InstrumentCategoryRequest": "openapi_client.models.instrument_category_request",
+    "WorkRequest": "openapi_client.models.work_request",
+    "WorkResponse": "openapi_client.models.work_response",
+    "RateLimiter": "openapi_client.rate_limiter",
+    "Transport": "openapi_client.transport",
+    "AsyncMetquayClient": "pymetquay.aio",
+    "BulkItemResult": "pymetquay.bulk",
+    "BulkReport": "pymetquay.bulk",
+    "ResponseCache": "pymetquay.cache",
+    "MetquayClient": "pymetquay.client",
+    "ColumnarResult": "pymetquay.columnar",
+    "ExportReport": "pymetquay.export",
+    "export_entity": "pymetquay.export",
+    "export_pages": "pymetquay.export",
+    "FanOutReport": "pymetquay.fanout",
+    "WorkspaceResult": "pymetquay.fanout",
+    "fan_out": "pymetquay.fanout",
+    "CustomerIndex": "pymetquay.index",
+    "DuplicateKeyError": "pymetquay.index",
+    "InstrumentIndex": "pymetquay.index",
+    "RecordIndex": "pymetquay.index",
+    "MetquayMirror": "pymetquay.mirror",
+    "SyncReport": "pymetquay.mirror",
+    "projection": "pymetquay.projection",
+    "LazyRecord": "pymetquay.proxy",
+    "FileTokenCache": "pymetquay.token_cache",
+}
+
+__getattr__, __dir__ = attach(__name__, _EXPORTS)
+
+if TYPE_CHECKING:
+    from openapi_client.api.authenticate_api import AuthenticateApi
+    from openapi_client.api.customerinstruments_api import CustomerinstrumentsApi
+    from openapi_client.api.customers_api import CustomersApi
+    from openapi_client.api.instrumentcategories_api import InstrumentcategoriesApi
+    from openapi_client.api.works_api import WorksApi
+    from openapi_client.api_client import ApiClient
+    from openapi_client.api_response import ApiResponse
+    from openapi_client.configuration import Configuration
+    from openapi_client.exceptions import (
+        ApiAttributeError,
+        ApiException,
+        ApiKeyError,
+        ApiTypeError,
+        ApiValueError,
+        OpenApiException,
+    )
+    from openapi_client.models.authentication_request import AuthenticationRequest
+    from openapi_client.models.authentication_response import AuthenticationResponse
+    from openapi_client.models.created_response import CreatedResponse
+    from openapi_client.models.customer_instrument_request import (
+        CustomerInstrumentRequest,
+    )
+    from openapi_client.models.customer_instrument_response import (
+        CustomerInstrumentResponse,
+    )
+    from openapi_client.models.customer_request import CustomerRequest
+    from openapi_client.models.customer_response import CustomerResponse
+    from openapi_client.models.error_response import ErrorResponse
+    from openapi_client.models.instrument_category_request import (
+        InstrumentCategoryRequest,
+    )
+    from openapi_client.models.work_request import WorkRequest
+    from openapi_client.models.work_response import WorkResponse
+    from openapi_client.rate_limiter import RateLimiter
+    from openapi_client.transport import Transport
+    from pymetquay.aio import AsyncMetquayClient
+    from pymetquay.bulk import BulkItemResult, BulkReport
+    from pymetquay.cache import ResponseCache
+    from pymetquay.client import MetquayClient
+    from pymetquay.columnar import ColumnarResult
+    from pymetquay.export import ExportReport, export_entity, export_pages
+    from pymetquay.fanout import FanOutReport, WorkspaceResult, fan_out
+    from pymetquay.index import (
+        CustomerIndex,
+        DuplicateKeyError,
+        InstrumentIndex,
+        RecordIndex,
+    )
+    from pymetquay.mirror import MetquayMirror, SyncReport
+    from pymetquay.projection import projection
+    from pymetquay.proxy import LazyRecord
+    from pymetquay.token_cache import FileTokenCache
 
 __all__ = [
     "MetquayClient",
+    "AsyncMetquayClient",
+    "FileTokenCache",
+    "ResponseCache",
+    "ColumnarResult",
+    "LazyRecord",
+    "projection",
+    "ExportReport",
+    "export_entity",
+    "export_pages",
+    "fan_out",
+    "FanOutReport",
+    "WorkspaceResult",
+    "BulkReport",
+    "BulkItemResult",
+    "MetquayMirror",
+    "SyncReport",
+    "RecordIndex",
+    "InstrumentIndex",
+    "CustomerIndex",
+    "DuplicateKeyError",
     "__version__",
     # API classes
     "ApiClient",
     "ApiResponse",
     "Configuration",
+    "RateLimiter",
+    "Transport",
     "AuthenticateApi",
     "CustomersApi",
     "CustomerinstrumentsApi",
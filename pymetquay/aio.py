@@ -0,0 +1,769 @@
+"""Asyncio counterpart of :class:`pymetquay.MetquayClient`.
+
+Requests are built and responses parsed by the generated ``openapi_client``
+code, but the HTTP round-trip goes through a non-blocking ``aiohttp`` session,
+so a single event loop can keep many requests in flight without a thread per
+call.  ``aiohttp`` is an optional dependency (``pip install pymetquay[async]``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import logging
+import ssl
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+
+import urllib3
+
+from openapi_client import ApiClient, Configuration
+from openapi_client.api.authenticate_api import AuthenticateApi
+from openapi_client.api.customerinstruments_api import CustomerinstrumentsApi
+from openapi_client.api.customers_api import CustomersApi
+from openapi_client.api.instrumentcategories_api import InstrumentcategoriesApi
+from openapi_client.api.works_api import WorksApi
+from openapi_client.api_client import RequestSerialized
+from openapi_client.instrumentation import RequestEvent, RequestHook, RequestMetrics
+from openapi_client.models.authentication_request import AuthenticationRequest
+from openapi_client.models.authentication_response import AuthenticationResponse
+from openapi_client.models.created_response import CreatedResponse
+from openapi_client.models.customer_instrument_request import CustomerInstrumentRequest
+from openapi_client.models.customer_instrument_response import (
+    CustomerInstrumentResponse,
+)
+from openapi_client.models.customer_request import CustomerRequest
+from openapi_client.models.customer_response import CustomerResponse
+from openapi_client.models.instrument_category_request import InstrumentCategoryRequest
+from openapi_client.models.work_request import WorkRequest
+from openapi_client.models.work_response import WorkResponse
+from openapi_client.rate_limiter import RateLimiter
+from openapi_client.retry import RetryPolicy, RetryStats
+from openapi_client.rest import RESTResponse
+from pymetquay import client as _sync
+from pymetquay.client import _api_base_url, _resolve_settings
+
+if TYPE_CHECKING:
+    import aiohttp
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+PageFetcher = Callable[..., Awaitable[List[T]]]
+
+
+def _response_types(
+    success_status: str, success_type: Optional[str]
+) -> Dict[str, Optional[str]]:
+    """Response type map in the shape the generated API methods use."""
+    return {
+        success_status: success_type,
+        "4XX": "ErrorResponse",
+        "5XX": "ErrorResponse",
+    }
+
+
+class AsyncMetquayClient:
+    """Asyncio client for the Metquay CRUD API.
+
+    Mirrors :class:`~pymetquay.MetquayClient`: the same credential lookup,
+    automatic token management and pagination helpers, with every call a
+    coroutine.  Concurrent callers share a single token refresh.
+
+    Usage::
+
+        from pymetquay.aio import AsyncMetquayClient
+
+        async with AsyncMetquayClient() as client:
+            customers = await client.list_customers(limit=10)
+            async for work in client.iter_works():
+                ...
+    """
+
+    def __init__(
+        self,
+        access_key: Optional[str] = None,
+        secret_key: Optional[str] = None,
+        host: Optional[str] = None,
+        *,
+        dotenv_path: Optional[str] = None,
+        connection_limit: int = 100,
+        rate_limit_per_minute: Optional[float] = _sync._RATE_LIMIT_PER_MINUTE,
+        rate_limit_burst: int = _sync._RATE_LIMIT_BURST,
+        retry_policy: Optional[RetryPolicy] = _sync._DEFAULT_RETRY_POLICY,
+        request_hooks: Sequence[RequestHook] = (),
+    ) -> None:
+        try:
+            import aiohttp  # noqa: F401
+        except ImportError as e:
+            raise ImportError(
+                "AsyncMetquayClient requires aiohttp. "
+                "Install it with `pip install pymetquay[async]`."
+            ) from e
+
+        self._access_key, self._secret_key, metquay_host = _resolve_settings(
+            access_key, secret_key, host, dotenv_path
+        )
+
+        self._configuration = Configuration(host=_api_base_url(metquay_host))
+        self._configuration.rate_limit_per_minute = rate_limit_per_minute
+        self._configuration.rate_limit_burst = rate_limit_burst
+        self._configuration.retry_policy = retry_policy
+        self._configuration.request_hooks = list(request_hooks)
+        # Used to serialize requests, deserialize responses and hold the rate
+        # limiter; no I/O goes through its urllib3 pool.
+        self._api_client = ApiClient(self._configuration)
+
+        self._auth_api = AuthenticateApi(self._api_client)
+        self._customers_api = CustomersApi(self._api_client)
+        self._instruments_api = CustomerinstrumentsApi(self._api_client)
+        self._categories_api = InstrumentcategoriesApi(self._api_client)
+        self._works_api = WorksApi(self._api_client)
+
+        self._connection_limit = connection_limit
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Created lazily so they bind to the loop that actually runs them.
+        self._auth_lock: Optional[asyncio.Lock] = None
+
+        self._token: Optional[str] = None
+        self._token_acquired_at: float = 0.0
+        self._token_ttl: int = _sync._DEFAULT_TOKEN_TTL
+
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        """Token bucket shared by every request this client makes, if enabled."""
+        return self._api_client.rate_limiter
+
+    @property
+    def retry_stats(self) -> RetryStats:
+        """Retries made so far and total time spent backing off."""
+        return self._api_client.retry_stats
+
+    @property
+    def metrics(self) -> RequestMetrics:
+        """Per-operation latency, phase timings, statuses and response sizes."""
+        return self._api_client.metrics
+
+    # -- Context manager ---------------------------------------------------
+
+    async def __aenter__(self) -> AsyncMetquayClient:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    # -- Transport ---------------------------------------------------------
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        import aiohttp
+
+        if self._session is None or self._session.closed:
+            config = self._configuration
+            ssl_context = ssl.create_default_context(cafile=config.ssl_ca_cert)
+            if config.cert_file:
+                ssl_context.load_cert_chain(config.cert_file, keyfile=config.key_file)
+            if not config.verify_ssl:
+                ssl_context.check_hostname = False
+                ssl_context.verify_mode = ssl.CERT_NONE
+            connector = aiohttp.TCPConnector(
+                limit=self._connection_limit, ssl=ssl_context
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def _send(
+        self,
+        param: RequestSerialized,
+        response_types_map: Dict[str, Optional[str]],
+    ) -> Any:
+        """Perform a serialized request and deserialize the response."""
+        method, url, header_params, body, _post_params = param
+        # Before the first await, while the event from serialization is
+        # still this task's.
+        event = self._api_client.begin_request(method, url)
+        request_body = None
+        if body is not None:
+            request_body = self._configuration.json_codec.dumps(body)
+
+        try:
+            response_data = await self._request_with_retries(
+                method, url, header_params, request_body, event
+            )
+        except Exception as e:
+            event.error = e
+            event.network_seconds = event.elapsed_network()
+            self._api_client.end_request(event)
+            raise
+        response_data.request_event = event
+        return self._api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=response_types_map,
+        ).data
+
+    async def _request_with_retries(
+        self,
+        method: str,
+        url: str,
+        header_params: Dict[str, str],
+        request_body: Optional[str],
+        event: RequestEvent,
+    ) -> RESTResponse:
+        """Send one request, pacing and retrying like ``ApiClient.call_api``."""
+        rate_limiter = self._api_client.rate_limiter
+        retry_policy = self._configuration.retry_policy
+        attempt = 0
+        while True:
+            if rate_limiter is not None:
+                delay = rate_limiter.reserve()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                    event.rate_limit_seconds += delay
+
+            event.attempts += 1
+            response_data = await self._request_once(
+                method, url, header_params, request_body
+            )
+            if retry_policy is None or not retry_policy.should_retry(
+                method, response_data.status, attempt
+            ):
+                return response_data
+
+            delay = retry_policy.backoff(
+                attempt, response_data.getheader("Retry-After")
+            )
+            self._api_client.retry_stats.record(response_data.status, delay)
+            logger.info(
+                "%s %s returned %s; retrying in %.2fs (attempt %d of %d)",
+                method,
+                url,
+                response_data.status,
+                delay,
+                attempt + 1,
+                retry_policy.max_retries,
+            )
+            await asyncio.sleep(delay)
+            event.backoff_seconds += delay
+            attempt += 1
+
+    async def _request_once(
+        self,
+        method: str,
+        url: str,
+        header_params: Dict[str, str],
+        request_body: Optional[str],
+    ) -> RESTResponse:
+        session = self._get_session()
+        async with session.request(
+            method, url, headers=header_params, data=request_body
+        ) as resp:
+            payload = await resp.read()
+            headers = urllib3.HTTPHeaderDict()
+            for name, value in resp.headers.items():
+                headers.add(name, value)
+            http_resp = urllib3.HTTPResponse(
+                body=io.BytesIO(payload),
+                headers=headers,
+                status=resp.status,
+                reason=resp.reason,
+                preload_content=True,
+            )
+
+        response_data = RESTResponse(http_resp)
+        response_data.read()
+        return response_data
+
+    # -- Authentication ----------------------------------------------------
+
+    def _is_token_valid(self) -> bool:
+        if self._token is None:
+            return False
+        elapsed = time.monotonic() - self._token_acquired_at
+        remaining = self._token_ttl - elapsed
+        return remaining > _sync._TOKEN_REFRESH_MARGIN_SECONDS
+
+    async def _ensure_authenticated(self) -> None:
+        if self._is_token_valid():
+            return
+        if self._auth_lock is None:
+            self._auth_lock = asyncio.Lock()
+        async with self._auth_lock:
+            # Another task may have refreshed while we waited for the lock.
+            if not self._is_token_valid():
+                await self.authenticate()
+
+    async def authenticate(self) -> AuthenticationResponse:
+        """Authenticate and obtain a new bearer token."""
+        request = AuthenticationRequest(
+            accessKey=self._access_key,
+            secretKey=self._secret_key,
+        )
+        param = self._auth_api._get_access_token_serialize(
+            authentication_request=request,
+            _request_auth=None,
+            _content_type=None,
+            _headers=None,
+            _host_index=0,
+        )
+        response: AuthenticationResponse = await self._send(
+            param, _response_types("200", "AuthenticationResponse")
+        )
+
+        self._token = response.access_token
+        self._token_acquired_at = time.monotonic()
+        self._token_ttl = response.expires_in or _sync._DEFAULT_TOKEN_TTL
+        self._configuration.access_token = self._token
+
+        logger.info(
+            "Authenticated successfully (token expires in %d seconds)",
+            self._token_ttl,
+        )
+        return response
+
+    async def _call(
+        self,
+        serialize: Callable[..., RequestSerialized],
+        response_types_map: Dict[str, Optional[str]],
+        **params: Any,
+    ) -> Any:
+        """Authenticate if needed, then serialize and send one operation."""
+        await self._ensure_authenticated()
+        param = serialize(
+            _request_auth=None,
+            _content_type=None,
+            _headers=None,
+            _host_index=0,
+            **params,
+        )
+        return await self._send(param, response_types_map)
+
+    # -- Generic pagination helpers ----------------------------------------
+
+    async def _iter_pages(
+        self,
+        fetch_page: PageFetcher[T],
+        *,
+        first: int = 0,
+        page_size: int = _sync._DEFAULT_PAGE_LIMIT,
+        **kwargs: Any,
+    ) -> AsyncIterator[List[T]]:
+        """Yield successive pages from a paginated list endpoint."""
+        offset = first
+        while True:
+            page = await fetch_page(first=offset, limit=page_size, **kwargs)
+            if page:
+                yield page
+            if len(page) < page_size:
+                return
+            offset += len(page)
+
+    async def _paginate_all(
+        self,
+        fetch_page: PageFetcher[T],
+        *,
+        page_size: int = _sync._DEFAULT_PAGE_LIMIT,
+        concurrency: int = 1,
+        **kwargs: Any,
+    ) -> List[T]:
+        """Fetch all pages, with up to ``concurrency`` requests in flight.
+
+        Follows the same rules as the synchronous client: requests are paced
+        by the shared rate limiter, the first short page marks the end of the
+        data, and records come back in offset order.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        all_records: List[T] = []
+        if concurrency == 1:
+            async for page in self._iter_pages(
+                fetch_page, page_size=page_size, **kwargs
+            ):
+                all_records.extend(page)
+            return all_records
+
+        pages: Dict[int, List[T]] = {}
+        end_offset: Optional[int] = None
+        next_offset = 0
+        in_flight: Dict[asyncio.Future[List[T]], int] = {}
+        try:
+            while True:
+                while end_offset is None and len(in_flight) < concurrency:
+                    future: asyncio.Future[List[T]] = asyncio.ensure_future(
+                        fetch_page(first=next_offset, limit=page_size, **kwargs)
+                    )
+                    in_flight[future] = next_offset
+                    next_offset += page_size
+                if not in_flight:
+                    break
+                done, _ = await asyncio.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    offset = in_flight.pop(future)
+                    page = future.result()
+                    pages[offset] = page
+                    if len(page) < page_size and (
+                        end_offset is None or offset < end_offset
+                    ):
+                        end_offset = offset
+        except BaseException:
+            for future in in_flight:
+                future.cancel()
+            raise
+
+        for offset in sorted(pages):
+            if end_offset is not None and offset > end_offset:
+                break
+            all_records.extend(pages[offset])
+        return all_records
+
+    async def gather(
+        self,
+        *aws: Awaitable[T],
+        concurrency: int = 10,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """Run awaitables concurrently with at most ``concurrency`` in flight.
+
+        A bounded ``asyncio.gather`` for bulk work, e.g.::
+
+            results = await client.gather(
+                *(client.create_work(r) for r in requests), concurrency=20
+            )
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _bounded(aw: Awaitable[T]) -> T:
+            async with semaphore:
+                return await aw
+
+        return await asyncio.gather(
+            *(_bounded(aw) for aw in aws), return_exceptions=return_exceptions
+        )
+
+    # -- Customers ---------------------------------------------------------
+
+    async def _get_customers_page(
+        self, *, first: int, limit: int, workspace_code: Optional[str] = None
+    ) -> List[CustomerResponse]:
+        return await self._call(
+            self._customers_api._get_customers_serialize,
+            _response_types("200", "List[CustomerResponse]"),
+            workspace_code=workspace_code,
+            first=first,
+            limit=limit,
+        )
+
+    async def list_customers(
+        self,
+        *,
+        first: Optional[int] = None,
+        limit: Optional[int] = None,
+        workspace_code: Optional[str] = None,
+        paginate_all: bool = False,
+        concurrency: int = 1,
+    ) -> List[CustomerResponse]:
+        """List customers, optionally auto-paginating all results."""
+        if paginate_all:
+            return await self._paginate_all(
+                self._get_customers_page,
+                concurrency=concurrency,
+                workspace_code=workspace_code,
+            )
+        return await self._call(
+            self._customers_api._get_customers_serialize,
+            _response_types("200", "List[CustomerResponse]"),
+            workspace_code=workspace_code,
+            first=first,
+            limit=limit,
+        )
+
+    def iter_customers(
+        self,
+        *,
+        first: int = 0,
+        page_size: int = _sync._DEFAULT_PAGE_LIMIT,
+        workspace_code: Optional[str] = None,
+    ) -> AsyncIterator[CustomerResponse]:
+        """Yield customers one at a time, fetching pages lazily."""
+        return self._iter_records(
+            self.iter_customer_pages(
+                first=first, page_size=page_size, workspace_code=workspace_code
+            )
+        )
+
+    def iter_customer_pages(
+        self,
+        *,
+        first: int = 0,
+        page_size: int = _sync._DEFAULT_PAGE_LIMIT,
+        workspace_code: Optional[str] = None,
+    ) -> AsyncIterator[List[CustomerResponse]]:
+        """Yield customers page by page as each page is deserialized."""
+        return self._iter_pages(
+            self._get_customers_page,
+            first=first,
+            page_size=page_size,
+            workspace_code=workspace_code,
+        )
+
+    async def create_customer(self, request: CustomerRequest) -> CreatedResponse:
+        """Create a new customer."""
+        return await self._call(
+            self._customers_api._create_customer_serialize,
+            _response_types("201", "CreatedResponse"),
+            customer_request=request,
+        )
+
+    async def update_customer(self, metquay_id: int, request: CustomerRequest) -> None:
+        """Update a customer by Metquay ID (full replacement)."""
+        await self._call(
+            self._customers_api._update_customer_serialize,
+            _response_types("200", None),
+            metquay_id=metquay_id,
+            customer_request=request,
+        )
+
+    async def delete_customer(self, metquay_id: int) -> None:
+        """Delete a customer by Metquay ID."""
+        await self._call(
+            self._customers_api._delete_customer_serialize,
+            _response_types("200", None),
+            metquay_id=metquay_id,
+        )
+
+    # -- Customer instruments ----------------------------------------------
+
+    async def _get_instruments_page(
+        self, *, first: int, limit: int, workspace_code: Optional[str] = None
+    ) -> List[CustomerInstrumentResponse]:
+        return await self._call(
+            self._instruments_api._get_customer_instruments_serialize,
+            _response_types("200", "List[CustomerInstrumentResponse]"),
+            workspace_code=workspace_code,
+            first=first,
+            limit=limit,
+        )
+
+    async def list_instruments(
+        self,
+        *,
+        first: Optional[int] = None,
+        limit: Optional[int] = None,
+        workspace_code: Optional[str] = None,
+        paginate_all: bool = False,
+        concurrency: int = 1,
+    ) -> List[CustomerInstrumentResponse]:
+        """List customer instruments, optionally auto-paginating all results."""
+        if paginate_all:
+            return await self._paginate_all(
+                self._get_instruments_page,
+                concurrency=concurrency,
+                workspace_code=workspace_code,
+            )
+        return await self._call(
+            self._instruments_api._get_customer_instruments_serialize,
+            _response_types("200", "List[CustomerInstrumentResponse]"),
+            workspace_code=workspace_code,
+            first=first,
+            limit=limit,
+        )
+
+    def iter_instruments(
+        self,
+        *,
+        first: int = 0,
+        page_size: int = _sync._DEFAULT_PAGE_LIMIT,
+        workspace_code: Optional[str] = None,
+    ) -> AsyncIterator[CustomerInstrumentResponse]:
+        """Yield customer instruments one at a time, fetching pages lazily."""
+        return self._iter_records(
+            self.iter_instrument_pages(
+                first=first, page_size=page_size, workspace_code=workspace_code
+            )
+        )
+
+    def iter_instrument_pages(
+        self,
+        *,
+        first: int = 0,
+        page_size: int = _sync._DEFAULT_PAGE_LIMIT,
+        workspace_code: Optional[str] = None,
+    ) -> AsyncIterator[List[CustomerInstrumentResponse]]:
+        """Yield customer instruments page by page as each page is deserialized."""
+        return self._iter_pages(
+            self._get_instruments_page,
+            first=first,
+            page_size=page_size,
+            workspace_code=workspace_code,
+        )
+
+    async def create_instrument(
+        self, request: CustomerInstrumentRequest
+    ) -> CreatedResponse:
+        """Register a new customer instrument."""
+        return await self._call(
+            self._instruments_api._create_customer_instrument_serialize,
+            _response_types("201", "CreatedResponse"),
+            customer_instrument_request=request,
+        )
+
+    async def update_instrument(
+        self, metquay_id: int, request: CustomerInstrumentRequest
+    ) -> None:
+        """Update a customer instrument by Metquay ID."""
+        await self._call(
+            self._instruments_api._update_customer_instrument_serialize,
+            _response_types("200", None),
+            metquay_id=metquay_id,
+            customer_instrument_request=request,
+        )
+
+    async def delete_instrument(self, metquay_id: int) -> None:
+        """Delete a customer instrument by Metquay ID."""
+        await self._call(
+            self._instruments_api._delete_customer_instrument_serialize,
+            _response_types("200", None),
+            metquay_id=metquay_id,
+        )
+
+    # -- Instrument categories ---------------------------------------------
+
+    async def create_instrument_category(
+        self, request: InstrumentCategoryRequest
+    ) -> CreatedResponse:
+        """Create a new instrument category."""
+        return await self._call(
+            self._categories_api._create_instrument_category_serialize,
+            _response_types("201", "CreatedResponse"),
+            instrument_category_request=request,
+        )
+
+    async def update_instrument_category(
+        self, metquay_id: int, request: InstrumentCategoryRequest
+    ) -> None:
+        """Update an instrument category by Metquay ID."""
+        await self._call(
+            self._categories_api._update_instrument_category_serialize,
+            _response_types("200", None),
+            metquay_id=metquay_id,
+            instrument_category_request=request,
+        )
+
+    async def delete_instrument_category(self, metquay_id: int) -> None:
+        """Delete an instrument category by Metquay ID."""
+        await self._call(
+            self._categories_api._delete_instrument_category_serialize,
+            _response_types("200", None),
+            metquay_id=metquay_id,
+        )
+
+    # -- Works -------------------------------------------------------------
+
+    async def _get_works_page(
+        self, *, first: int, limit: int, workspace_code: Optional[str] = None
+    ) -> List[WorkResponse]:
+        return await self._call(
+            self._works_api._get_works_serialize,
+            _response_types("200", "List[WorkResponse]"),
+            workspace_code=workspace_code,
+            first=first,
+            limit=limit,
+        )
+
+    async def list_works(
+        self,
+        *,
+        first: Optional[int] = None,
+        limit: Optional[int] = None,
+        workspace_code: Optional[str] = None,
+        paginate_all: bool = False,
+        concurrency: int = 1,
+    ) -> List[WorkResponse]:
+        """List works, optionally auto-paginating all results."""
+        if paginate_all:
+            return await self._paginate_all(
+                self._get_works_page,
+                concurrency=concurrency,
+                workspace_code=workspace_code,
+            )
+        return await self._call(
+            self._works_api._get_works_serialize,
+            _response_types("200", "List[WorkResponse]"),
+            workspace_code=workspace_code,
+            first=first,
+            limit=limit,
+        )
+
+    def iter_works(
+        self,
+        *,
+        first: int = 0,
+        page_size: int = _sync._DEFAULT_PAGE_LIMIT,
+        workspace_code: Optional[str] = None,
+    ) -> AsyncIterator[WorkResponse]:
+        """Yield works one at a time, fetching pages lazily."""
+        return self._iter_records(
+            self.iter_work_pages(
+                first=first, page_size=page_size, workspace_code=workspace_code
+            )
+        )
+
+    def iter_work_pages(
+        self,
+        *,
+        first: int = 0,
+        page_size: int = _sync._DEFAULT_PAGE_LIMIT,
+        workspace_code: Optional[str] = None,
+    ) -> AsyncIterator[List[WorkResponse]]:
+        """Yield works page by page as each page is deserialized."""
+        return self._iter_pages(
+            self._get_works_page,
+            first=first,
+            page_size=page_size,
+            workspace_code=workspace_code,
+        )
+
+    async def create_work(self, request: WorkRequest) -> CreatedResponse:
+        """Create a new work order."""
+        return await self._call(
+            self._works_api._create_work_serialize,
+            _response_types("201", "CreatedResponse"),
+            work_request=request,
+        )
+
+    async def update_work(self, metquay_id: int, request: WorkRequest) -> None:
+        """Update a work order by Metquay ID."""
+        await self._call(
+            self._works_api._update_work_serialize,
+            _response_types("200", None),
+            metquay_id=metquay_id,
+            work_request=request,
+        )
+
+    # -- Helpers -----------------------------------------------------------
+
+    @staticmethod
+    async def _iter_records(pages: AsyncIterator[List[T]]) -> AsyncIterator[T]:
+        async for page in pages:
+            for record in page:
+                yield record
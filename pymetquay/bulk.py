@@ -0,0 +1,185 @@
+"""Concurrent bulk operations with per-item results.
+
+The ``MetquayClient.bulk_*`` methods fan single-entity calls out over a
+thread pool.  Every request still goes through the client's shared rate
+limiter, so ``concurrency`` hides latency without exceeding the API quota.
+One item failing never stops the others; each outcome is collected into a
+:class:`BulkReport`.
+
+Nothing here retries.  Transient failures of idempotent calls (PUT, DELETE)
+are already retried by the client's retry policy.  POST (create) is never
+retried at any level: a retried create may duplicate the record.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Generic, Iterable, List, Optional, TypeVar
+
+from openapi_client.exceptions import ApiException
+
+logger = logging.getLogger(__name__)
+
+ItemT = TypeVar("ItemT")
+
+ResultCallback = Callable[["BulkItemResult[Any]"], None]
+
+
+class BulkItemResult(Generic[ItemT]):
+    """Outcome of one item of a bulk operation."""
+
+    def __init__(
+        self,
+        index: int,
+        item: ItemT,
+        value: Any = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        self.index = index
+        """Position of the item in the input."""
+        self.item = item
+        """The input item (request, ``(metquay_id, request)`` pair or id)."""
+        self.value = value
+        """What the call returned (``CreatedResponse`` for creates)."""
+        self.error = error
+        """The exception raised by the call, if it failed."""
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def status(self) -> Optional[int]:
+        """HTTP status of a failed call, when the failure was an API error."""
+        if isinstance(self.error, ApiException):
+            return self.error.status
+        return None
+
+    def __repr__(self) -> str:
+        if self.ok:
+            return "BulkItemResult(index={0}, ok=True)".format(self.index)
+        return "BulkItemResult(index={0}, error={1!r})".format(self.index, self.error)
+
+
+class BulkReport(Generic[ItemT]):
+    """Summary of a bulk operation.
+
+    ``succeeded`` and ``failed`` are in completion order; use
+    :attr:`BulkItemResult.index` to map results back to the input.
+    """
+
+    def __init__(self, operation: str) -> None:
+        self.operation = operation
+        self.succeeded: List[BulkItemResult[ItemT]] = []
+        self.failed: List[BulkItemResult[ItemT]] = []
+        self.started_at = 0.0
+        self.finished_at = 0.0
+
+    def _add(self, result: BulkItemResult[ItemT]) -> None:
+        (self.succeeded if result.ok else self.failed).append(result)
+
+    @property
+    def total(self) -> int:
+        return len(self.succeeded) + len(self.failed)
+
+    @property
+    def created_ids(self) -> List[int]:
+        """Metquay IDs returned by successful creates, in input order."""
+        return [
+            result.value.metquay_id
+            for result in sorted(self.succeeded, key=lambda r: r.index)
+            if getattr(result.value, "metquay_id", None) is not None
+        ]
+
+    @property
+    def failures_by_status(self) -> Dict[Optional[int], int]:
+        """Failure counts keyed by HTTP status (None for non-API errors)."""
+        counts: Dict[Optional[int], int] = {}
+        for result in self.failed:
+            counts[result.status] = counts.get(result.status, 0) + 1
+        return counts
+
+    @property
+    def elapsed(self) -> float:
+        return self.finished_at - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        """Items completed per second."""
+        return self.total / self.elapsed if self.elapsed > 0 else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            "BulkReport(operation={0!r}, succeeded={1}, failed={2}, "
+            "elapsed={3:.2f}s, throughput={4:.1f}/s)".format(
+                self.operation,
+                len(self.succeeded),
+                len(self.failed),
+                self.elapsed,
+                self.throughput,
+            )
+        )
+
+
+def run_bulk(
+    operation: str,
+    call: Callable[[ItemT], Any],
+    items: Iterable[ItemT],
+    *,
+    concurrency: int = 4,
+    on_result: Optional[ResultCallback] = None,
+) -> BulkReport[ItemT]:
+    """Apply ``call`` to every item on a thread pool and report the outcomes.
+
+    ``items`` is consumed lazily, with at most ``2 * concurrency`` calls
+    queued at a time, so very large inputs can be streamed from a generator.
+    ``on_result`` is invoked on the calling thread as each item finishes.
+
+    :param operation: Name used in the report and log messages.
+    :param call: Performs one item, e.g. ``client.create_instrument``.
+    :param items: Inputs for ``call``.
+    :param concurrency: Maximum calls in flight at once.
+    :param on_result: Optional callback receiving each
+        :class:`BulkItemResult` as soon as it is available.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    report: BulkReport[ItemT] = BulkReport(operation)
+    report.started_at = time.monotonic()
+
+    def handle(future: Future[Any], index: int, item: ItemT) -> None:
+        error = future.exception()
+        if error is None:
+            result = BulkItemResult(index, item, value=future.result())
+        else:
+            logger.debug("%s item %d failed: %r", operation, index, error)
+            result = BulkItemResult(index, item, error=error)
+        report._add(result)
+        if on_result is not None:
+            on_result(result)
+
+    in_flight: Dict[Future[Any], Any] = {}
+    with ThreadPoolExecutor(
+        max_workers=concurrency, thread_name_prefix="pymetquay-bulk"
+    ) as executor:
+        try:
+            for index, item in enumerate(items):
+                in_flight[executor.submit(call, item)] = (index, item)
+                if len(in_flight) >= 2 * concurrency:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        handle(future, *in_flight.pop(future))
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    handle(future, *in_flight.pop(future))
+        except BaseException:
+            for future in in_flight:
+                future.cancel()
+            raise
+
+    report.finished_at = time.monotonic()
+    logger.info("%r", report)
+    return report
@@ -0,0 +1,181 @@
+"""Opt-in TTL + LRU cache for list responses.
+
+Components that ask for the same page (``list_customers(first=0, limit=50)``)
+within seconds of each other can share one request and one parse::
+
+    from pymetquay import MetquayClient, ResponseCache
+
+    cache = ResponseCache(ttl=30, ttl_by_endpoint={"works": 5})
+    client = MetquayClient(response_cache=cache)
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+CacheKey = Tuple[str, Optional[str], Optional[int], Optional[int]]
+"""``(endpoint, workspace_code, first, limit)``."""
+
+
+class _Entry:
+    __slots__ = ("value", "size", "expires_at")
+
+    def __init__(self, value: List[Any], size: int, expires_at: float) -> None:
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+
+
+class ResponseCache:
+    """Thread-safe cache of list pages with per-endpoint TTLs.
+
+    Entries expire ``ttl`` seconds after they are stored (or the endpoint's
+    value in ``ttl_by_endpoint``; a TTL of 0 disables caching for that
+    endpoint).  When the cache holds more than ``max_entries`` pages or
+    ``max_bytes`` of response bodies, the least recently used pages are
+    evicted.  ``max_bytes`` counts raw response bytes; the parsed models
+    take several times that in memory.
+
+    Cached pages are shared between callers: :meth:`get` returns a new list
+    each time, but the records in it are the same objects.
+
+    A page fetched while a write was in flight may predate the write.  The
+    caller reads :meth:`generation` before requesting a page and passes it
+    to :meth:`put`, which drops the page if :meth:`invalidate` (or
+    :meth:`clear`) ran in between.
+
+    :param ttl: Default time to live, in seconds.
+    :param ttl_by_endpoint: TTL overrides keyed by endpoint name
+        (``"customers"``, ``"instruments"``, ``"works"``).
+    :param max_entries: Maximum number of cached pages.
+    :param max_bytes: Maximum total size of cached response bodies.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 30.0,
+        *,
+        ttl_by_endpoint: Optional[Dict[str, float]] = None,
+        max_entries: int = 256,
+        max_bytes: int = 32 * 1024 * 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if ttl < 0 or any(v < 0 for v in (ttl_by_endpoint or {}).values()):
+            raise ValueError("ttl must not be negative")
+        if max_entries < 1 or max_bytes < 1:
+            raise ValueError("max_entries and max_bytes must be positive")
+        self.ttl = ttl
+        self.ttl_by_endpoint: Dict[str, float] = dict(ttl_by_endpoint or {})
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[CacheKey, _Entry] = OrderedDict()
+        self._bytes = 0
+        self._generations: Dict[str, int] = {}
+        self._clears = 0
+        self.hits = 0
+        """Lookups answered from the cache."""
+        self.misses = 0
+        """Lookups that found nothing, or only an expired page."""
+        self.evictions = 0
+        """Pages dropped to stay within ``max_entries`` / ``max_bytes``."""
+
+    def ttl_for(self, endpoint: str) -> float:
+        return self.ttl_by_endpoint.get(endpoint, self.ttl)
+
+    def get(self, key: CacheKey) -> Optional[List[Any]]:
+        """Return a copy of the cached page for ``key``, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= self._clock():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return list(entry.value)
+
+    def generation(self, endpoint: str) -> int:
+        """Counter that changes whenever ``endpoint``'s pages are invalidated."""
+        with self._lock:
+            return self._generations.get(endpoint, 0) + self._clears
+
+    def put(
+        self,
+        key: CacheKey,
+        value: List[Any],
+        size: int,
+        generation: Optional[int] = None,
+    ) -> None:
+        """Store a page whose response body was ``size`` bytes.
+
+        :param generation: :meth:`generation` of the endpoint read before
+            the page was requested; the page is not stored if it has changed
+            since.
+        """
+        ttl = self.ttl_for(key[0])
+        if ttl <= 0 or size > self.max_bytes:
+            return
+        with self._lock:
+            current = self._generations.get(key[0], 0) + self._clears
+            if generation is not None and generation != current:
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _Entry(list(value), size, self._clock() + ttl)
+            self._bytes += size
+            while (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, endpoint: str) -> int:
+        """Drop every cached page of ``endpoint``; return how many.
+
+        Pages of ``endpoint`` requested before this call are not stored
+        when they arrive afterwards.
+        """
+        with self._lock:
+            self._generations[endpoint] = self._generations.get(endpoint, 0) + 1
+            keys = [key for key in self._entries if key[0] == endpoint]
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clears += 1
+            self._entries.clear()
+            self._bytes = 0
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    @property
+    def size_bytes(self) -> int:
+        """Total response bytes currently cached."""
+        return self._bytes
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return (
+            "ResponseCache(entries={0}, bytes={1}, hits={2}, misses={3}, "
+            "evictions={4})".format(
+                len(self), self._bytes, self.hits, self.misses, self.evictions
+            )
+        )
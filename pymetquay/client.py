@@ -2,39 +2,165 @@
 
 from __future__ import annotations
 
+import contextlib
+import functools
 import logging
 import os
+import threading
 import time
-from typing import Callable, List, Optional, TypeVar
-
-from dotenv import load_dotenv
-
-from openapi_client import ApiClient, Configuration
-from openapi_client.api.authenticate_api import AuthenticateApi
-from openapi_client.api.customerinstruments_api import CustomerinstrumentsApi
-from openapi_client.api.customers_api import CustomersApi
-from openapi_client.api.instrumentcategories_api import InstrumentcategoriesApi
-from openapi_client.api.works_api import WorksApi
-from openapi_client.models.authentication_request import AuthenticationRequest
-from openapi_client.models.authentication_response import AuthenticationResponse
-from openapi_client.models.created_response import CreatedResponse
-from openapi_client.models.customer_instrument_request import CustomerInstrumentRequest
-from openapi_client.models.customer_instrument_response import (
-    CustomerInstrumentResponse,
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    overload,
 )
-from openapi_client.models.customer_request import CustomerRequest
-from openapi_client.models.customer_response import CustomerResponse
-from openapi_client.models.instrument_category_request import InstrumentCategoryRequest
-from openapi_client.models.work_request import WorkRequest
-from openapi_client.models.work_response import WorkResponse
+
+from openapi_client.retry import RetryPolicy
+
+# Pydantic, the generated API client, its API classes and models cost most of
+# the import time (pydantic builds their validators), so they and the helper
+# modules built on them are loaded when a call first needs them.
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+    from openapi_client.api.authenticate_api import AuthenticateApi
+    from openapi_client.api.customerinstruments_api import CustomerinstrumentsApi
+    from openapi_client.api.customers_api import CustomersApi
+    from openapi_client.api.instrumentcategories_api import InstrumentcategoriesApi
+    from openapi_client.api.works_api import WorksApi
+    from openapi_client.api_client import ApiClient
+    from openapi_client.instrumentation import RequestHook, RequestMetrics
+    from openapi_client.models.authentication_response import AuthenticationResponse
+    from openapi_client.models.created_response import CreatedResponse
+    from openapi_client.models.customer_instrument_request import (
+        CustomerInstrumentRequest,
+    )
+    from openapi_client.models.customer_instrument_response import (
+        CustomerInstrumentResponse,
+    )
+    from openapi_client.models.customer_request import CustomerRequest
+    from openapi_client.models.customer_response import CustomerResponse
+    from openapi_client.models.instrument_category_request import (
+        InstrumentCategoryRequest,
+    )
+    from openapi_client.models.work_request import WorkRequest
+    from openapi_client.models.work_response import WorkResponse
+    from openapi_client.rate_limiter import RateLimiter
+    from openapi_client.retry import RetryStats
+    from openapi_client.transport import Transport
+    from pymetquay.bulk import BulkReport, ResultCallback
+    from pymetquay.cache import ResponseCache
+    from pymetquay.columnar import ColumnarResult
+    from pymetquay.proxy import LazyRecord
+    from pymetquay.token_cache import FileTokenCache
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
+M = TypeVar("M", bound="BaseModel")
 
 _TOKEN_REFRESH_MARGIN_SECONDS = 120
+_BACKGROUND_REFRESH_LEAD_SECONDS = 30
+_BACKGROUND_RETRY_SECONDS = 10
 _DEFAULT_TOKEN_TTL = 900
 _DEFAULT_PAGE_LIMIT = 50
+_DEFAULT_BULK_CONCURRENCY = 4
+_RATE_LIMIT_PER_MINUTE = 100
+_RATE_LIMIT_BURST = 1
+_DEFAULT_RETRY_POLICY = RetryPolicy()
+
+
+def _resolve_settings(
+    access_key: Optional[str],
+    secret_key: Optional[str],
+    host: Optional[str],
+    dotenv_path: Optional[str],
+) -> Tuple[str, str, str]:
+    """Resolve credentials and host from arguments, environment or ``.env``."""
+    from dotenv import load_dotenv
+
+    load_dotenv(dotenv_path=dotenv_path)
+
+    resolved_access_key = (
+        access_key
+        or os.environ.get("METQUAY_ACCESS_KEY")
+        or os.environ.get("ACCESS_KEY", "")
+    )
+    resolved_secret_key = (
+        secret_key
+        or os.environ.get("METQUAY_SECRET_KEY")
+        or os.environ.get("SECRET_KEY", "")
+    )
+    metquay_host = (
+        host
+        or os.environ.get("METQUAY_HOST")
+        or os.environ.get("HOST", "johnsongage.metquay.co")
+    )
+
+    if not resolved_access_key or not resolved_secret_key:
+        raise ValueError(
+            "Metquay credentials required. Provide access_key/secret_key "
+            "arguments or set METQUAY_ACCESS_KEY/METQUAY_SECRET_KEY (or "
+            "ACCESS_KEY/SECRET_KEY) environment variables (or in a .env file)."
+        )
+    return resolved_access_key, resolved_secret_key, metquay_host
+
+
+def _api_base_url(host: str) -> str:
+    """API root for ``host``; a host given as a full URL keeps its scheme.
+
+    ``"acme.metquay.co"`` becomes ``https://acme.metquay.co/api/v1``, while
+    ``"http://127.0.0.1:8080"`` (a local stand-in server) is used as is.
+    """
+    if "://" in host:
+        return host.rstrip("/") + "/api/v1"
+    return f"https://{host}/api/v1"
+
+
+class _UnreadResponse:
+    """A sent response whose body the generated method must not read."""
+
+    def __init__(self, response: Any) -> None:
+        self.response = response
+
+    def read(self) -> None:
+        pass
+
+
+class _UnreadResponses:
+    """Stands in for the ``ApiClient`` of a generated API class.
+
+    The API's ``*_with_http_info`` methods then validate their arguments and
+    send the request as usual, but return ``(response, response_types_map)``
+    with the body unread, so the caller can parse it its own way while error
+    statuses still map to the generated response types.
+    """
+
+    def __init__(self, api_client: ApiClient) -> None:
+        self._api_client = api_client
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._api_client, name)
+
+    def call_api(self, *args: Any, **kwargs: Any) -> _UnreadResponse:
+        return _UnreadResponse(self._api_client.call_api(*args, **kwargs))
+
+    def response_deserialize(
+        self,
+        response_data: _UnreadResponse,
+        response_types_map: Dict[str, Optional[str]],
+    ) -> Tuple[Any, Dict[str, Optional[str]]]:
+        return response_data.response, response_types_map
 
 
 class MetquayClient:
@@ -58,44 +184,99 @@ class MetquayClient:
         host: Optional[str] = None,
         *,
         dotenv_path: Optional[str] = None,
+        rate_limit_per_minute: Optional[float] = _RATE_LIMIT_PER_MINUTE,
+        rate_limit_burst: int = _RATE_LIMIT_BURST,
+        retry_policy: Optional[RetryPolicy] = _DEFAULT_RETRY_POLICY,
+        auto_refresh: bool = False,
+        token_cache: Optional[FileTokenCache] = None,
+        response_cache: Optional[ResponseCache] = None,
+        request_hooks: Sequence[RequestHook] = (),
+        transport: Optional[Transport] = None,
     ) -> None:
-        load_dotenv(dotenv_path=dotenv_path)
+        from openapi_client.api_client import ApiClient
+        from openapi_client.configuration import Configuration
+        from pymetquay.token_cache import FileTokenCache
 
-        self._access_key = (
-            access_key
-            or os.environ.get("METQUAY_ACCESS_KEY")
-            or os.environ.get("ACCESS_KEY", "")
+        self._access_key, self._secret_key, metquay_host = _resolve_settings(
+            access_key, secret_key, host, dotenv_path
         )
-        self._secret_key = (
-            secret_key
-            or os.environ.get("METQUAY_SECRET_KEY")
-            or os.environ.get("SECRET_KEY", "")
-        )
-        metquay_host = (
-            host
-            or os.environ.get("METQUAY_HOST")
-            or os.environ.get("HOST", "johnsongage.metquay.co")
-        )
-
-        if not self._access_key or not self._secret_key:
-            raise ValueError(
-                "Metquay credentials required. Provide access_key/secret_key "
-                "arguments or set METQUAY_ACCESS_KEY/METQUAY_SECRET_KEY (or "
-                "ACCESS_KEY/SECRET_KEY) environment variables (or in a .env file)."
-            )
 
-        self._configuration = Configuration(host=f"https://{metquay_host}/api/v1")
+        self._configuration = Configuration(host=_api_base_url(metquay_host))
+        self._configuration.rate_limit_per_minute = rate_limit_per_minute
+        self._configuration.rate_limit_burst = rate_limit_burst
+        self._configuration.retry_policy = retry_policy
+        self._configuration.request_hooks = list(request_hooks)
+        if transport is not None:
+            self._configuration.pool_manager = transport.pool_manager
         self._api_client = ApiClient(self._configuration)
-
-        self._auth_api = AuthenticateApi(self._api_client)
-        self._customers_api = CustomersApi(self._api_client)
-        self._instruments_api = CustomerinstrumentsApi(self._api_client)
-        self._categories_api = InstrumentcategoriesApi(self._api_client)
-        self._works_api = WorksApi(self._api_client)
+        self.transport = transport
+        """Connection pool shared with other clients, if one was given."""
 
         self._token: Optional[str] = None
         self._token_acquired_at: float = 0.0
         self._token_ttl: int = _DEFAULT_TOKEN_TTL
+        self._auth_lock = threading.RLock()
+        self._token_cache = token_cache
+        self._token_cache_key = FileTokenCache.key(metquay_host, self._access_key)
+        self._token_from_cache = False
+        if token_cache is not None:
+            self._api_client.on_unauthorized = self._token_rejected
+
+        self._auto_refresh = auto_refresh
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._refresh_stop = threading.Event()
+
+        self.response_cache = response_cache
+        """Cache for single-page ``list_*`` calls, if enabled."""
+
+    # -- Generated API classes, created on first use ----------------------
+
+    @functools.cached_property
+    def _auth_api(self) -> AuthenticateApi:
+        from openapi_client.api.authenticate_api import AuthenticateApi
+
+        return AuthenticateApi(self._api_client)
+
+    @functools.cached_property
+    def _customers_api(self) -> CustomersApi:
+        from openapi_client.api.customers_api import CustomersApi
+
+        return CustomersApi(self._api_client)
+
+    @functools.cached_property
+    def _instruments_api(self) -> CustomerinstrumentsApi:
+        from openapi_client.api.customerinstruments_api import CustomerinstrumentsApi
+
+        return CustomerinstrumentsApi(self._api_client)
+
+    @functools.cached_property
+    def _categories_api(self) -> InstrumentcategoriesApi:
+        from openapi_client.api.instrumentcategories_api import (
+            InstrumentcategoriesApi,
+        )
+
+        return InstrumentcategoriesApi(self._api_client)
+
+    @functools.cached_property
+    def _works_api(self) -> WorksApi:
+        from openapi_client.api.works_api import WorksApi
+
+        return WorksApi(self._api_client)
+
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        """Token bucket shared by every request this client makes, if enabled."""
+        return self._api_client.rate_limiter
+
+    @property
+    def retry_stats(self) -> RetryStats:
+        """Retries made so far and total time spent backing off."""
+        return self._api_client.retry_stats
+
+    @property
+    def metrics(self) -> RequestMetrics:
+        """Per-operation latency, phase timings, statuses and response sizes."""
+        return self._api_client.metrics
 
     # -- Context manager ---------------------------------------------------
 
@@ -103,68 +284,513 @@ class MetquayClient:
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-        pass
+        self.close()
+
+    def close(self) -> None:
+        """Stop background token renewal and close pooled connections.
+
+        A shared :class:`~openapi_client.transport.Transport` is left open
+        for the other clients using it; close it once they are all done.
+        """
+        self._refresh_stop.set()
+        thread = self._refresh_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        self._refresh_thread = None
+        self._api_client.close()
 
     # -- Authentication ----------------------------------------------------
 
-    def _is_token_valid(self) -> bool:
+    def _token_remaining(self) -> float:
+        """Seconds until the current token expires (0 if there is none)."""
         if self._token is None:
-            return False
+            return 0.0
         elapsed = time.monotonic() - self._token_acquired_at
-        remaining = self._token_ttl - elapsed
-        return remaining > _TOKEN_REFRESH_MARGIN_SECONDS
+        return max(0.0, self._token_ttl - elapsed)
+
+    def _is_token_valid(self) -> bool:
+        return self._token_remaining() > _TOKEN_REFRESH_MARGIN_SECONDS
 
     def _ensure_authenticated(self) -> None:
         if self._is_token_valid():
             return
-        self.authenticate()
+        with self._auth_lock:
+            # Another thread may have refreshed while we waited for the lock.
+            if self._is_token_valid() or self._load_cached_token():
+                return
+            self.authenticate(force=True)
+
+    def _load_cached_token(self) -> bool:
+        """Adopt a still-valid token from the token cache, if one is set."""
+        if self._token_cache is None:
+            return False
+        try:
+            cached = self._token_cache.get(self._token_cache_key)
+        except OSError:
+            logger.warning("Could not read the token cache", exc_info=True)
+            return False
+        if cached is None:
+            return False
+        token, acquired_at, expires_in = cached
+        age = max(0.0, time.time() - acquired_at)
+        if expires_in - age <= _TOKEN_REFRESH_MARGIN_SECONDS:
+            return False
 
-    def authenticate(self) -> AuthenticationResponse:
-        """Authenticate and obtain a new bearer token."""
+        self._token = token
+        self._token_from_cache = True
+        self._token_acquired_at = time.monotonic() - age
+        self._token_ttl = expires_in
+        self._configuration.access_token = token
+        logger.info("Reusing cached token (expires in %d seconds)", expires_in - age)
+        if self._auto_refresh:
+            self._start_refresh_thread()
+        return True
+
+    def _token_rejected(self, authorization: str) -> bool:
+        """Replace a cached token the API answered 401 to; True to resend.
+
+        A token adopted from the token cache may have been revoked since it
+        was stored.  Its entry is dropped and a new token requested once; a
+        token this client obtained itself is not retried.
+        """
+        with self._auth_lock:
+            if authorization != "Bearer {0}".format(self._token):
+                # Another request already replaced the rejected token.
+                return self._token is not None
+            if not self._token_from_cache or self._token_cache is None:
+                return False
+            logger.warning("Cached token was rejected; authenticating again")
+            try:
+                self._token_cache.clear(self._token_cache_key)
+            except OSError:
+                logger.warning("Could not clear the token cache", exc_info=True)
+            self.authenticate(force=True)
+            return True
+
+    def authenticate(self, *, force: bool = False) -> AuthenticationResponse:
+        """Authenticate and obtain a bearer token.
+
+        With a ``token_cache``, a still-valid cached token is adopted first and
+        no request is made; the response then reports its remaining lifetime.
+        ``force=True`` always requests a new token (and caches it).
+
+        Refreshes are serialized, so concurrent callers of
+        ``_ensure_authenticated`` trigger a single ``/authenticate`` request.
+        """
         if self._access_key is None:
             raise ValueError("Access key is required for authentication")
         if self._secret_key is None:
             raise ValueError("Secret key is required for authentication")
+        from openapi_client.models.authentication_request import (
+            AuthenticationRequest,
+        )
+        from openapi_client.models.authentication_response import (
+            AuthenticationResponse,
+        )
+
+        if not force:
+            with self._auth_lock:
+                if self._load_cached_token():
+                    return AuthenticationResponse.model_validate(
+                        {
+                            "accessToken": self._token,
+                            "tokenType": "bearer",
+                            "expiresIn": int(self._token_remaining()),
+                        }
+                    )
+
         request = AuthenticationRequest(
             accessKey=self._access_key,
             secretKey=self._secret_key,
         )
-        response: AuthenticationResponse = self._auth_api.get_access_token(request)
+        with self._auth_lock:
+            response: AuthenticationResponse = self._auth_api.get_access_token(
+                request
+            )
 
-        self._token = response.access_token
-        self._token_acquired_at = time.monotonic()
-        self._token_ttl = response.expires_in or _DEFAULT_TOKEN_TTL
-        self._configuration.access_token = self._token
+            self._token = response.access_token
+            self._token_from_cache = False
+            self._token_acquired_at = time.monotonic()
+            self._token_ttl = response.expires_in or _DEFAULT_TOKEN_TTL
+            self._configuration.access_token = self._token
+            if self._token_cache is not None:
+                try:
+                    self._token_cache.set(
+                        self._token_cache_key,
+                        self._token,
+                        time.time(),
+                        self._token_ttl,
+                    )
+                except OSError:
+                    logger.warning("Could not write the token cache", exc_info=True)
 
         logger.info(
             "Authenticated successfully (token expires in %d seconds)",
             self._token_ttl,
         )
+        if self._auto_refresh:
+            self._start_refresh_thread()
         return response
 
+    # -- Background renewal ------------------------------------------------
+
+    def _start_refresh_thread(self) -> None:
+        with self._auth_lock:
+            if self._refresh_thread is not None or self._refresh_stop.is_set():
+                return
+            self._refresh_thread = threading.Thread(
+                target=self._refresh_loop,
+                name="pymetquay-token-refresh",
+                daemon=True,
+            )
+            self._refresh_thread.start()
+
+    def _refresh_loop(self) -> None:
+        """Renew the token shortly before it enters the refresh margin.
+
+        Runs until :meth:`close`.  Failures are logged and retried; callers
+        fall back to refreshing inline if the token does run out.
+        """
+        delay = self._next_refresh_delay()
+        while not self._refresh_stop.wait(delay):
+            try:
+                self.authenticate(force=True)
+            except Exception:
+                logger.warning("Background token refresh failed", exc_info=True)
+                delay = _BACKGROUND_RETRY_SECONDS
+            else:
+                delay = self._next_refresh_delay()
+
+    def _next_refresh_delay(self) -> float:
+        lead = _TOKEN_REFRESH_MARGIN_SECONDS + _BACKGROUND_REFRESH_LEAD_SECONDS
+        # Floor the delay so a token shorter-lived than ``lead`` cannot spin.
+        return max(_BACKGROUND_RETRY_SECONDS, self._token_remaining() - lead)
+
     # -- Generic pagination helper -----------------------------------------
 
-    def _paginate_all(
+    def _iter_pages(
         self,
         list_fn: Callable[..., List[T]],
         *,
+        first: int = 0,
         page_size: int = _DEFAULT_PAGE_LIMIT,
         **kwargs,
-    ) -> List[T]:
-        """Fetch all pages from a paginated list endpoint."""
-        all_records = []
-        offset = 0
+    ) -> Iterator[List[T]]:
+        """Yield successive pages from a paginated list endpoint.
+
+        Each page is requested only when the previous one has been consumed,
+        and the token is checked (and refreshed if needed) before every page.
+        """
+        offset = first
         while True:
             self._ensure_authenticated()
             page = list_fn(first=offset, limit=page_size, **kwargs)
-            all_records.extend(page)
+            if page:
+                yield page
             if len(page) < page_size:
-                break
+                return
             offset += len(page)
+
+    def _iter_streamed(
+        self,
+        list_fn: Callable[..., Iterator[T]],
+        *,
+        first: int = 0,
+        page_size: int = _DEFAULT_PAGE_LIMIT,
+        **kwargs,
+    ) -> Iterator[T]:
+        """Yield records from successive pages as each page streams in.
+
+        Like :meth:`_iter_pages` for a ``list_fn`` that returns an iterator
+        over one page's records rather than a list.
+        """
+        offset = first
+        while True:
+            self._ensure_authenticated()
+            count = 0
+            for record in list_fn(first=offset, limit=page_size, **kwargs):
+                count += 1
+                yield record
+            if count < page_size:
+                return
+            offset += count
+
+    def _paginate_all(
+        self,
+        list_fn: Callable[..., List[T]],
+        *,
+        page_size: int = _DEFAULT_PAGE_LIMIT,
+        concurrency: int = 1,
+        **kwargs,
+    ) -> List[T]:
+        """Fetch all pages from a paginated list endpoint.
+
+        With ``concurrency > 1`` several offset windows are fetched at once
+        from a thread pool; see :meth:`_paginate_all_concurrent`.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if concurrency > 1:
+            return self._paginate_all_concurrent(
+                list_fn, page_size=page_size, concurrency=concurrency, **kwargs
+            )
+        all_records: List[T] = []
+        for page in self._iter_pages(list_fn, page_size=page_size, **kwargs):
+            all_records.extend(page)
         return all_records
 
+    def _paginate_all_concurrent(
+        self,
+        list_fn: Callable[..., List[T]],
+        *,
+        page_size: int,
+        concurrency: int,
+        **kwargs,
+    ) -> List[T]:
+        """Fetch all pages with up to ``concurrency`` requests in flight.
+
+        Offset windows are submitted in order; request starts are paced by
+        the client's :class:`~openapi_client.rate_limiter.RateLimiter`.  The
+        first short page marks the end of the data: no further windows are
+        submitted, and any pages past that offset are discarded.  Records are
+        returned in offset order, exactly as the serial loop would return
+        them.
+        """
+        pages: Dict[int, List[T]] = {}
+        end_offset: Optional[int] = None
+        next_offset = 0
+
+        with ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="pymetquay-page"
+        ) as pool:
+            in_flight: Dict[Future[List[T]], int] = {}
+            try:
+                while True:
+                    while end_offset is None and len(in_flight) < concurrency:
+                        # Token refresh stays on the calling thread so the
+                        # workers never race each other to re-authenticate.
+                        self._ensure_authenticated()
+                        future = pool.submit(
+                            list_fn, first=next_offset, limit=page_size, **kwargs
+                        )
+                        in_flight[future] = next_offset
+                        next_offset += page_size
+                    if not in_flight:
+                        break
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        offset = in_flight.pop(future)
+                        page = future.result()
+                        pages[offset] = page
+                        if len(page) < page_size and (
+                            end_offset is None or offset < end_offset
+                        ):
+                            end_offset = offset
+            except BaseException:
+                for future in in_flight:
+                    future.cancel()
+                raise
+
+        all_records: List[T] = []
+        for offset in sorted(pages):
+            if end_offset is not None and offset > end_offset:
+                break
+            all_records.extend(pages[offset])
+        return all_records
+
+    # -- Response cache ----------------------------------------------------
+
+    def _list_page(
+        self,
+        endpoint: str,
+        list_with_info: Callable[..., Any],
+        *,
+        first: Optional[int],
+        limit: Optional[int],
+        workspace_code: Optional[str],
+    ) -> List[Any]:
+        """Fetch one page of ``endpoint``, through the response cache if set.
+
+        Only single-page ``list_*`` calls are cached; ``paginate_all`` and
+        the ``iter_*`` methods always read from the API, since a full dump
+        would just push every other page out of the cache.
+        """
+        cache = self.response_cache
+        key = (endpoint, workspace_code, first, limit)
+        generation = None
+        if cache is not None:
+            page = cache.get(key)
+            if page is not None:
+                return page
+            # A write that completes while this page is in flight makes the
+            # page stale; the cache then refuses it.
+            generation = cache.generation(endpoint)
+        self._ensure_authenticated()
+        response = list_with_info(
+            workspace_code=workspace_code, first=first, limit=limit
+        )
+        if cache is not None:
+            cache.put(key, response.data, len(response.raw_data), generation)
+        return response.data
+
+    def _call_list(
+        self, api: Any, operation: str, **kwargs: Any
+    ) -> Tuple[Any, Dict[str, Optional[str]]]:
+        """Send a list request with the generated ``operation`` of ``api``.
+
+        Returns the unread response and the operation's response types map.
+        Arguments are validated as for the generated list methods.
+        """
+        unread = type(api)(_UnreadResponses(self._api_client))
+        return getattr(unread, operation + "_with_http_info")(**kwargs)
+
+    def _raw_list_fn(
+        self, api: Any, operation: str, convert: Callable[[Any], List[T]]
+    ) -> Callable[..., List[T]]:
+        """A list call that hands the parsed JSON page to ``convert``.
+
+        Runs the same steps as the generated list methods (validate,
+        serialize, send, check the status) minus model validation.
+        """
+
+        def fetch(**kwargs: Any) -> List[T]:
+            response, response_types = self._call_list(api, operation, **kwargs)
+            response_types = {**response_types, "200": "object"}
+            response.read()
+            rows = self._api_client.response_deserialize(
+                response, response_types
+            ).data
+            return convert(rows)
+
+        return fetch
+
+    def _lazy_list_fn(
+        self, api: Any, operation: str, model: Type[M]
+    ) -> Callable[..., List[LazyRecord[M]]]:
+        """A list call returning pages of :class:`LazyRecord` proxies."""
+        from pymetquay.proxy import lazy_records
+
+        return self._raw_list_fn(
+            api, operation, functools.partial(lazy_records, model)
+        )
+
+    def _projected_list_fn(
+        self,
+        api: Any,
+        operation: str,
+        model: Type[BaseModel],
+        fields: Sequence[str],
+    ) -> Callable[..., List[Any]]:
+        """A list call returning pages of :func:`projection` records."""
+        from pymetquay.projection import project_rows, projection
+
+        projected = projection(model, fields)
+        return self._raw_list_fn(
+            api, operation, functools.partial(project_rows, projected)
+        )
+
+    def _streamed_list_fn(
+        self,
+        api: Any,
+        operation: str,
+        model: Type[BaseModel],
+        fields: Optional[Sequence[str]],
+    ) -> Callable[..., Iterator[Any]]:
+        """A list call yielding records as the response body is parsed.
+
+        See :meth:`~openapi_client.api_client.ApiClient.iter_response_items`.
+        """
+        from pymetquay.projection import project_rows, projection
+
+        projected = None if fields is None else projection(model, fields)
+
+        def fetch(**kwargs: Any) -> Iterator[Any]:
+            response, response_types = self._call_list(api, operation, **kwargs)
+            if projected is not None:
+                # Still a list type, so the rows are streamed as parsed JSON
+                # and each is projected as it arrives.
+                response_types = {**response_types, "200": "List[object]"}
+            items = self._api_client.iter_response_items(response, response_types)
+            if projected is None:
+                return items
+            return (project_rows(projected, [row])[0] for row in items)
+
+        return fetch
+
+    def _list_raw(
+        self,
+        fetch: Callable[..., List[T]],
+        *,
+        first: Optional[int],
+        limit: Optional[int],
+        workspace_code: Optional[str],
+        paginate_all: bool,
+        concurrency: int,
+    ) -> List[T]:
+        if paginate_all:
+            return self._paginate_all(
+                fetch, concurrency=concurrency, workspace_code=workspace_code
+            )
+        self._ensure_authenticated()
+        return fetch(first=first, limit=limit, workspace_code=workspace_code)
+
+    @contextlib.contextmanager
+    def _invalidates(self, endpoint: str) -> Iterator[None]:
+        """Drop cached pages of ``endpoint`` once a write to it completes.
+
+        Pages are dropped even when the write fails: an error response does
+        not prove the server left the data unchanged.
+        """
+        try:
+            yield
+        finally:
+            if self.response_cache is not None:
+                self.response_cache.invalidate(endpoint)
+
     # -- Customers ---------------------------------------------------------
 
+    def _project_customers(self, fields: Sequence[str]) -> Callable[..., List[Any]]:
+        """A list call deserializing only ``fields`` of each customer."""
+        from openapi_client.models.customer_response import CustomerResponse
+
+        return self._projected_list_fn(
+            self._customers_api, "get_customers", CustomerResponse, fields
+        )
+
+    def _stream_customers(
+        self, fields: Optional[Sequence[str]]
+    ) -> Callable[..., Iterator[Any]]:
+        """A list call streaming each customer as it is parsed."""
+        from openapi_client.models.customer_response import CustomerResponse
+
+        return self._streamed_list_fn(
+            self._customers_api, "get_customers", CustomerResponse, fields
+        )
+
+    @overload
+    def list_customers(
+        self,
+        *,
+        first: Optional[int] = ...,
+        limit: Optional[int] = ...,
+        workspace_code: Optional[str] = ...,
+        paginate_all: bool = ...,
+        concurrency: int = ...,
+        fields: None = ...,
+    ) -> List[CustomerResponse]: ...
+
+    @overload
+    def list_customers(
+        self,
+        *,
+        first: Optional[int] = ...,
+        limit: Optional[int] = ...,
+        workspace_code: Optional[str] = ...,
+        paginate_all: bool = ...,
+        concurrency: int = ...,
+        fields: Sequence[str],
+    ) -> List[Any]: ...
+
     def list_customers(
         self,
         *,
@@ -172,37 +798,256 @@ class MetquayClient:
         limit: Optional[int] = None,
         workspace_code: Optional[str] = None,
         paginate_all: bool = False,
-    ) -> List[CustomerResponse]:
-        """List customers, optionally auto-paginating all results."""
+        concurrency: int = 1,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Any]:
+        """List customers, optionally auto-paginating all results.
+
+        With ``paginate_all=True``, ``concurrency`` sets how many pages are
+        fetched in parallel (default: one at a time).
+
+        ``fields`` (field or API names) deserializes only those fields, into
+        a :func:`~pymetquay.projection.projection` of the model; the rest of
+        each record is skipped.  Projected pages are not served from the
+        response cache.
+        """
+        if fields is not None:
+            return self._list_raw(
+                self._project_customers(fields),
+                first=first,
+                limit=limit,
+                workspace_code=workspace_code,
+                paginate_all=paginate_all,
+                concurrency=concurrency,
+            )
         if paginate_all:
             return self._paginate_all(
                 self._customers_api.get_customers,
+                concurrency=concurrency,
                 workspace_code=workspace_code,
             )
-        self._ensure_authenticated()
-        return self._customers_api.get_customers(
+        return self._list_page(
+            "customers",
+            self._customers_api.get_customers_with_http_info,
+            first=first,
+            limit=limit,
             workspace_code=workspace_code,
+        )
+
+    def list_customers_lazy(
+        self,
+        *,
+        first: Optional[int] = None,
+        limit: Optional[int] = None,
+        workspace_code: Optional[str] = None,
+        paginate_all: bool = False,
+        concurrency: int = 1,
+    ) -> List[LazyRecord[CustomerResponse]]:
+        """Like :meth:`list_customers`, but returning :class:`LazyRecord` proxies.
+
+        Each field is validated the first time it is read; ``to_model()``
+        gives the full model.  Pages are not served from the response cache.
+        """
+        from openapi_client.models.customer_response import CustomerResponse
+
+        fetch = self._lazy_list_fn(
+            self._customers_api, "get_customers", CustomerResponse
+        )
+        return self._list_raw(
+            fetch,
             first=first,
             limit=limit,
+            workspace_code=workspace_code,
+            paginate_all=paginate_all,
+            concurrency=concurrency,
+        )
+
+    @overload
+    def iter_customers(
+        self,
+        *,
+        first: int = ...,
+        page_size: int = ...,
+        workspace_code: Optional[str] = ...,
+        stream: bool = ...,
+        fields: None = ...,
+    ) -> Iterator[CustomerResponse]: ...
+
+    @overload
+    def iter_customers(
+        self,
+        *,
+        first: int = ...,
+        page_size: int = ...,
+        workspace_code: Optional[str] = ...,
+        stream: bool = ...,
+        fields: Sequence[str],
+    ) -> Iterator[Any]: ...
+
+    def iter_customers(
+        self,
+        *,
+        first: int = 0,
+        page_size: int = _DEFAULT_PAGE_LIMIT,
+        workspace_code: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        stream: bool = False,
+    ) -> Iterator[Any]:
+        """Yield customers one at a time, fetching pages lazily.
+
+        With ``stream=True`` each record is yielded as soon as it has been
+        parsed from the response, instead of once its page is complete, so a
+        page is never held in memory whole and large ``page_size`` values
+        stay cheap.
+        """
+        if stream:
+            yield from self._iter_streamed(
+                self._stream_customers(fields),
+                first=first,
+                page_size=page_size,
+                workspace_code=workspace_code,
+            )
+            return
+        for page in self.iter_customer_pages(
+            first=first,
+            page_size=page_size,
+            workspace_code=workspace_code,
+            fields=fields,
+        ):
+            yield from page
+
+    @overload
+    def iter_customer_pages(
+        self,
+        *,
+        first: int = ...,
+        page_size: int = ...,
+        workspace_code: Optional[str] = ...,
+        fields: None = ...,
+    ) -> Iterator[List[CustomerResponse]]: ...
+
+    @overload
+    def iter_customer_pages(
+        self,
+        *,
+        first: int = ...,
+        page_size: int = ...,
+        workspace_code: Optional[str] = ...,
+        fields: Sequence[str],
+    ) -> Iterator[List[Any]]: ...
+
+    def iter_customer_pages(
+        self,
+        *,
+        first: int = 0,
+        page_size: int = _DEFAULT_PAGE_LIMIT,
+        workspace_code: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Iterator[List[Any]]:
+        """Yield customers page by page as each page is deserialized."""
+        list_fn: Callable[..., List[Any]] = self._customers_api.get_customers
+        if fields is not None:
+            list_fn = self._project_customers(fields)
+        return self._iter_pages(
+            list_fn,
+            first=first,
+            page_size=page_size,
+            workspace_code=workspace_code,
+        )
+
+    def list_customers_columnar(
+        self,
+        *,
+        page_size: int = _DEFAULT_PAGE_LIMIT,
+        workspace_code: Optional[str] = None,
+    ) -> ColumnarResult[CustomerResponse]:
+        """List all customers into a compact :class:`ColumnarResult`.
+
+        Pages are fetched one at a time and each page's models are dropped
+        once copied, so peak memory is the columns plus one page.
+        """
+        from openapi_client.models.customer_response import CustomerResponse
+        from pymetquay.columnar import ColumnarResult
+
+        return ColumnarResult.from_pages(
+            CustomerResponse,
+            self.iter_customer_pages(
+                page_size=page_size, workspace_code=workspace_code
+            ),
         )
 
     def create_customer(self, request: CustomerRequest) -> CreatedResponse:
         """Create a new customer."""
         self._ensure_authenticated()
-        return self._customers_api.create_customer(request)
+        with self._invalidates("customers"):
+            return self._customers_api.create_customer(request)
 
     def update_customer(self, metquay_id: int, request: CustomerRequest) -> None:
         """Update a customer by Metquay ID (full replacement)."""
         self._ensure_authenticated()
-        self._customers_api.update_customer(metquay_id, request)
+        with self._invalidates("customers"):
+            self._customers_api.update_customer(metquay_id, request)
 
     def delete_customer(self, metquay_id: int) -> None:
         """Delete a customer by Metquay ID."""
         self._ensure_authenticated()
-        self._customers_api.delete_customer(metquay_id)
+        with self._invalidates("customers"):
+            self._customers_api.delete_customer(metquay_id)
 
     # -- Customer instruments ----------------------------------------------
 
+    def _project_instruments(self, fields: Sequence[str]) -> Callable[..., List[Any]]:
+        """A list call deserializing only ``fields`` of each customer instrument."""
+        from openapi_client.models.customer_instrument_response import (
+            CustomerInstrumentResponse,
+        )
+
+        return self._projected_list_fn(
+            self._instruments_api,
+            "get_customer_instruments",
+            CustomerInstrumentResponse,
+            fields,
+        )
+
+    def _stream_instruments(
+        self, fields: Optional[Sequence[str]]
+    ) -> Callable[..., Iterator[Any]]:
+        """A list call streaming each customer instrument as it is parsed."""
+        from openapi_client.models.customer_instrument_response import (
+            CustomerInstrumentResponse,
+        )
+
+        return self._streamed_list_fn(
+            self._instruments_api,
+            "get_customer_instruments",
+            CustomerInstrumentResponse,
+            fields,
+        )
+
+    @overload
+    def list_instruments(
+        self,
+        *,
+        first: Optional[int] = ...,
+        limit: Optional[int] = ...,
+        workspace_code: Optional[str] = ...,
+        paginate_all: bool = ...,
+        concurrency: int = ...,
+        fields: None = ...,
+    ) -> List[CustomerInstrumentResponse]: ...
+
+    @overload
+    def list_instruments(
+        self,
+        *,
+        first: Optional[int] = ...,
+        limit: Optional[int] = ...,
+        workspace_code: Optional[str] = ...,
+        paginate_all: bool = ...,
+        concurrency: int = ...,
+        fields: Sequence[str],
+    ) -> List[Any]: ...
+
     def list_instruments(
         self,
         *,
@@ -210,36 +1055,208 @@ class MetquayClient:
         limit: Optional[int] = None,
         workspace_code: Optional[str] = None,
         paginate_all: bool = False,
-    ) -> List[CustomerInstrumentResponse]:
-        """List customer instruments, optionally auto-paginating all results."""
+        concurrency: int = 1,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Any]:
+        """List customer instruments, optionally auto-paginating all results.
+
+        With ``paginate_all=True``, ``concurrency`` sets how many pages are
+        fetched in parallel (default: one at a time).
+
+        ``fields`` (field or API names) deserializes only those fields, into
+        a :func:`~pymetquay.projection.projection` of the model; the rest of
+        each record is skipped.  Projected pages are not served from the
+        response cache.
+        """
+        if fields is not None:
+            return self._list_raw(
+                self._project_instruments(fields),
+                first=first,
+                limit=limit,
+                workspace_code=workspace_code,
+                paginate_all=paginate_all,
+                concurrency=concurrency,
+            )
         if paginate_all:
             return self._paginate_all(
                 self._instruments_api.get_customer_instruments,
+                concurrency=concurrency,
                 workspace_code=workspace_code,
             )
-        self._ensure_authenticated()
-        return self._instruments_api.get_customer_instruments(
+        return self._list_page(
+            "instruments",
+            self._instruments_api.get_customer_instruments_with_http_info,
+            first=first,
+            limit=limit,
             workspace_code=workspace_code,
+        )
+
+    def list_instruments_lazy(
+        self,
+        *,
+        first: Optional[int] = None,
+        limit: Optional[int] = None,
+        workspace_code: Optional[str] = None,
+        paginate_all: bool = False,
+        concurrency: int = 1,
+    ) -> List[LazyRecord[CustomerInstrumentResponse]]:
+        """Like :meth:`list_instruments`, but returning :class:`LazyRecord` proxies.
+
+        Each field is validated the first time it is read; ``to_model()``
+        gives the full model.  Pages are not served from the response cache.
+        """
+        from openapi_client.models.customer_instrument_response import (
+            CustomerInstrumentResponse,
+        )
+
+        fetch = self._lazy_list_fn(
+            self._instruments_api,
+            "get_customer_instruments",
+            CustomerInstrumentResponse,
+        )
+        return self._list_raw(
+            fetch,
             first=first,
             limit=limit,
+            workspace_code=workspace_code,
+            paginate_all=paginate_all,
+            concurrency=concurrency,
+        )
+
+    @overload
+    def iter_instruments(
+        self,
+        *,
+        first: int = ...,
+        page_size: int = ...,
+        workspace_code: Optional[str] = ...,
+        stream: bool = ...,
+        fields: None = ...,
+    ) -> Iterator[CustomerInstrumentResponse]: ...
+
+    @overload
+    def iter_instruments(
+        self,
+        *,
+        first: int = ...,
+        page_size: int = ...,
+        workspace_code: Optional[str] = ...,
+        stream: bool = ...,
+        fields: Sequence[str],
+    ) -> Iterator[Any]: ...
+
+    def iter_instruments(
+        self,
+        *,
+        first: int = 0,
+        page_size: int = _DEFAULT_PAGE_LIMIT,
+        workspace_code: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        stream: bool = False,
+    ) -> Iterator[Any]:
+        """Yield customer instruments one at a time, fetching pages lazily.
+
+        ``stream`` works as in :meth:`iter_customers`.
+        """
+        if stream:
+            yield from self._iter_streamed(
+                self._stream_instruments(fields),
+                first=first,
+                page_size=page_size,
+                workspace_code=workspace_code,
+            )
+            return
+        for page in self.iter_instrument_pages(
+            first=first,
+            page_size=page_size,
+            workspace_code=workspace_code,
+            fields=fields,
+        ):
+            yield from page
+
+    @overload
+    def iter_instrument_pages(
+        self,
+        *,
+        first: int = ...,
+        page_size: int = ...,
+        workspace_code: Optional[str] = ...,
+        fields: None = ...,
+    ) -> Iterator[List[CustomerInstrumentResponse]]: ...
+
+    @overload
+    def iter_instrument_pages(
+        self,
+        *,
+        first: int = ...,
+        page_size: int = ...,
+        workspace_code: Optional[str] = ...,
+        fields: Sequence[str],
+    ) -> Iterator[List[Any]]: ...
+
+    def iter_instrument_pages(
+        self,
+        *,
+        first: int = 0,
+        page_size: int = _DEFAULT_PAGE_LIMIT,
+        workspace_code: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Iterator[List[Any]]:
+        """Yield customer instruments page by page as each page is deserialized."""
+        list_fn: Callable[..., List[Any]] = (
+            self._instruments_api.get_customer_instruments
+        )
+        if fields is not None:
+            list_fn = self._project_instruments(fields)
+        return self._iter_pages(
+            list_fn,
+            first=first,
+            page_size=page_size,
+            workspace_code=workspace_code,
+        )
+
+    def list_instruments_columnar(
+        self,
+        *,
+        page_size: int = _DEFAULT_PAGE_LIMIT,
+        workspace_code: Optional[str] = None,
+    ) -> ColumnarResult[CustomerInstrumentResponse]:
+        """List all customer instruments into a compact :class:`ColumnarResult`.
+
+        Pages are fetched one at a time and each page's models are dropped
+        once copied, so peak memory is the columns plus one page.
+        """
+        from openapi_client.models.customer_instrument_response import (
+            CustomerInstrumentResponse,
+        )
+        from pymetquay.columnar import ColumnarResult
+
+        return ColumnarResult.from_pages(
+            CustomerInstrumentResponse,
+            self.iter_instrument_pages(
+                page_size=page_size, workspace_code=workspace_code
+            ),
         )
 
     def create_instrument(self, request: CustomerInstrumentRequest) -> CreatedResponse:
         """Register a new customer instrument."""
         self._ensure_authenticated()
-        return self._instruments_api.create_customer_instrument(request)
+        with self._invalidates("instruments"):
+            return self._instruments_api.create_customer_instrument(request)
 
     def update_instrument(
         self, metquay_id: int, request: CustomerInstrumentRequest
     ) -> None:
         """Update a customer instrument by Metquay ID."""
         self._ensure_authenticated()
-        self._instruments_api.update_customer_instrument(metquay_id, request)
+        with self._invalidates("instruments"):
+            self._instruments_api.update_customer_instrument(metquay_id, request)
 
     def delete_instrument(self, metquay_id: int) -> None:
         """Delete a customer instrument by Metquay ID."""
         self._ensure_authenticated()
-        self._instruments_api.delete_customer_instrument(metquay_id)
+        with self._invalidates("instruments"):
+            self._instruments_api.delete_customer_instrument(metquay_id)
 
     # -- Instrument categories ---------------------------------------------
     # NOTE: The generated API has no list/get endpoint for instrument
@@ -266,6 +1283,48 @@ class MetquayClient:
 
     # -- Works -------------------------------------------------------------
 
+    def _project_works(self, fields: Sequence[str]) -> Callable[..., List[Any]]:
+        """A list call deserializing only ``fields`` of each work."""
+        from openapi_client.models.work_response import WorkResponse
+
+        return self._projected_list_fn(
+            self._works_api, "get_works", WorkResponse, fields
+        )
+
+    def _stream_works(
+        self, fields: Optional[Sequence[str]]
+    ) -> Callable[..., Iterator[Any]]:
+        """A list call streaming each work as it is parsed."""
+        from openapi_client.models.work_response import WorkResponse
+
+        return self._streamed_list_fn(
+            self._works_api, "get_works", WorkResponse, fields
+        )
+
+    @overload
+    def list_works(
+        self,
+        *,
+        first: Optional[int] = ...,
+        limit: Optional[int] = ...,
+        workspace_code: Optional[str] = ...,
+        paginate_all: bool = ...,
+        concurrency: int = ...,
+        fields: None = ...,
+    ) -> List[WorkResponse]: ...
+
+    @overload
+    def list_works(
+        self,
+        *,
+        first: Optional[int] = ...,
+        limit: Optional[int] = ...,
+        workspace_code: Optional[str] = ...,
+        paginate_all: bool = ...,
+        concurrency: int = ...,
+        fields: Sequence[str],
+    ) -> List[Any]: ...
+
     def list_works(
         self,
         *,
@@ -273,26 +1332,392 @@ class MetquayClient:
         limit: Optional[int] = None,
         workspace_code: Optional[str] = None,
         paginate_all: bool = False,
-    ) -> List[WorkResponse]:
-        """List works, optionally auto-paginating all results."""
+        concurrency: int = 1,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Any]:
+        """List works, optionally auto-paginating all results.
+
+        With ``paginate_all=True``, ``concurrency`` sets how many pages are
+        fetched in parallel (default: one at a time).
+
+        ``fields`` (field or API names) deserializes only those fields, into
+        a :func:`~pymetquay.projection.projection` of the model; the rest of
+        each record is skipped.  Projected pages are not served from the
+        response cache.
+        """
+        if fields is not None:
+            return self._list_raw(
+                self._project_works(fields),
+                first=first,
+                limit=limit,
+                workspace_code=workspace_code,
+                paginate_all=paginate_all,
+                concurrency=concurrency,
+            )
         if paginate_all:
             return self._paginate_all(
                 self._works_api.get_works,
+                concurrency=concurrency,
                 workspace_code=workspace_code,
             )
-        self._ensure_authenticated()
-        return self._works_api.get_works(
+        return self._list_page(
+            "works",
+            self._works_api.get_works_with_http_info,
+            first=first,
+            limit=limit,
             workspace_code=workspace_code,
+        )
+
+    def list_works_lazy(
+        self,
+        *,
+        first: Optional[int] = None,
+        limit: Optional[int] = None,
+        workspace_code: Optional[str] = None,
+        paginate_all: bool = False,
+        concurrency: int = 1,
+    ) -> List[LazyRecord[WorkResponse]]:
+        """Like :meth:`list_works`, but returning :class:`LazyRecord` proxies.
+
+        Each field is validated the first time it is read; ``to_model()``
+        gives the full model.  Pages are not served from the response cache.
+        """
+        from openapi_client.models.work_response import WorkResponse
+
+        fetch = self._lazy_list_fn(
+            self._works_api, "get_works", WorkResponse
+        )
+        return self._list_raw(
+            fetch,
             first=first,
             limit=limit,
+            workspace_code=workspace_code,
+            paginate_all=paginate_all,
+            concurrency=concurrency,
+        )
+
+    @overload
+    def iter_works(
+        self,
+        *,
+        first: int = ...,
+        page_size: int = ...,
+        workspace_code: Optional[str] = ...,
+        stream: bool = ...,
+        fields: None = ...,
+    ) -> Iterator[WorkResponse]: ...
+
+    @overload
+    def iter_works(
+        self,
+        *,
+        first: int = ...,
+        page_size: int = ...,
+        workspace_code: Optional[str] = ...,
+        stream: bool = ...,
+        fields: Sequence[str],
+    ) -> Iterator[Any]: ...
+
+    def iter_works(
+        self,
+        *,
+        first: int = 0,
+        page_size: int = _DEFAULT_PAGE_LIMIT,
+        workspace_code: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        stream: bool = False,
+    ) -> Iterator[Any]:
+        """Yield works one at a time, fetching pages lazily.
+
+        ``stream`` works as in :meth:`iter_customers`.
+        """
+        if stream:
+            yield from self._iter_streamed(
+                self._stream_works(fields),
+                first=first,
+                page_size=page_size,
+                workspace_code=workspace_code,
+            )
+            return
+        for page in self.iter_work_pages(
+            first=first,
+            page_size=page_size,
+            workspace_code=workspace_code,
+            fields=fields,
+        ):
+            yield from page
+
+    @overload
+    def iter_work_pages(
+        self,
+        *,
+        first: int = ...,
+        page_size: int = ...,
+        workspace_code: Optional[str] = ...,
+        fields: None = ...,
+    ) -> Iterator[List[WorkResponse]]: ...
+
+    @overload
+    def iter_work_pages(
+        self,
+        *,
+        first: int = ...,
+        page_size: int = ...,
+        workspace_code: Optional[str] = ...,
+        fields: Sequence[str],
+    ) -> Iterator[List[Any]]: ...
+
+    def iter_work_pages(
+        self,
+        *,
+        first: int = 0,
+        page_size: int = _DEFAULT_PAGE_LIMIT,
+        workspace_code: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Iterator[List[Any]]:
+        """Yield works page by page as each page is deserialized."""
+        list_fn: Callable[..., List[Any]] = self._works_api.get_works
+        if fields is not None:
+            list_fn = self._project_works(fields)
+        return self._iter_pages(
+            list_fn,
+            first=first,
+            page_size=page_size,
+            workspace_code=workspace_code,
+        )
+
+    def list_works_columnar(
+        self,
+        *,
+        page_size: int = _DEFAULT_PAGE_LIMIT,
+        workspace_code: Optional[str] = None,
+    ) -> ColumnarResult[WorkResponse]:
+        """List all works into a compact :class:`ColumnarResult`.
+
+        Pages are fetched one at a time and each page's models are dropped
+        once copied, so peak memory is the columns plus one page.
+        """
+        from openapi_client.models.work_response import WorkResponse
+        from pymetquay.columnar import ColumnarResult
+
+        return ColumnarResult.from_pages(
+            WorkResponse,
+            self.iter_work_pages(page_size=page_size, workspace_code=workspace_code),
         )
 
     def create_work(self, request: WorkRequest) -> CreatedResponse:
         """Create a new work order."""
         self._ensure_authenticated()
-        return self._works_api.create_work(request)
+        with self._invalidates("works"):
+            return self._works_api.create_work(request)
 
     def update_work(self, metquay_id: int, request: WorkRequest) -> None:
         """Update a work order by Metquay ID."""
         self._ensure_authenticated()
-        self._works_api.update_work(metquay_id, request)
+        with self._invalidates("works"):
+            self._works_api.update_work(metquay_id, request)
+
+    # -- Bulk operations ---------------------------------------------------
+    #
+    # Each bulk method runs the matching single-entity call for every item on
+    # a thread pool (see ``pymetquay.bulk.run_bulk``).  Requests share the
+    # client's rate limiter; failures are reported, never retried by the bulk
+    # layer, and creates (POST) are never retried at all.
+
+    def bulk_create_customers(
+        self,
+        requests: Iterable[CustomerRequest],
+        *,
+        concurrency: int = _DEFAULT_BULK_CONCURRENCY,
+        on_result: Optional[ResultCallback] = None,
+    ) -> BulkReport[CustomerRequest]:
+        """Create many customers; ``report.created_ids`` lists the new IDs."""
+        from pymetquay.bulk import run_bulk
+
+        return run_bulk(
+            "create_customer",
+            self.create_customer,
+            requests,
+            concurrency=concurrency,
+            on_result=on_result,
+        )
+
+    def bulk_update_customers(
+        self,
+        updates: Iterable[Tuple[int, CustomerRequest]],
+        *,
+        concurrency: int = _DEFAULT_BULK_CONCURRENCY,
+        on_result: Optional[ResultCallback] = None,
+    ) -> BulkReport[Tuple[int, CustomerRequest]]:
+        """Update many customers from ``(metquay_id, request)`` pairs."""
+        from pymetquay.bulk import run_bulk
+
+        return run_bulk(
+            "update_customer",
+            lambda update: self.update_customer(*update),
+            updates,
+            concurrency=concurrency,
+            on_result=on_result,
+        )
+
+    def bulk_delete_customers(
+        self,
+        metquay_ids: Iterable[int],
+        *,
+        concurrency: int = _DEFAULT_BULK_CONCURRENCY,
+        on_result: Optional[ResultCallback] = None,
+    ) -> BulkReport[int]:
+        """Delete many customers by Metquay ID."""
+        from pymetquay.bulk import run_bulk
+
+        return run_bulk(
+            "delete_customer",
+            self.delete_customer,
+            metquay_ids,
+            concurrency=concurrency,
+            on_result=on_result,
+        )
+
+    def bulk_create_instruments(
+        self,
+        requests: Iterable[CustomerInstrumentRequest],
+        *,
+        concurrency: int = _DEFAULT_BULK_CONCURRENCY,
+        on_result: Optional[ResultCallback] = None,
+    ) -> BulkReport[CustomerInstrumentRequest]:
+        """Create many instruments; ``report.created_ids`` lists the new IDs."""
+        from pymetquay.bulk import run_bulk
+
+        return run_bulk(
+            "create_instrument",
+            self.create_instrument,
+            requests,
+            concurrency=concurrency,
+            on_result=on_result,
+        )
+
+    def bulk_update_instruments(
+        self,
+        updates: Iterable[Tuple[int, CustomerInstrumentRequest]],
+        *,
+        concurrency: int = _DEFAULT_BULK_CONCURRENCY,
+        on_result: Optional[ResultCallback] = None,
+    ) -> BulkReport[Tuple[int, CustomerInstrumentRequest]]:
+        """Update many instruments from ``(metquay_id, request)`` pairs."""
+        from pymetquay.bulk import run_bulk
+
+        return run_bulk(
+            "update_instrument",
+            lambda update: self.update_instrument(*update),
+            updates,
+            concurrency=concurrency,
+            on_result=on_result,
+        )
+
+    def bulk_delete_instruments(
+        self,
+        metquay_ids: Iterable[int],
+        *,
+        concurrency: int = _DEFAULT_BULK_CONCURRENCY,
+        on_result: Optional[ResultCallback] = None,
+    ) -> BulkReport[int]:
+        """Delete many instruments by Metquay ID."""
+        from pymetquay.bulk import run_bulk
+
+        return run_bulk(
+            "delete_instrument",
+            self.delete_instrument,
+            metquay_ids,
+            concurrency=concurrency,
+            on_result=on_result,
+        )
+
+    def bulk_create_instrument_categories(
+        self,
+        requests: Iterable[InstrumentCategoryRequest],
+        *,
+        concurrency: int = _DEFAULT_BULK_CONCURRENCY,
+        on_result: Optional[ResultCallback] = None,
+    ) -> BulkReport[InstrumentCategoryRequest]:
+        """Create many instrument categories; ``report.created_ids`` lists the new IDs."""
+        from pymetquay.bulk import run_bulk
+
+        return run_bulk(
+            "create_instrument_category",
+            self.create_instrument_category,
+            requests,
+            concurrency=concurrency,
+            on_result=on_result,
+        )
+
+    def bulk_update_instrument_categories(
+        self,
+        updates: Iterable[Tuple[int, InstrumentCategoryRequest]],
+        *,
+        concurrency: int = _DEFAULT_BULK_CONCURRENCY,
+        on_result: Optional[ResultCallback] = None,
+    ) -> BulkReport[Tuple[int, InstrumentCategoryRequest]]:
+        """Update many instrument categories from ``(metquay_id, request)`` pairs."""
+        from pymetquay.bulk import run_bulk
+
+        return run_bulk(
+            "update_instrument_category",
+            lambda update: self.update_instrument_category(*update),
+            updates,
+            concurrency=concurrency,
+            on_result=on_result,
+        )
+
+    def bulk_delete_instrument_categories(
+        self,
+        metquay_ids: Iterable[int],
+        *,
+        concurrency: int = _DEFAULT_BULK_CONCURRENCY,
+        on_result: Optional[ResultCallback] = None,
+    ) -> BulkReport[int]:
+        """Delete many instrument categories by Metquay ID."""
+        from pymetquay.bulk import run_bulk
+
+        return run_bulk(
+            "delete_instrument_category",
+            self.delete_instrument_category,
+            metquay_ids,
+            concurrency=concurrency,
+            on_result=on_result,
+        )
+
+    def bulk_create_works(
+        self,
+        requests: Iterable[WorkRequest],
+        *,
+        concurrency: int = _DEFAULT_BULK_CONCURRENCY,
+        on_result: Optional[ResultCallback] = None,
+    ) -> BulkReport[WorkRequest]:
+        """Create many works; ``report.created_ids`` lists the new IDs."""
+        from pymetquay.bulk import run_bulk
+
+        return run_bulk(
+            "create_work",
+            self.create_work,
+            requests,
+            concurrency=concurrency,
+            on_result=on_result,
+        )
+
+    def bulk_update_works(
+        self,
+        updates: Iterable[Tuple[int, WorkRequest]],
+        *,
+        concurrency: int = _DEFAULT_BULK_CONCURRENCY,
+        on_result: Optional[ResultCallback] = None,
+    ) -> BulkReport[Tuple[int, WorkRequest]]:
+        """Update many works from ``(metquay_id, request)`` pairs."""
+        from pymetquay.bulk import run_bulk
+
+        return run_bulk(
+            "update_work",
+            lambda update: self.update_work(*update),
+            updates,
+            concurrency=concurrency,
+            on_result=on_result,
+        )
@@ -0,0 +1,285 @@
+"""Compact column-oriented result sets for large listings.
+
+A full listing of ``WorkResponse`` models costs a few kilobytes per record:
+every record is a pydantic model with a dict of 44 fields.  A
+:class:`ColumnarResult` keeps one array per field instead::
+
+    from pymetquay import MetquayClient
+
+    with MetquayClient() as client:
+        works = client.list_works_columnar()
+        statuses = works.column("status")
+        work = works.to_model(0)  # a WorkResponse, built on demand
+
+Storage by field type:
+
+* strings -- dictionary encoded: each distinct value is stored once and rows
+  hold a 4-byte code into the table,
+* dates -- proleptic Gregorian ordinals in a 4-byte array,
+* integers and booleans -- typed arrays plus a null marker,
+* anything else (lists, int-or-float unions) -- a plain list.
+"""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from datetime import date
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from pydantic import BaseModel
+
+M = TypeVar("M", bound=BaseModel)
+
+
+class _ObjectColumn:
+    kind = "object"
+
+    def __init__(self) -> None:
+        self.values: List[Any] = []
+
+    def append(self, value: Any) -> None:
+        self.values.append(value)
+
+    def __getitem__(self, index: int) -> Any:
+        return self.values[index]
+
+    def freeze(self) -> None:
+        pass
+
+
+class _StrColumn:
+    """Dictionary-encoded strings; code 0 is None."""
+
+    kind = "str"
+
+    def __init__(self) -> None:
+        self.codes = array("I")
+        self.values: List[Optional[str]] = [None]
+        self._lookup: Optional[Dict[str, int]] = {}
+
+    def append(self, value: Optional[str]) -> None:
+        if value is None:
+            self.codes.append(0)
+            return
+        assert self._lookup is not None, "column is frozen"
+        code = self._lookup.get(value)
+        if code is None:
+            code = self._lookup[value] = len(self.values)
+            self.values.append(value)
+        self.codes.append(code)
+
+    def __getitem__(self, index: int) -> Optional[str]:
+        return self.values[self.codes[index]]
+
+    def freeze(self) -> None:
+        # The reverse lookup is only needed while building.
+        self._lookup = None
+
+
+class _DateColumn:
+    """Dates as ordinals; 0 is None (ordinal 1 is 0001-01-01)."""
+
+    kind = "date"
+
+    def __init__(self) -> None:
+        self.ordinals = array("i")
+
+    def append(self, value: Optional[date]) -> None:
+        self.ordinals.append(0 if value is None else value.toordinal())
+
+    def __getitem__(self, index: int) -> Optional[date]:
+        ordinal = self.ordinals[index]
+        return date.fromordinal(ordinal) if ordinal else None
+
+    def freeze(self) -> None:
+        pass
+
+
+class _IntColumn:
+    kind = "int"
+
+    def __init__(self) -> None:
+        self.ints = array("q")
+        self.nulls = bytearray()
+
+    def append(self, value: Optional[int]) -> None:
+        self.ints.append(0 if value is None else value)
+        self.nulls.append(value is None)
+
+    def __getitem__(self, index: int) -> Optional[int]:
+        return None if self.nulls[index] else self.ints[index]
+
+    def freeze(self) -> None:
+        pass
+
+
+class _BoolColumn:
+    """Booleans as signed bytes; -1 is None."""
+
+    kind = "bool"
+
+    def __init__(self) -> None:
+        self.flags = array("b")
+
+    def append(self, value: Optional[bool]) -> None:
+        self.flags.append(-1 if value is None else int(value))
+
+    def __getitem__(self, index: int) -> Optional[bool]:
+        flag = self.flags[index]
+        return None if flag < 0 else bool(flag)
+
+    def freeze(self) -> None:
+        pass
+
+
+_Column = Union[_ObjectColumn, _StrColumn, _DateColumn, _IntColumn, _BoolColumn]
+
+_COLUMN_TYPES: Dict[type, Type[Any]] = {
+    str: _StrColumn,
+    date: _DateColumn,
+    bool: _BoolColumn,
+    int: _IntColumn,
+}
+
+
+def _column_for(annotation: Any) -> _Column:
+    # pymetquay.entities loads the response models, which the client module
+    # (and so this one) must not do at import time.
+    from pymetquay.entities import base_types
+
+    types = base_types(annotation)
+    if len(types) == 1:
+        column_type = _COLUMN_TYPES.get(next(iter(types)))
+        if column_type is not None:
+            return column_type()
+    return _ObjectColumn()
+
+
+class ColumnarResult(Generic[M]):
+    """Records of one response model, stored column by column.
+
+    Rows are addressed by position (negative indexes count from the end).
+    Values come back as the model would hold them: ``str``, ``date``,
+    ``int``, ``bool`` or None.  Build one with :meth:`from_records` or
+    :meth:`from_pages`; it cannot be appended to afterwards.
+    """
+
+    def __init__(self, model: Type[M]) -> None:
+        self.model = model
+        self.fields: Tuple[str, ...] = tuple(model.model_fields)
+        """Field names (not API aliases), in model order."""
+        self._columns: Dict[str, _Column] = {
+            name: _column_for(info.annotation)
+            for name, info in model.model_fields.items()
+        }
+        self._length = 0
+
+    @classmethod
+    def from_records(cls, model: Type[M], records: Iterable[M]) -> ColumnarResult[M]:
+        """Copy ``records`` into columns.
+
+        ``records`` is consumed lazily, so the models can be released as
+        they are copied.
+        """
+        result = cls(model)
+        columns = list(result._columns.items())
+        for record in records:
+            for name, column in columns:
+                column.append(getattr(record, name))
+            result._length += 1
+        for _, column in columns:
+            column.freeze()
+        return result
+
+    @classmethod
+    def from_pages(cls, model: Type[M], pages: Iterable[List[M]]) -> ColumnarResult[M]:
+        """Build from an ``iter_*_pages`` iterator, one page in memory at a time."""
+        return cls.from_records(model, (record for page in pages for record in page))
+
+    # -- Access ------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _position(self, index: int) -> int:
+        return range(self._length)[index]
+
+    def _column(self, name: str) -> _Column:
+        try:
+            return self._columns[name]
+        except KeyError:
+            raise KeyError(
+                "{0} has no field {1!r}".format(self.model.__name__, name)
+            ) from None
+
+    def value(self, index: int, name: str) -> Any:
+        """Return one field of one row."""
+        return self._column(name)[self._position(index)]
+
+    def column(self, name: str) -> List[Any]:
+        """Return every value of field ``name``, in row order."""
+        column = self._column(name)
+        return [column[i] for i in range(self._length)]
+
+    def kind(self, name: str) -> str:
+        """Storage used for field ``name``: str, date, int, bool or object."""
+        return self._column(name).kind
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """Return one row as a dict keyed by field name."""
+        position = self._position(index)
+        return {name: column[position] for name, column in self._columns.items()}
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        return self.row(index)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for position in range(self._length):
+            yield self.row(position)
+
+    def to_model(self, index: int) -> M:
+        """Rebuild the model for one row.
+
+        The values were validated when the original model was built, so the
+        model is constructed without validating them again.  Only fields
+        that are not None count as set.
+        """
+        values = {
+            name: value for name, value in self.row(index).items() if value is not None
+        }
+        return self.model.model_construct(**values)
+
+    def iter_models(self) -> Iterator[M]:
+        for position in range(self._length):
+            yield self.to_model(position)
+
+    def to_models(self) -> List[M]:
+        return list(self.iter_models())
+
+    def memory_footprint(self) -> int:
+        """Approximate bytes held by the columns, string tables included."""
+        size = sys.getsizeof(self._columns)
+        for column in self._columns.values():
+            for storage in vars(column).values():
+                size += sys.getsizeof(storage)
+                if isinstance(storage, list):
+                    size += sum(sys.getsizeof(value) for value in storage)
+        return size
+
+    def __repr__(self) -> str:
+        return "ColumnarResult(model={0}, rows={1})".format(
+            self.model.__name__, self._length
+        )
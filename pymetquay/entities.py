@@ -0,0 +1,52 @@
+"""The listable entities, and the field type helper shared by their consumers.
+
+:data:`ENTITIES` names each entity that has a list endpoint, with its
+response model and the ``MetquayClient`` method that pages through it.  The
+mirror, exporters and workspace fan-out all look entities up here.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Set, Tuple, Type, Union, get_args, get_origin
+
+from openapi_client.models.customer_instrument_response import (
+    CustomerInstrumentResponse,
+)
+from openapi_client.models.customer_response import CustomerResponse
+from openapi_client.models.work_response import WorkResponse
+
+ENTITIES: Dict[str, Tuple[Type[Any], str]] = {
+    "customers": (CustomerResponse, "iter_customer_pages"),
+    "instruments": (CustomerInstrumentResponse, "iter_instrument_pages"),
+    "works": (WorkResponse, "iter_work_pages"),
+}
+"""Entity name -> (response model, client page iterator method)."""
+
+
+def lookup_entity(name: str) -> Tuple[Type[Any], str]:
+    """Return ``(model, page iterator method)`` for an entity name.
+
+    :raises ValueError: if ``name`` is not in :data:`ENTITIES`.
+    """
+    if name not in ENTITIES:
+        raise ValueError(
+            "Unknown entity {0!r}; expected one of {1}".format(
+                name, ", ".join(ENTITIES)
+            )
+        )
+    return ENTITIES[name]
+
+
+def base_types(annotation: Any) -> Set[Any]:
+    """Types an annotation admits, with Optional and Annotated stripped."""
+    origin = get_origin(annotation)
+    if origin is Union:
+        types: Set[Any] = set()
+        for arg in get_args(annotation):
+            types |= base_types(arg)
+        return types
+    if origin is not None and hasattr(annotation, "__metadata__"):
+        return base_types(get_args(annotation)[0])
+    if annotation is type(None):
+        return set()
+    return {annotation}
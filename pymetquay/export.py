@@ -0,0 +1,350 @@
+"""Streaming exports of list endpoints to JSONL, CSV and Parquet.
+
+Records are written page by page as they arrive, so memory stays bounded by
+the page size however large the listing is::
+
+    from pymetquay import MetquayClient, export_entity
+
+    with MetquayClient() as client:
+        report = export_entity(client, "works", "works.parquet")
+        print(report.rows, report.rows_per_second)
+
+Output goes to a temporary file next to ``path`` that replaces ``path`` only
+once every page has been written; a failed export leaves any previous file
+untouched.  Column names are the API field names used by the models'
+``to_dict()`` (``workNo``, ``inDate``, ...).  Parquet output needs
+``pyarrow`` (``pip install pymetquay[parquet]``).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import csv
+import io
+import json
+import logging
+import os
+import time
+import uuid
+from datetime import date
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel
+
+from pymetquay.client import MetquayClient
+from pymetquay.entities import base_types, lookup_entity
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_PAGE_SIZE = 50
+_PARQUET_ROW_GROUP_SIZE = 10000
+
+EXTENSIONS = {
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".csv": "csv",
+    ".parquet": "parquet",
+}
+"""File suffix -> export format, used when ``format`` is not given."""
+
+ProgressCallback = Callable[["ExportReport"], None]
+
+
+def _columns(model: Type[BaseModel]) -> List[Tuple[str, str]]:
+    """``(field name, API name)`` for every model field, in model order."""
+    return [(name, info.alias or name) for name, info in model.model_fields.items()]
+
+
+# -- Writers ---------------------------------------------------------------
+
+# ``write(records)`` takes one page and returns the records written: pages
+# can hold ``null`` entries (None), which are skipped.
+
+
+class _JsonlWriter:
+    """One JSON object per line; None fields are omitted, as in ``to_json()``."""
+
+    def __init__(self, handle: IO[bytes], model: Type[BaseModel]) -> None:
+        self._handle = handle
+
+    def write(self, records: List[Optional[BaseModel]]) -> int:
+        lines = [
+            record.model_dump_json(by_alias=True, exclude_none=True).encode() + b"\n"
+            for record in records
+            if record is not None
+        ]
+        self._handle.write(b"".join(lines))
+        return len(lines)
+
+    def close(self) -> None:
+        pass
+
+
+def _csv_cell(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (list, dict)):
+        return json.dumps(value)
+    return value
+
+
+class _CsvWriter:
+    """Header row of API names, then one row per record.
+
+    None is written as an empty cell, booleans as ``true``/``false``, dates
+    as ISO ``yyyy-MM-dd`` and lists as JSON.
+    """
+
+    def __init__(self, handle: IO[bytes], model: Type[BaseModel]) -> None:
+        self._text = io.TextIOWrapper(handle, encoding="utf-8", newline="")
+        self._columns = _columns(model)
+        self._writer = csv.writer(self._text)
+        self._writer.writerow([alias for _, alias in self._columns])
+
+    def write(self, records: List[Optional[BaseModel]]) -> int:
+        written = 0
+        for record in records:
+            if record is None:
+                continue
+            data = record.model_dump(mode="json")
+            self._writer.writerow([_csv_cell(data[name]) for name, _ in self._columns])
+            written += 1
+        return written
+
+    def close(self) -> None:
+        # Flush without closing: the caller owns the underlying file.
+        self._text.flush()
+        self._text.detach()
+
+
+def _arrow_type(pa: Any, annotation: Any) -> Any:
+    """Arrow type for a model field, or None to store it as a JSON string."""
+    types = base_types(annotation)
+    if types == {int, float}:
+        return pa.float64()
+    if len(types) != 1:
+        return None
+    (base,) = types
+    if get_origin(base) is list:
+        item_type = _arrow_type(pa, get_args(base)[0])
+        return None if item_type is None else pa.list_(item_type)
+    simple = {
+        str: pa.string(),
+        int: pa.int64(),
+        bool: pa.bool_(),
+        float: pa.float64(),
+        date: pa.date32(),
+    }
+    return simple.get(base)
+
+
+class _ParquetWriter:
+    """Buffers records into row groups of ``_PARQUET_ROW_GROUP_SIZE`` rows.
+
+    Writing every API page as its own row group would produce files of
+    thousands of tiny row groups that compress and scan poorly.
+    """
+
+    def __init__(self, handle: IO[bytes], model: Type[BaseModel]) -> None:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError(
+                "Parquet export requires pyarrow. "
+                "Install it with `pip install pymetquay[parquet]`."
+            ) from e
+        self._pa = pa
+        fields = []
+        self._as_json: List[str] = []
+        for name, alias in _columns(model):
+            arrow_type = _arrow_type(pa, model.model_fields[name].annotation)
+            if arrow_type is None:
+                arrow_type = pa.string()
+                self._as_json.append(alias)
+            fields.append((alias, arrow_type))
+        self._schema = pa.schema(fields)
+        self._writer = pq.ParquetWriter(handle, self._schema)
+        self._rows: List[Dict[str, Any]] = []
+
+    def write(self, records: List[Optional[BaseModel]]) -> int:
+        written = 0
+        for record in records:
+            if record is None:
+                continue
+            row = record.model_dump(by_alias=True)
+            for alias in self._as_json:
+                if row[alias] is not None:
+                    row[alias] = json.dumps(row[alias], default=str)
+            self._rows.append(row)
+            written += 1
+        if len(self._rows) >= _PARQUET_ROW_GROUP_SIZE:
+            self._flush()
+        return written
+
+    def _flush(self) -> None:
+        if self._rows:
+            table = self._pa.Table.from_pylist(self._rows, schema=self._schema)
+            self._writer.write_table(table)
+            self._rows = []
+
+    def close(self) -> None:
+        self._flush()
+        self._writer.close()
+
+
+WRITERS: Dict[str, Any] = {
+    "jsonl": _JsonlWriter,
+    "csv": _CsvWriter,
+    "parquet": _ParquetWriter,
+}
+"""Export format -> writer class."""
+
+
+# -- Reports ---------------------------------------------------------------
+
+
+class ExportReport:
+    """Progress and outcome of one export."""
+
+    def __init__(self, entity: Optional[str], path: str, format: str) -> None:
+        self.entity = entity
+        self.path = path
+        self.format = format
+        self.rows = 0
+        """Records written so far."""
+        self.pages = 0
+        """Pages written so far."""
+        self.bytes = 0
+        """Size of the finished file (0 until the export completes)."""
+        self.started_at = 0.0
+        self.finished_at = 0.0
+
+    @property
+    def elapsed(self) -> float:
+        end = self.finished_at or time.monotonic()
+        return end - self.started_at
+
+    @property
+    def rows_per_second(self) -> float:
+        elapsed = self.elapsed
+        return self.rows / elapsed if elapsed > 0 else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            "ExportReport(path={0!r}, format={1!r}, rows={2}, pages={3}, "
+            "elapsed={4:.2f}s, rows_per_second={5:.1f})".format(
+                self.path,
+                self.format,
+                self.rows,
+                self.pages,
+                self.elapsed,
+                self.rows_per_second,
+            )
+        )
+
+
+# -- Export ----------------------------------------------------------------
+
+
+def _resolve_format(path: str, format: Optional[str]) -> str:
+    if format is None:
+        suffix = os.path.splitext(path)[1].lower()
+        if suffix not in EXTENSIONS:
+            raise ValueError(
+                "Cannot infer the export format from {0!r}; pass format= "
+                "one of {1}".format(path, ", ".join(WRITERS))
+            )
+        return EXTENSIONS[suffix]
+    if format not in WRITERS:
+        raise ValueError(
+            "Unknown export format {0!r}; expected one of {1}".format(
+                format, ", ".join(WRITERS)
+            )
+        )
+    return format
+
+
+def export_pages(
+    model: Type[BaseModel],
+    pages: Iterable[List[Any]],
+    path: str,
+    *,
+    format: Optional[str] = None,
+    entity: Optional[str] = None,
+    on_progress: Optional[ProgressCallback] = None,
+) -> ExportReport:
+    """Write pages of ``model`` records to ``path``.
+
+    :param model: Response model of the records.
+    :param pages: Pages of records, e.g. from ``client.iter_work_pages()``.
+    :param path: Destination file; replaced atomically when complete.
+    :param format: ``"jsonl"``, ``"csv"`` or ``"parquet"`` (default: from
+        the file suffix).
+    :param entity: Entity name for the report and log messages.
+    :param on_progress: Called with the report after every page.
+    """
+    format = _resolve_format(path, format)
+    report = ExportReport(entity, path, format)
+    report.started_at = time.monotonic()
+
+    directory = os.path.dirname(os.path.abspath(path))
+    tmp_path = os.path.join(
+        directory, ".{0}.{1}.tmp".format(os.path.basename(path), uuid.uuid4().hex)
+    )
+    try:
+        with open(tmp_path, "xb") as handle:
+            writer = WRITERS[format](handle, model)
+            for page in pages:
+                report.rows += writer.write(page)
+                report.pages += 1
+                if on_progress is not None:
+                    on_progress(report)
+            writer.close()
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+    report.finished_at = time.monotonic()
+    report.bytes = os.path.getsize(path)
+    logger.info("Exported %r", report)
+    return report
+
+
+def export_entity(
+    client: MetquayClient,
+    entity: str,
+    path: str,
+    *,
+    format: Optional[str] = None,
+    workspace_code: Optional[str] = None,
+    page_size: int = _DEFAULT_PAGE_SIZE,
+    on_progress: Optional[ProgressCallback] = None,
+) -> ExportReport:
+    """Page through ``entity`` (customers, instruments or works) into ``path``.
+
+    See :func:`export_pages` for ``format`` and ``on_progress``.
+    """
+    model, iter_pages = lookup_entity(entity)
+    pages = getattr(client, iter_pages)(
+        page_size=page_size, workspace_code=workspace_code
+    )
+    return export_pages(
+        model, pages, path, format=format, entity=entity, on_progress=on_progress
+    )
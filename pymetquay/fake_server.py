@@ -0,0 +1,687 @@
+"""In-memory fake of the Metquay API, driven by the OpenAPI spec.
+
+Routes, request validation, pagination defaults and response shapes all come
+from the same spec that the client and the integration tests are generated
+from (``1.0.json``, shipped with the package as ``pymetquay/openapi.json``),
+so the fake follows the spec as it changes::
+
+    from pymetquay import MetquayClient
+    from pymetquay.fake_server import FakeMetquayServer
+
+    with FakeMetquayServer(seed_records=5000, error_rate=0.01) as server:
+        client = MetquayClient("key", "secret", host=server.url)
+        client.list_works(paginate_all=True)
+
+Or as a standalone process for load tests of services built on pymetquay::
+
+    python -m pymetquay.fake_server --port 8080 --seed-records 200000
+
+Behaviour:
+
+* ``POST /authenticate`` issues bearer tokens that expire after
+  ``token_ttl`` seconds; other operations answer 401 without a live token.
+* List operations page with the spec's ``first``/``limit`` parameters and
+  filter on ``workspaceCode``.
+* Creates, updates and deletes change the in-memory store.  Request bodies
+  are checked against the spec's required fields and property types (422).
+* Operations whose spec lists a 429 response are throttled to
+  ``rate_limit_per_minute`` requests per access key over a sliding minute,
+  with a ``Retry-After`` header.
+* ``error_rate`` turns that fraction of requests into 500/502/503 errors,
+  and :meth:`FakeMetquayServer.fail_next` queues specific failures.
+"""
+
+from __future__ import annotations
+
+import argparse
+import collections
+import importlib.resources
+import json
+import logging
+import math
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Pattern,
+    Sequence,
+    Tuple,
+    Union,
+)
+from urllib.parse import parse_qs, urlsplit
+
+SPEC_RESOURCE = "openapi.json"
+"""The package's copy of ``1.0.json``, kept in sync by ``generate.sh``."""
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ERROR_STATUSES = (500, 502, 503)
+
+_RATE_WINDOW_SECONDS = 60.0
+
+Json = Dict[str, Any]
+
+
+def load_spec(spec: Union[None, str, Json] = None) -> Json:
+    """Return the spec as a dict, reading it from a path if needed.
+
+    Without ``spec``, the copy packaged with pymetquay is used.
+    """
+    if isinstance(spec, dict):
+        return spec
+    if spec is None:
+        resource = importlib.resources.files("pymetquay").joinpath(SPEC_RESOURCE)
+        return json.loads(resource.read_text(encoding="utf-8"))
+    with open(spec, encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def _resolve(spec: Json, node: Any) -> Any:
+    """Follow ``$ref`` pointers (``#/components/...``) until a real node."""
+    while isinstance(node, dict) and "$ref" in node:
+        target: Any = spec
+        for part in node["$ref"].lstrip("#/").split("/"):
+            target = target[part]
+        node = target
+    return node
+
+
+def synthetic_value(name: str, schema: Json, index: int) -> Any:
+    """A plausible value of ``schema`` for the record at ``index``."""
+    kind = schema.get("type")
+    if "enum" in schema:
+        return schema["enum"][index % len(schema["enum"])]
+    if kind == "integer":
+        return index + 1
+    if kind == "number":
+        return round(index * 1.5, 2)
+    if kind == "boolean":
+        return index % 2 == 0
+    if kind == "array":
+        return [synthetic_value(name, schema.get("items", {}), index)]
+    if schema.get("format") == "date":
+        # The live API sends MM-dd-yyyy regardless of the spec's "date".
+        return "{0:02d}-{1:02d}-{2}".format(
+            index % 12 + 1, index % 28 + 1, 2015 + index % 10
+        )
+    return "{0}-{1}".format(name, index)
+
+
+class _Operation:
+    """One spec operation and how the fake implements it."""
+
+    def __init__(self, spec: Json, path: str, method: str, op: Json) -> None:
+        self.path = path
+        self.method = method.upper()
+        self.operation_id: str = op.get("operationId", method + path)
+        self.pattern: Pattern[str] = re.compile(
+            "^" + re.sub(r"\{[^/}]+\}", "([^/]+)", path) + "/?$"
+        )
+        self.collection = path.split("/{", 1)[0]
+        self.has_id = "{" in path
+        self.secured = bool(op.get("security", spec.get("security")))
+        self.throttled = "429" in op.get("responses", {})
+
+        self.parameters: Dict[str, Json] = {}
+        for parameter in op.get("parameters", []):
+            parameter = _resolve(spec, parameter)
+            self.parameters[parameter["name"]] = parameter
+
+        body = op.get("requestBody", {})
+        self.request_schema: Optional[Json] = _resolve(
+            spec,
+            body.get("content", {}).get("application/json", {}).get("schema"),
+        )
+
+        self.response_schema: Optional[Json] = None
+        self.success_status = 200
+        for status, response in sorted(op.get("responses", {}).items()):
+            if status.startswith("2"):
+                self.success_status = int(status)
+                schema = (
+                    _resolve(spec, response)
+                    .get("content", {})
+                    .get("application/json", {})
+                    .get("schema")
+                )
+                self.response_schema = _resolve(spec, schema)
+                break
+
+        returns = self.response_schema or {}
+        self.record_schema: Json = _resolve(spec, returns.get("items")) or {}
+        """Schema of the records a list operation returns."""
+        if "accessToken" in returns.get("properties", {}):
+            self.kind = "authenticate"
+        elif self.method == "GET" and returns.get("type") == "array":
+            self.kind = "list"
+        elif self.method == "GET":
+            self.kind = "read"
+        elif self.method == "POST" and not self.has_id:
+            self.kind = "create"
+        elif self.method == "PUT" and self.has_id:
+            self.kind = "update"
+        elif self.method == "DELETE" and self.has_id:
+            self.kind = "delete"
+        else:
+            self.kind = "unsupported"
+
+    def default(self, name: str, fallback: int) -> int:
+        schema = self.parameters.get(name, {}).get("schema", {})
+        return int(schema.get("default", fallback))
+
+
+class _ApiError(Exception):
+    def __init__(
+        self, status: int, message: str, headers: Optional[Dict[str, str]] = None
+    ) -> None:
+        super().__init__(message)
+        self.status = status
+        self.message = message
+        self.headers = headers or {}
+
+
+def _require_object(payload: Any) -> None:
+    """Reject a write whose body is empty or not a JSON object."""
+    if not isinstance(payload, dict):
+        raise _ApiError(400, "Request body must be a JSON object")
+
+
+class _Store:
+    """Records of one collection, in insertion order."""
+
+    def __init__(self, schema: Json) -> None:
+        self.schema = schema
+        self.ids: List[int] = []
+        self.records: Dict[int, Tuple[Json, bytes]] = {}
+
+    def put(self, record_id: int, record: Json) -> None:
+        if record_id not in self.records:
+            self.ids.append(record_id)
+        # Pages are served from pre-encoded rows, so a large listing costs
+        # the fake one join per page rather than a json.dumps per record.
+        self.records[record_id] = (record, json.dumps(record).encode())
+
+    def delete(self, record_id: int) -> None:
+        del self.records[record_id]
+        self.ids.remove(record_id)
+
+
+class FakeMetquayServer:
+    """A threaded HTTP server implementing the spec in memory.
+
+    :param spec: Spec dict or path (default: the spec packaged with pymetquay).
+    :param host: Interface to bind.
+    :param port: Port to bind; 0 picks a free one (see :attr:`url`).
+    :param seed_records: Synthetic records per list collection, or a dict
+        of collection path (``"/works"``) to count.
+    :param credentials: Accepted ``access key -> secret key`` pairs; by
+        default any non-empty pair is accepted.
+    :param token_ttl: Lifetime of issued tokens, in seconds.
+    :param rate_limit_per_minute: Requests per access key per minute on
+        throttled operations; None disables throttling.
+    :param error_rate: Fraction of requests answered with a random status
+        from ``error_statuses``.
+    :param latency: Seconds to wait before every response.
+    :param page_cap: Largest page returned, whatever ``limit`` asks for.
+    :param random_seed: Seed for error injection, for reproducible runs.
+    """
+
+    def __init__(
+        self,
+        spec: Union[None, str, Json] = None,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        seed_records: Union[int, Dict[str, int]] = 0,
+        credentials: Optional[Dict[str, str]] = None,
+        token_ttl: int = 900,
+        rate_limit_per_minute: Optional[int] = 100,
+        error_rate: float = 0.0,
+        error_statuses: Sequence[int] = DEFAULT_ERROR_STATUSES,
+        latency: float = 0.0,
+        page_cap: Optional[int] = None,
+        random_seed: Optional[int] = 0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 0.0 <= error_rate <= 1.0:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.spec = load_spec(spec)
+        self.base_path = urlsplit(self.spec.get("servers", [{}])[0].get("url", "")).path
+        self.base_path = self.base_path.rstrip("/")
+        self.operations = [
+            _Operation(self.spec, path, method, op)
+            for path, methods in self.spec.get("paths", {}).items()
+            for method, op in methods.items()
+            if isinstance(op, dict)
+        ]
+        self.credentials = credentials
+        self.token_ttl = token_ttl
+        self.rate_limit_per_minute = rate_limit_per_minute
+        self.error_rate = error_rate
+        self.error_statuses = tuple(error_statuses)
+        self.latency = latency
+        self.page_cap = page_cap
+        self._clock = clock
+        self._random = random.Random(random_seed)
+        self._lock = threading.Lock()
+        self._tokens: Dict[str, Tuple[str, float]] = {}
+        self._windows: Dict[str, Deque[float]] = {}
+        self._failures: Deque[Tuple[int, Optional[str]]] = collections.deque()
+        self._next_id = 1
+        self.requests: Dict[str, int] = collections.Counter()
+        """Requests handled, keyed by operationId."""
+        self.statuses: Dict[int, int] = collections.Counter()
+        """Responses sent, keyed by HTTP status."""
+
+        self.stores: Dict[str, _Store] = {}
+        for operation in self.operations:
+            if operation.kind == "list":
+                self.stores[operation.collection] = _Store(operation.record_schema)
+        for operation in self.operations:
+            if operation.kind in ("create", "update", "delete", "read"):
+                self.stores.setdefault(operation.collection, _Store({}))
+
+        counts = (
+            seed_records
+            if isinstance(seed_records, dict)
+            else {
+                op.collection: seed_records
+                for op in self.operations
+                if op.kind == "list"
+            }
+        )
+        for collection, count in counts.items():
+            self.seed(collection, count)
+
+        self.host = host
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    # -- Lifecycle ---------------------------------------------------------
+
+    @property
+    def url(self) -> str:
+        """Root URL to pass as a client's ``host`` (``http://127.0.0.1:port``)."""
+        return "http://{0}:{1}".format(self.host, self._server.server_port)
+
+    def start(self) -> FakeMetquayServer:
+        """Serve from a background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._server.serve_forever,
+                name="pymetquay-fake-server",
+                daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve on the calling thread until interrupted."""
+        self._server.serve_forever()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> FakeMetquayServer:
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    # -- Data and fault control --------------------------------------------
+
+    def _allocate_id(self) -> int:
+        with self._lock:
+            record_id = self._next_id
+            self._next_id += 1
+        return record_id
+
+    def seed(self, collection: str, count: int) -> None:
+        """Add ``count`` synthetic records to a collection such as ``/works``."""
+        store = self.stores[collection]
+        properties = store.schema.get("properties", {})
+        for _ in range(count):
+            record_id = self._allocate_id()
+            record = {
+                name: synthetic_value(name, _resolve(self.spec, schema), record_id)
+                for name, schema in properties.items()
+            }
+            if "id" in properties:
+                record["id"] = record_id
+            store.put(record_id, record)
+
+    def records(self, collection: str) -> List[Json]:
+        """Current records of a collection, in insertion order."""
+        store = self.stores[collection]
+        with self._lock:
+            return [store.records[record_id][0] for record_id in store.ids]
+
+    def fail_next(
+        self, status: int = 500, count: int = 1, operation_id: Optional[str] = None
+    ) -> None:
+        """Answer the next ``count`` requests (to ``operation_id``) with ``status``."""
+        with self._lock:
+            self._failures.extend([(status, operation_id)] * count)
+
+    def stats(self) -> Json:
+        """Request counts by operationId and by response status."""
+        with self._lock:
+            return {
+                "requests": dict(self.requests),
+                "statuses": {str(k): v for k, v in self.statuses.items()},
+            }
+
+    def expire_tokens(self) -> None:
+        """Expire every issued token, as if ``token_ttl`` had passed."""
+        with self._lock:
+            self._tokens.clear()
+
+    # -- Request handling --------------------------------------------------
+
+    def _handler_class(self) -> type:
+        server = self
+
+        class Handler(_Handler):
+            fake = server
+
+        return Handler
+
+    def _match(self, method: str, path: str) -> Tuple[_Operation, List[str]]:
+        allowed = False
+        for operation in self.operations:
+            match = operation.pattern.match(path)
+            if match is None:
+                continue
+            if operation.method == method:
+                return operation, list(match.groups())
+            allowed = True
+        if allowed:
+            raise _ApiError(405, "Method not allowed")
+        raise _ApiError(404, "Not found")
+
+    def _injected_failure(self, operation: _Operation) -> Optional[int]:
+        with self._lock:
+            for position, (status, operation_id) in enumerate(self._failures):
+                if operation_id is None or operation_id == operation.operation_id:
+                    del self._failures[position]
+                    return status
+            if self.error_rate and self._random.random() < self.error_rate:
+                return self._random.choice(self.error_statuses)
+        return None
+
+    def _client_for(self, headers: Any) -> str:
+        auth = headers.get("Authorization", "")
+        scheme, _, token = auth.partition(" ")
+        if scheme.lower() != "bearer":
+            token = ""
+        with self._lock:
+            entry = self._tokens.get(token)
+        if entry is None or entry[1] <= self._clock():
+            raise _ApiError(401, "Invalid or expired token")
+        return entry[0]
+
+    def _throttle(self, client_key: str) -> None:
+        limit = self.rate_limit_per_minute
+        if limit is None:
+            return
+        now = self._clock()
+        with self._lock:
+            window = self._windows.setdefault(client_key, collections.deque())
+            while window and window[0] <= now - _RATE_WINDOW_SECONDS:
+                window.popleft()
+            if len(window) >= limit:
+                retry_after = max(1, math.ceil(window[0] + _RATE_WINDOW_SECONDS - now))
+                raise _ApiError(
+                    429,
+                    "API rate limit of {0} requests per minute exceeded. "
+                    "Please try again in {1} seconds.".format(limit, retry_after),
+                    {"Retry-After": str(retry_after)},
+                )
+            window.append(now)
+
+    def _validate(self, schema: Optional[Json], body: Any) -> None:
+        if schema is None:
+            return
+        if not isinstance(body, dict):
+            raise _ApiError(422, "Request body must be a JSON object")
+        missing = [name for name in schema.get("required", []) if body.get(name) is None]
+        if missing:
+            raise _ApiError(422, "Missing required fields: " + ", ".join(missing))
+        types: Dict[str, Any] = {
+            "string": str,
+            "integer": int,
+            "number": (int, float),
+            "boolean": bool,
+            "array": list,
+            "object": dict,
+        }
+        for name, value in body.items():
+            prop = _resolve(self.spec, schema.get("properties", {}).get(name))
+            if prop is None or value is None:
+                continue
+            expected = types.get(prop.get("type", ""))
+            wrong_type = expected is not None and (
+                not isinstance(value, expected)
+                or (isinstance(value, bool) and prop.get("type") != "boolean")
+            )
+            if wrong_type or ("enum" in prop and value not in prop["enum"]):
+                raise _ApiError(422, "Invalid value for field {0!r}".format(name))
+
+    def handle(
+        self, method: str, target: str, headers: Any, body: bytes
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        """Process one request; returns ``(status, headers, body)``."""
+        url = urlsplit(target)
+        path = url.path
+        prefix = len(self.base_path)
+        if prefix and path.startswith(self.base_path):
+            path = path[prefix:]
+        operation: Optional[_Operation] = None
+        try:
+            operation, path_args = self._match(method, path or "/")
+            with self._lock:
+                self.requests[operation.operation_id] += 1
+            failure = self._injected_failure(operation)
+            if failure is not None:
+                raise _ApiError(failure, "Injected failure")
+            try:
+                payload = json.loads(body) if body else None
+            except ValueError:
+                raise _ApiError(400, "Malformed JSON body") from None
+            if operation.secured:
+                client_key = self._client_for(headers)
+                if operation.throttled:
+                    self._throttle(client_key)
+            status, result = self._dispatch(
+                operation, path_args, parse_qs(url.query), payload
+            )
+            response_headers: Dict[str, str] = {}
+        except _ApiError as error:
+            status = error.status
+            result = json.dumps({"code": error.status, "message": error.message})
+            response_headers = error.headers
+        except Exception as error:
+            # A bug in the fake must still answer, not drop the connection.
+            logger.exception("Fake server failed on %s %s", method, target)
+            status = 500
+            result = json.dumps(
+                {"code": 500, "message": "Fake server error: {0!r}".format(error)}
+            )
+            response_headers = {}
+        with self._lock:
+            self.statuses[status] += 1
+        if isinstance(result, str):
+            result = result.encode()
+        return status, response_headers, result
+
+    def _dispatch(
+        self,
+        operation: _Operation,
+        path_args: List[str],
+        query: Dict[str, List[str]],
+        payload: Any,
+    ) -> Tuple[int, Union[str, bytes]]:
+        kind = operation.kind
+        if kind == "authenticate":
+            self._validate(operation.request_schema, payload)
+            _require_object(payload)
+            access_key = payload.get("accessKey", "")
+            if self.credentials is not None and (
+                self.credentials.get(access_key) != payload.get("secretKey")
+            ):
+                raise _ApiError(401, "Invalid access key or secret key")
+            token = uuid.uuid4().hex
+            with self._lock:
+                self._tokens[token] = (access_key, self._clock() + self.token_ttl)
+            return 200, json.dumps(
+                {"accessToken": token, "tokenType": "bearer", "expiresIn": self.token_ttl}
+            )
+
+        store = self.stores.get(operation.collection)
+        if store is None or kind == "unsupported":
+            raise _ApiError(501, "Operation not implemented by the fake server")
+
+        if kind == "list":
+            try:
+                first = int(query.get("first", [operation.default("first", 0)])[0])
+                limit = int(query.get("limit", [operation.default("limit", 50)])[0])
+            except ValueError:
+                raise _ApiError(400, "first and limit must be integers") from None
+            if first < 0 or limit < 1:
+                raise _ApiError(400, "first must be >= 0 and limit >= 1")
+            if self.page_cap is not None:
+                limit = min(limit, self.page_cap)
+            workspace = query.get("workspaceCode", [None])[0]
+            with self._lock:
+                if workspace is None:
+                    rows = [store.records[i][1] for i in store.ids[first:][:limit]]
+                else:
+                    matching = (
+                        encoded
+                        for record, encoded in (store.records[i] for i in store.ids)
+                        if record.get("workspaceCode") == workspace
+                    )
+                    rows = list(matching)[first:][:limit]
+            return 200, b"[" + b",".join(rows) + b"]"
+
+        if operation.has_id:
+            try:
+                record_id = int(path_args[0])
+            except ValueError:
+                raise _ApiError(400, "Resource id must be an integer") from None
+            with self._lock:
+                exists = record_id in store.records
+            if not exists:
+                raise _ApiError(404, "Resource {0} not found".format(record_id))
+            if kind == "read":
+                with self._lock:
+                    return 200, store.records[record_id][1]
+            if kind == "delete":
+                with self._lock:
+                    store.delete(record_id)
+                return operation.success_status, b""
+        self._validate(operation.request_schema, payload)
+        _require_object(payload)
+        if not operation.has_id:
+            record_id = self._allocate_id()
+        properties = store.schema.get("properties")
+        record = {
+            name: value
+            for name, value in payload.items()
+            if properties is None or name in properties
+        }
+        if properties is None or "id" in properties:
+            record["id"] = record_id
+        with self._lock:
+            store.put(record_id, record)
+        if kind == "create":
+            return operation.success_status, json.dumps({"metquayId": record_id})
+        return operation.success_status, b""
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Send each response as one segment: with Nagle's algorithm on, separate
+    # header and body writes stall on the client's delayed ACK.
+    wbufsize = 64 * 1024
+    disable_nagle_algorithm = True
+    fake: FakeMetquayServer
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _serve(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        headers: Dict[str, str] = {}
+        if self.path.endswith("/__fake__/stats"):
+            status, payload = 200, json.dumps(self.fake.stats()).encode()
+        else:
+            status, headers, payload = self.fake.handle(
+                self.command, self.path, self.headers, body
+            )
+        if self.fake.latency:
+            time.sleep(self.fake.latency)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST = do_PUT = do_DELETE = do_PATCH = _serve
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--spec", default=None, help="default: packaged spec")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--seed-records", type=int, default=1000)
+    parser.add_argument("--token-ttl", type=int, default=900)
+    parser.add_argument(
+        "--rate-limit", type=int, default=100, help="per minute; 0 disables"
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--page-cap", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    server = FakeMetquayServer(
+        args.spec,
+        host=args.host,
+        port=args.port,
+        seed_records=args.seed_records,
+        token_ttl=args.token_ttl,
+        rate_limit_per_minute=args.rate_limit or None,
+        error_rate=args.error_rate,
+        latency=args.latency_ms / 1000,
+        page_cap=args.page_cap,
+        random_seed=None,
+    )
+    print("Fake Metquay API on {0}{1}".format(server.url, server.base_path))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+"""Concurrent listing of one entity across several workspaces.
+
+With the workspace feature enabled, each ``workspace_code`` is paged
+separately, and listing a dozen of them one after another takes a dozen
+times as long.  :func:`fan_out` pages several workspaces at once on a thread
+pool and merges their records into one stream, tagged by workspace::
+
+    from pymetquay import MetquayClient, fan_out
+
+    with MetquayClient() as client:
+        listing = fan_out(client, "instruments", ["LAB1", "LAB2", "LAB3"])
+        for workspace_code, instrument in listing:
+            ...
+        print(listing.report)
+
+Every request still goes through the client's rate limiter, so the
+workspaces share one request budget: ``concurrency`` hides latency, and the
+whole job is bounded by the API quota rather than by the number of
+workspaces.  A workspace that fails stops only its own paging; its error is
+kept in its :class:`WorkspaceResult`.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+import weakref
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from pymetquay.client import MetquayClient
+from pymetquay.entities import lookup_entity
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_PAGE_SIZE = 50
+_DEFAULT_CONCURRENCY = 4
+_POLL_SECONDS = 0.1
+
+PageSource = Callable[[str], Iterable[List[Any]]]
+"""Returns the pages of one workspace, e.g. ``client.iter_work_pages``."""
+
+
+class WorkspaceResult:
+    """Records listed from one workspace, and how long that took."""
+
+    def __init__(self, workspace_code: str) -> None:
+        self.workspace_code = workspace_code
+        self.records = 0
+        """Records yielded so far."""
+        self.pages = 0
+        """Pages received so far."""
+        self.error: Optional[BaseException] = None
+        """The exception that stopped this workspace's paging, if any."""
+        self.started_at = 0.0
+        self.finished_at = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds from the first request to the last page (0 before start)."""
+        if not self.started_at:
+            return 0.0
+        end = self.finished_at or time.monotonic()
+        return end - self.started_at
+
+    def __repr__(self) -> str:
+        if self.ok:
+            return "WorkspaceResult({0!r}, records={1}, elapsed={2:.2f}s)".format(
+                self.workspace_code, self.records, self.elapsed
+            )
+        return "WorkspaceResult({0!r}, records={1}, error={2!r})".format(
+            self.workspace_code, self.records, self.error
+        )
+
+
+class FanOutReport:
+    """Progress and outcome of one :func:`fan_out` listing."""
+
+    def __init__(self, entity: Optional[str], workspace_codes: Sequence[str]) -> None:
+        self.entity = entity
+        self.workspaces: Dict[str, WorkspaceResult] = {
+            code: WorkspaceResult(code) for code in workspace_codes
+        }
+        """Result per workspace code, in the order the codes were given."""
+        self.started_at = 0.0
+        self.finished_at = 0.0
+
+    @property
+    def records(self) -> int:
+        """Records yielded so far, across all workspaces."""
+        return sum(result.records for result in self.workspaces.values())
+
+    @property
+    def failed(self) -> List[WorkspaceResult]:
+        """Workspaces whose paging stopped with an error."""
+        return [result for result in self.workspaces.values() if not result.ok]
+
+    @property
+    def elapsed(self) -> float:
+        if not self.started_at:
+            return 0.0
+        end = self.finished_at or time.monotonic()
+        return end - self.started_at
+
+    @property
+    def records_per_second(self) -> float:
+        elapsed = self.elapsed
+        return self.records / elapsed if elapsed > 0 else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            "FanOutReport(entity={0!r}, workspaces={1}, failed={2}, records={3}, "
+            "elapsed={4:.2f}s, records_per_second={5:.1f})".format(
+                self.entity,
+                len(self.workspaces),
+                len(self.failed),
+                self.records,
+                self.elapsed,
+                self.records_per_second,
+            )
+        )
+
+
+class FanOut:
+    """Iterator over ``(workspace_code, record)`` from several workspaces.
+
+    Nothing is requested until iteration starts.  Records of one workspace
+    arrive in page order; pages of different workspaces interleave as they
+    complete.  At most ``2 * concurrency`` pages wait to be consumed, so a
+    slow consumer holds back the paging rather than buffering everything.
+    :meth:`close`, leaving a ``with`` block, or dropping the last reference
+    (e.g. breaking out of ``for ... in fan_out(...)``) stops the workers
+    after their current request.
+
+    :param pages: Returns the pages of one workspace code.
+    :param report: Report whose workspaces are listed; updated as records
+        are yielded and complete once iteration ends.
+    :param concurrency: Workspaces paged at once.
+    """
+
+    def __init__(
+        self, pages: PageSource, report: FanOutReport, concurrency: int
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.report = report
+        stop = threading.Event()
+        # The workers share only ``stop`` and the queues with the consumer,
+        # never ``self``, so an abandoned FanOut is freed and stops them.
+        weakref.finalize(self, stop.set)
+        self._records = _merge(pages, report, concurrency, stop)
+
+    def __iter__(self) -> FanOut:
+        return self
+
+    def __next__(self) -> Tuple[str, Any]:
+        return next(self._records)
+
+    def close(self) -> None:
+        """Stop paging; records not yet yielded are dropped."""
+        self._records.close()
+
+    def __enter__(self) -> FanOut:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+def _merge(
+    pages: PageSource,
+    report: FanOutReport,
+    concurrency: int,
+    stop: threading.Event,
+) -> Generator[Tuple[str, Any], None, None]:
+    """Page every workspace of ``report`` on worker threads; yield records."""
+    # Each item is a (workspace, page) pair, or (workspace, None) once that
+    # workspace is done.
+    received: queue.Queue[Tuple[WorkspaceResult, Optional[List[Any]]]] = (
+        queue.Queue(maxsize=2 * concurrency)
+    )
+    main_thread = threading.main_thread()
+
+    def stopped() -> bool:
+        # A FanOut still referenced at exit is only freed after the
+        # interpreter has waited for these threads, so they also give up
+        # once the main thread has finished.
+        return stop.is_set() or not main_thread.is_alive()
+
+    def put(item: Tuple[WorkspaceResult, Optional[List[Any]]]) -> bool:
+        while not stopped():
+            try:
+                received.put(item, timeout=_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def page_through(result: WorkspaceResult) -> None:
+        result.started_at = time.monotonic()
+        try:
+            for page in pages(result.workspace_code):
+                if not put((result, page)):
+                    return
+        except Exception as error:
+            result.error = error
+            logger.warning(
+                "Listing workspace %r failed: %r", result.workspace_code, error
+            )
+        finally:
+            result.finished_at = time.monotonic()
+            put((result, None))
+
+    todo: queue.SimpleQueue[WorkspaceResult] = queue.SimpleQueue()
+    for result in report.workspaces.values():
+        todo.put(result)
+
+    def work() -> None:
+        while not stopped():
+            try:
+                result = todo.get_nowait()
+            except queue.Empty:
+                return
+            page_through(result)
+
+    pending = len(report.workspaces)
+    workers = [
+        threading.Thread(target=work, name="pymetquay-fanout-{0}".format(i))
+        for i in range(min(concurrency, pending))
+    ]
+    report.started_at = time.monotonic()
+    try:
+        for worker in workers:
+            worker.start()
+        while pending:
+            result, page = received.get()
+            if page is None:
+                pending -= 1
+                continue
+            result.pages += 1
+            for record in page:
+                result.records += 1
+                yield result.workspace_code, record
+    finally:
+        stop.set()
+        for worker in workers:
+            if worker.is_alive():
+                worker.join()
+        report.finished_at = time.monotonic()
+        logger.info("%r", report)
+
+
+def fan_out(
+    client: MetquayClient,
+    entity: str,
+    workspace_codes: Iterable[str],
+    *,
+    page_size: int = _DEFAULT_PAGE_SIZE,
+    concurrency: int = _DEFAULT_CONCURRENCY,
+    fields: Optional[Sequence[str]] = None,
+) -> FanOut:
+    """Page ``entity`` (customers, instruments or works) in several workspaces.
+
+    Returns a :class:`FanOut` yielding ``(workspace_code, record)`` pairs;
+    its ``report`` has per-workspace record counts and timings.
+
+    :param client: Client whose rate limiter and token every request shares.
+    :param entity: ``"customers"``, ``"instruments"`` or ``"works"``.
+    :param workspace_codes: Workspaces to list, each once.
+    :param page_size: Records requested per page.
+    :param concurrency: Workspaces paged at once.  Size a shared
+        :class:`~openapi_client.transport.Transport` to match.
+    :param fields: Load only these fields, as for ``client.list_*``.
+    """
+    _, iter_pages_name = lookup_entity(entity)
+    codes = list(workspace_codes)
+    if len(set(codes)) != len(codes):
+        raise ValueError("workspace_codes must not repeat")
+    iter_pages = getattr(client, iter_pages_name)
+
+    def pages(workspace_code: str) -> Iterable[List[Any]]:
+        return iter_pages(
+            page_size=page_size, workspace_code=workspace_code, fields=fields
+        )
+
+    return FanOut(pages, FanOutReport(entity, codes), concurrency)
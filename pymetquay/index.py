@@ -0,0 +1,308 @@
+"""In-memory lookup indexes over instruments and customers.
+
+The API can only list records, so finding an instrument by tag or barcode
+means scanning a full listing.  An index loads the listing once and answers
+identifier lookups with a dict access::
+
+    from pymetquay import InstrumentIndex, MetquayClient
+
+    with MetquayClient() as client:
+        instruments = InstrumentIndex(client, concurrency=4)
+        instrument = instruments.get("barcode", "JG-004512")
+        instrument = instruments.find(scanned_code)  # any identifier field
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+from openapi_client.models.customer_instrument_response import (
+    CustomerInstrumentResponse,
+)
+from openapi_client.models.customer_response import CustomerResponse
+from pymetquay.client import MetquayClient
+
+T = TypeVar("T")
+
+DUPLICATE_POLICIES = ("first", "last", "error")
+
+
+class DuplicateKeyError(ValueError):
+    """Two records share a key in an index built with ``on_duplicate="error"``."""
+
+    def __init__(self, field: str, key: str, records: Sequence[Any]) -> None:
+        self.field = field
+        self.key = key
+        self.records = list(records)
+        super().__init__(
+            "{0} records share {1}={2!r}".format(len(self.records), field, key)
+        )
+
+
+def normalize_key(value: str) -> str:
+    """Default key normalization: surrounding whitespace is ignored."""
+    return value.strip()
+
+
+def _deep_sizeof(obj: Any, seen: Set[int]) -> int:
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            size += _deep_sizeof(key, seen) + _deep_sizeof(value, seen)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(_deep_sizeof(item, seen) for item in obj)
+    elif hasattr(obj, "__dict__"):
+        size += _deep_sizeof(vars(obj), seen)
+    return size
+
+
+class _IndexState(Generic[T]):
+    """One immutable generation of an index; swapped whole on refresh."""
+
+    def __init__(
+        self,
+        records: List[T],
+        unique: Dict[str, Dict[str, T]],
+        duplicates: Dict[str, Dict[str, List[T]]],
+    ) -> None:
+        self.records = records
+        self.unique = unique
+        self.duplicates = duplicates
+
+
+class RecordIndex(Generic[T]):
+    """Hash indexes on identifier fields of a record listing.
+
+    Records are loaded by calling ``loader`` (for example a paginated
+    ``list_*`` call, or ``mirror.iter_records`` for a local mirror).  Each
+    field in ``fields`` gets a dict from normalized key to record; records
+    whose field is None or blank are not indexed under that field.
+
+    Duplicate keys are handled by ``on_duplicate``:
+
+    * ``"first"`` (default) -- lookups return the first record in load order.
+    * ``"last"`` -- lookups return the last record in load order.
+    * ``"error"`` -- :meth:`refresh` raises :class:`DuplicateKeyError` and
+      the index keeps its previous contents.
+
+    With ``"first"`` and ``"last"``, :meth:`get_all` still returns every
+    record sharing a key, and :attr:`duplicates` lists the keys that clash.
+
+    :meth:`refresh` builds a new generation off to the side and swaps it in
+    atomically, so lookups from other threads never see a half-built index.
+
+    :param loader: Returns the records to index.
+    :param fields: Attribute names to index.
+    :param on_duplicate: Duplicate key policy, see above.
+    :param normalize: Applied to keys when indexing and when looking up.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], Iterable[T]],
+        fields: Sequence[str],
+        *,
+        on_duplicate: str = "first",
+        normalize: Callable[[str], str] = normalize_key,
+    ) -> None:
+        if on_duplicate not in DUPLICATE_POLICIES:
+            raise ValueError(
+                "on_duplicate must be one of {0}".format(", ".join(DUPLICATE_POLICIES))
+            )
+        if not fields:
+            raise ValueError("At least one field must be indexed")
+        self.fields: Tuple[str, ...] = tuple(fields)
+        self.on_duplicate = on_duplicate
+        self._loader = loader
+        self._normalize = normalize
+        self._refresh_lock = threading.Lock()
+        self._state: _IndexState[T] = _IndexState(
+            [], {f: {} for f in self.fields}, {f: {} for f in self.fields}
+        )
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Reload the records and rebuild every field index."""
+        with self._refresh_lock:
+            records = list(self._loader())
+            unique: Dict[str, Dict[str, T]] = {}
+            duplicates: Dict[str, Dict[str, List[T]]] = {}
+            for field in self.fields:
+                unique[field], duplicates[field] = self._build(records, field)
+            self._state = _IndexState(records, unique, duplicates)
+
+    def _build(
+        self, records: List[T], field: str
+    ) -> Tuple[Dict[str, T], Dict[str, List[T]]]:
+        keep_last = self.on_duplicate == "last"
+        index: Dict[str, T] = {}
+        duplicates: Dict[str, List[T]] = {}
+        for record in records:
+            value = getattr(record, field)
+            if value is None:
+                continue
+            key = self._normalize(str(value))
+            if not key:
+                continue
+            existing = index.get(key)
+            if existing is None:
+                index[key] = record
+                continue
+            duplicates.setdefault(key, [existing]).append(record)
+            if self.on_duplicate == "error":
+                raise DuplicateKeyError(field, key, duplicates[key])
+            if keep_last:
+                index[key] = record
+        return index, duplicates
+
+    # -- Lookups -----------------------------------------------------------
+
+    def _field_index(self, state: _IndexState[T], field: str) -> Dict[str, T]:
+        try:
+            return state.unique[field]
+        except KeyError:
+            raise KeyError(
+                "{0!r} is not indexed; indexed fields: {1}".format(
+                    field, ", ".join(self.fields)
+                )
+            ) from None
+
+    def get(self, field: str, key: str) -> Optional[T]:
+        """Return the record whose ``field`` equals ``key``, or None."""
+        return self._field_index(self._state, field).get(self._normalize(key))
+
+    def get_all(self, field: str, key: str) -> List[T]:
+        """Return every record whose ``field`` equals ``key``."""
+        state = self._state
+        key = self._normalize(key)
+        record = self._field_index(state, field).get(key)
+        if record is None:
+            return []
+        return list(state.duplicates[field].get(key, [record]))
+
+    def find(self, key: str) -> Optional[T]:
+        """Look ``key`` up in each indexed field in turn; first hit wins."""
+        state = self._state
+        key = self._normalize(key)
+        for field in self.fields:
+            record = state.unique[field].get(key)
+            if record is not None:
+                return record
+        return None
+
+    @property
+    def records(self) -> List[T]:
+        """The indexed records, in load order."""
+        return self._state.records
+
+    @property
+    def duplicates(self) -> Dict[str, Dict[str, List[T]]]:
+        """Per field, the keys shared by more than one record."""
+        return self._state.duplicates
+
+    def __len__(self) -> int:
+        return len(self._state.records)
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self.find(key) is not None
+
+    def memory_footprint(self, include_records: bool = True) -> int:
+        """Approximate bytes held by the index.
+
+        :param include_records: Also count the records themselves, not just
+            the key dicts pointing at them.
+        """
+        state = self._state
+        seen: Set[int] = set()
+        if not include_records:
+            seen.update(id(record) for record in state.records)
+        size = 0
+        for field in self.fields:
+            size += _deep_sizeof(state.unique[field], seen)
+            size += _deep_sizeof(state.duplicates[field], seen)
+        size += _deep_sizeof(state.records, seen)
+        return size
+
+    def __repr__(self) -> str:
+        return "{0}(records={1}, fields={2!r})".format(
+            type(self).__name__, len(self), self.fields
+        )
+
+
+class InstrumentIndex(RecordIndex[CustomerInstrumentResponse]):
+    """Index customer instruments by tag, serial number, barcode and control no.
+
+    Loads every instrument through ``client.list_instruments(paginate_all=True)``.
+    See :class:`RecordIndex` for the duplicate key policy and refresh.
+    """
+
+    FIELDS = ("tag_no", "serial_no", "barcode", "control_no")
+
+    def __init__(
+        self,
+        client: MetquayClient,
+        *,
+        workspace_code: Optional[str] = None,
+        concurrency: int = 1,
+        fields: Sequence[str] = FIELDS,
+        on_duplicate: str = "first",
+        normalize: Callable[[str], str] = normalize_key,
+    ) -> None:
+        super().__init__(
+            lambda: client.list_instruments(
+                paginate_all=True,
+                workspace_code=workspace_code,
+                concurrency=concurrency,
+            ),
+            fields,
+            on_duplicate=on_duplicate,
+            normalize=normalize,
+        )
+
+
+class CustomerIndex(RecordIndex[CustomerResponse]):
+    """Index customers by company code.
+
+    Loads every customer through ``client.list_customers(paginate_all=True)``.
+    See :class:`RecordIndex` for the duplicate key policy and refresh.
+    """
+
+    FIELDS = ("company_code",)
+
+    def __init__(
+        self,
+        client: MetquayClient,
+        *,
+        workspace_code: Optional[str] = None,
+        concurrency: int = 1,
+        fields: Sequence[str] = FIELDS,
+        on_duplicate: str = "first",
+        normalize: Callable[[str], str] = normalize_key,
+    ) -> None:
+        super().__init__(
+            lambda: client.list_customers(
+                paginate_all=True,
+                workspace_code=workspace_code,
+                concurrency=concurrency,
+            ),
+            fields,
+            on_duplicate=on_duplicate,
+            normalize=normalize,
+        )
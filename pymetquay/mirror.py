@@ -0,0 +1,276 @@
+"""Local SQLite mirror of Metquay customers, instruments and works.
+
+Reporting and lookup jobs that would otherwise re-download every record
+through ``list_*(paginate_all=True)`` can sync a local copy once and query it
+in milliseconds::
+
+    from pymetquay import MetquayClient, MetquayMirror
+
+    with MetquayClient() as client, MetquayMirror(client, "metquay.db") as mirror:
+        reports = mirror.sync()
+        print(reports["works"])
+        work = mirror.get("works", 1234)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Type
+
+from pydantic import BaseModel
+
+from pymetquay.client import MetquayClient
+from pymetquay.entities import ENTITIES, lookup_entity
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA_VERSION = 1
+_DEFAULT_PAGE_SIZE = 50
+
+
+def _canonical_json(record: BaseModel) -> str:
+    """Stable JSON for a record: API aliases, sorted keys, no nulls."""
+    return json.dumps(
+        record.model_dump(mode="json", by_alias=True, exclude_none=True),
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+
+
+class SyncReport:
+    """What one :meth:`MetquayMirror.sync` pass changed for one entity."""
+
+    def __init__(self, entity: str) -> None:
+        self.entity = entity
+        self.added: List[int] = []
+        """IDs of records that were not in the mirror before."""
+        self.changed: List[int] = []
+        """IDs of records whose content hash differs from the stored one."""
+        self.removed: List[int] = []
+        """IDs that were in the mirror but no longer returned by the API."""
+        self.unchanged = 0
+        """Number of records whose content hash matched."""
+        self.started_at = 0.0
+        self.finished_at = 0.0
+
+    @property
+    def total(self) -> int:
+        """Records returned by the API in this sync."""
+        return len(self.added) + len(self.changed) + self.unchanged
+
+    @property
+    def duration(self) -> float:
+        return self.finished_at - self.started_at
+
+    def __repr__(self) -> str:
+        return (
+            "SyncReport(entity={0!r}, added={1}, changed={2}, removed={3}, "
+            "unchanged={4})".format(
+                self.entity,
+                len(self.added),
+                len(self.changed),
+                len(self.removed),
+                self.unchanged,
+            )
+        )
+
+
+class MetquayMirror:
+    """SQLite copy of list endpoints, kept current by :meth:`sync`.
+
+    Each entity in :data:`ENTITIES` has a table keyed by ``id`` holding the
+    record's canonical JSON and a SHA-256 of it, so a sync only writes rows
+    whose content changed.  Every entity syncs in one transaction: if paging
+    fails part-way, the mirror keeps its previous state.  The database uses
+    WAL journaling, so other processes can read while a sync runs.
+
+    A mirror (like its SQLite connection) must be used from one thread.
+
+    :param client: Client used to page through the API.
+    :param path: SQLite database file (``":memory:"`` for a throwaway one).
+    :param workspace_code: Workspace to mirror, if the feature is enabled.
+    :param page_size: Records requested per page while syncing.
+    """
+
+    def __init__(
+        self,
+        client: MetquayClient,
+        path: str,
+        *,
+        workspace_code: Optional[str] = None,
+        page_size: int = _DEFAULT_PAGE_SIZE,
+    ) -> None:
+        self._client = client
+        self.path = path
+        self.workspace_code = workspace_code
+        self.page_size = page_size
+        self.connection = sqlite3.connect(path)
+        """Open connection, for ad-hoc SQL against the mirror tables."""
+        self._create_schema()
+
+    # -- Context manager ---------------------------------------------------
+
+    def __enter__(self) -> MetquayMirror:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    # -- Schema ------------------------------------------------------------
+
+    def _create_schema(self) -> None:
+        with self.connection:
+            if self.path != ":memory:":
+                self.connection.execute("PRAGMA journal_mode=WAL")
+            for entity in ENTITIES:
+                self.connection.execute(
+                    "CREATE TABLE IF NOT EXISTS {0} ("
+                    "id INTEGER PRIMARY KEY, "
+                    "hash TEXT NOT NULL, "
+                    "data TEXT NOT NULL, "
+                    "synced_at REAL NOT NULL)".format(entity)
+                )
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS sync_runs ("
+                "entity TEXT NOT NULL, "
+                "started_at REAL NOT NULL, "
+                "finished_at REAL NOT NULL, "
+                "added INTEGER NOT NULL, "
+                "changed INTEGER NOT NULL, "
+                "removed INTEGER NOT NULL, "
+                "unchanged INTEGER NOT NULL)"
+            )
+            self.connection.execute(
+                "PRAGMA user_version = {0:d}".format(_SCHEMA_VERSION)
+            )
+
+    @staticmethod
+    def _check_entity(name: str) -> Type[Any]:
+        return lookup_entity(name)[0]
+
+    # -- Sync --------------------------------------------------------------
+
+    def sync(self, entities: Optional[Iterable[str]] = None) -> Dict[str, SyncReport]:
+        """Bring the mirror up to date with the API.
+
+        :param entities: Entities to sync (default: all of :data:`ENTITIES`).
+        :return: A :class:`SyncReport` per entity.
+        """
+        names = list(ENTITIES) if entities is None else list(entities)
+        for entity in names:
+            self._check_entity(entity)
+        return {entity: self.sync_entity(entity) for entity in names}
+
+    def sync_entity(self, entity: str) -> SyncReport:
+        """Sync a single entity and return what changed."""
+        self._check_entity(entity)
+        iter_pages = getattr(self._client, ENTITIES[entity][1])
+        report = SyncReport(entity)
+        report.started_at = time.time()
+
+        stored = dict(
+            self.connection.execute("SELECT id, hash FROM {0}".format(entity))
+        )
+        seen = set()
+        upsert = (
+            "INSERT INTO {0} (id, hash, data, synced_at) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(id) DO UPDATE SET hash = excluded.hash, "
+            "data = excluded.data, synced_at = excluded.synced_at".format(entity)
+        )
+        # ``with connection`` commits on success and rolls back if paging
+        # fails, so a partial listing never marks records as removed.
+        with self.connection:
+            for page in iter_pages(
+                page_size=self.page_size, workspace_code=self.workspace_code
+            ):
+                rows = []
+                for record in page:
+                    record_id = getattr(record, "id", None)
+                    if record_id is None:
+                        logger.warning("Skipping %s record without an id", entity)
+                        continue
+                    if record_id in seen:
+                        # Offset pagination can repeat a record when data
+                        # shifts mid-sync; keep the first copy.
+                        continue
+                    seen.add(record_id)
+                    data = _canonical_json(record)
+                    digest = hashlib.sha256(data.encode("utf-8")).hexdigest()
+                    previous = stored.get(record_id)
+                    if previous == digest:
+                        report.unchanged += 1
+                        continue
+                    if previous is None:
+                        report.added.append(record_id)
+                    else:
+                        report.changed.append(record_id)
+                    stored[record_id] = digest
+                    rows.append((record_id, digest, data, report.started_at))
+                self.connection.executemany(upsert, rows)
+
+            report.removed = sorted(set(stored) - seen)
+            self.connection.executemany(
+                "DELETE FROM {0} WHERE id = ?".format(entity),
+                [(record_id,) for record_id in report.removed],
+            )
+            report.finished_at = time.time()
+            self.connection.execute(
+                "INSERT INTO sync_runs VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    entity,
+                    report.started_at,
+                    report.finished_at,
+                    len(report.added),
+                    len(report.changed),
+                    len(report.removed),
+                    report.unchanged,
+                ),
+            )
+
+        logger.info("Synced %s: %r", entity, report)
+        return report
+
+    # -- Reads -------------------------------------------------------------
+
+    def get(self, entity: str, record_id: int) -> Optional[Any]:
+        """Return one mirrored record by ``id``, or None."""
+        model = self._check_entity(entity)
+        row = self.connection.execute(
+            "SELECT data FROM {0} WHERE id = ?".format(entity), (record_id,)
+        ).fetchone()
+        return None if row is None else model.from_json(row[0])
+
+    def iter_records(self, entity: str) -> Iterator[Any]:
+        """Yield every mirrored record of ``entity`` in ``id`` order."""
+        model = self._check_entity(entity)
+        cursor = self.connection.execute(
+            "SELECT data FROM {0} ORDER BY id".format(entity)
+        )
+        for (data,) in cursor:
+            yield model.from_json(data)
+
+    def all(self, entity: str) -> List[Any]:
+        """Return every mirrored record of ``entity`` in ``id`` order."""
+        return list(self.iter_records(entity))
+
+    def count(self, entity: str) -> int:
+        self._check_entity(entity)
+        (count,) = self.connection.execute(
+            "SELECT COUNT(*) FROM {0}".format(entity)
+        ).fetchone()
+        return int(count)
+
+    def last_synced(self, entity: str) -> Optional[float]:
+        """Wall-clock time the last successful sync of ``entity`` finished."""
+        self._check_entity(entity)
+        (finished_at,) = self.connection.execute(
+            "SELECT MAX(finished_at) FROM sync_runs WHERE entity = ?", (entity,)
+        ).fetchone()
+        return finished_at
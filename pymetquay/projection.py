@@ -0,0 +1,94 @@
+"""Field projections of response models.
+
+``projection(WorkResponse, ["id", "due_date"])`` builds a slim pydantic
+model holding just those fields, with the same types, aliases and field
+validators (so ``due_date`` is still parsed from ``MM-dd-yyyy``).  Passing
+``fields=[...]`` to a ``list_*`` or ``iter_*`` client method deserializes
+each record into one of these, and every other key in the response is
+skipped without being validated::
+
+    for instrument in client.iter_instruments(fields=["id", "tag_no", "due_date"]):
+        schedule[instrument.id] = instrument.due_date
+
+Projections are built once per model and field set and then reused.
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, ConfigDict, create_model, field_validator
+
+from openapi_client.api_client import _list_adapter
+
+
+def _field_names(model: Type[BaseModel], fields: Iterable[str]) -> Tuple[str, ...]:
+    """Resolve ``fields`` (field names or API names) to field names."""
+    if isinstance(fields, str):
+        raise TypeError("fields must be a list of field names, not a string")
+    by_alias = {
+        info.alias: name for name, info in model.model_fields.items() if info.alias
+    }
+    names = set()
+    for field in fields:
+        name = field if field in model.model_fields else by_alias.get(field)
+        if name is None:
+            raise ValueError("{0} has no field {1!r}".format(model.__name__, field))
+        names.add(name)
+    if not names:
+        raise ValueError("fields must name at least one field")
+    # Model order, so each field set maps to one cached projection.
+    order = list(model.model_fields)
+    return tuple(sorted(names, key=order.index))
+
+
+@functools.lru_cache(maxsize=None)
+def _projection(model: Type[BaseModel], names: Tuple[str, ...]) -> Type[BaseModel]:
+    validators: Dict[str, Any] = {}
+    decorators = model.__pydantic_decorators__.field_validators
+    for validator_name, decorator in decorators.items():
+        targets = [name for name in decorator.info.fields if name in names]
+        if targets:
+            # ``decorator.func`` is bound to ``model``; rebind to the projection.
+            validators[validator_name] = field_validator(
+                *targets, mode=decorator.info.mode
+            )(classmethod(decorator.func.__func__))  # type: ignore[attr-defined]
+    definitions: Dict[str, Any] = {
+        name: (model.model_fields[name].annotation, model.model_fields[name])
+        for name in names
+    }
+    return create_model(
+        "{0}Projection".format(model.__name__),
+        __config__=ConfigDict(**model.model_config),
+        __doc__="{0} restricted to {1}.".format(model.__name__, ", ".join(names)),
+        __module__=__name__,
+        __validators__=validators,
+        **definitions,
+    )
+
+
+def projection(model: Type[BaseModel], fields: Iterable[str]) -> Type[BaseModel]:
+    """The model holding only ``fields`` of ``model``.
+
+    :param model: A response model, e.g. ``WorkResponse``.
+    :param fields: Field names (``due_date``) or API names (``dueDate``).
+    :raises ValueError: If a field does not exist or none are given.
+    """
+    return _projection(model, _field_names(model, fields))
+
+
+def project_rows(
+    projected: Type[BaseModel], rows: Optional[List[Any]]
+) -> List[Optional[BaseModel]]:
+    """Validate a parsed JSON list page into ``projected`` records.
+
+    ``null`` entries stay None, as in full model lists.
+    """
+    items = _list_adapter(projected).validate_python(rows or [])
+    # As in ApiClient's list deserialization: every field counts as set.
+    fields = frozenset(projected.model_fields)
+    for item in items:
+        if item is not None:
+            object.__setattr__(item, "__pydantic_fields_set__", set(fields))
+    return items
@@ -0,0 +1,156 @@
+"""Lazy, validate-on-access proxies over raw API records.
+
+The ``list_*_lazy`` client methods return :class:`LazyRecord` objects instead
+of pydantic models.  Each wraps the record's parsed JSON dict; reading an
+attribute validates and converts that one field with the model's own
+validators (so ``due_date`` is still parsed from ``MM-dd-yyyy``) and caches
+the result.  Fields that are never read are never validated, which is most
+of them for callers that look at three or four fields of a 44-field work::
+
+    for work in client.list_works_lazy(paginate_all=True):
+        if work.due_date and work.due_date < today:
+            overdue.append(work.to_model())
+
+Validation errors surface on access, as ``pydantic.ValidationError``.
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import (
+    Annotated,
+    Any,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
+
+from pydantic import BaseModel, TypeAdapter
+
+from pymetquay.projection import projection
+
+M = TypeVar("M", bound=BaseModel)
+
+_MISSING = object()
+
+
+@functools.lru_cache(maxsize=None)
+def _field(model: Type[BaseModel], name: str) -> Optional[Tuple[str, Any, Any]]:
+    """``(API name, default, validate)`` for field ``name`` of ``model``.
+
+    ``validate`` maps the raw value to the field value.  Fields with field
+    validators go through their one-field projection of ``model``; the rest
+    through a ``TypeAdapter`` of the annotation, which is several times
+    cheaper.  None if there is no such field.
+    """
+    info = model.model_fields.get(name)
+    if info is None:
+        return None
+    alias = info.alias or name
+    default = _MISSING if info.is_required() else info
+    decorators = model.__pydantic_decorators__.field_validators.values()
+    if any(name in decorator.info.fields for decorator in decorators):
+        validator = projection(model, [name]).__pydantic_validator__
+
+        def validate(value: Any) -> Any:
+            return validator.validate_python({alias: value}).__dict__[name]
+
+        return alias, default, validate
+    annotation: Any = info.annotation
+    if info.metadata:
+        # Constraints such as ``strict`` or ``max_length``.
+        annotation = Annotated[(annotation, *info.metadata)]
+    adapter = TypeAdapter(annotation)
+    return alias, default, adapter.validator.validate_python
+
+
+class LazyRecord(Generic[M]):
+    """Read-only view of one record that validates fields on first access.
+
+    Each field has its own validator, built once per model and field, so
+    reading a few fields costs a few small validations.
+
+    :param model: The response model the record would deserialize to.
+    :param raw: The record as parsed from JSON, keyed by API field names.
+    """
+
+    __slots__ = ("_model", "_raw", "_values")
+
+    def __init__(self, model: Type[M], raw: Dict[str, Any]) -> None:
+        self._model = model
+        self._raw = raw
+        # Validated values by field name, created on first access.
+        self._values: Optional[Dict[str, Any]] = None
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            # Slots not set yet (copy, unpickling) or private names.
+            raise AttributeError(name)
+        field = _field(self._model, name)
+        if field is None:
+            raise AttributeError(
+                "{0!r} has no field {1!r}".format(self._model.__name__, name)
+            )
+        values = self._values
+        if values is None:
+            values = self._values = {}
+        cached = values.get(name, _MISSING)
+        if cached is not _MISSING:
+            return cached
+
+        alias, default, validate = field
+        value = self._raw.get(alias, _MISSING)
+        if value is _MISSING and default is not _MISSING:
+            result = default.get_default(call_default_factory=True)
+        else:
+            result = validate(None if value is _MISSING else value)
+        values[name] = result
+        return result
+
+    @property
+    def model(self) -> Type[M]:
+        """The response model class."""
+        return self._model
+
+    @property
+    def raw(self) -> Dict[str, Any]:
+        """The unvalidated record, keyed by API field names."""
+        return self._raw
+
+    def to_model(self) -> M:
+        """Validate every field and return the full pydantic model."""
+        instance = self._model.model_validate(self._raw)
+        # As in ApiClient's list deserialization: every field counts as set.
+        object.__setattr__(
+            instance, "__pydantic_fields_set__", set(self._model.model_fields)
+        )
+        return instance
+
+    def __dir__(self) -> Iterable[str]:
+        return sorted(set(super().__dir__()) | set(self._model.model_fields))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyRecord):
+            return self._model is other._model and self._raw == other._raw
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return "LazyRecord[{0}]({1!r})".format(self._model.__name__, self._raw)
+
+
+def lazy_records(model: Type[M], rows: Optional[List[Any]]) -> List[LazyRecord[M]]:
+    """Wrap a parsed JSON list page in proxies.
+
+    ``null`` entries stay None, as they do in model lists, so page lengths
+    (and with them the end-of-data check in pagination) are the same.
+    """
+    records = [None if row is None else LazyRecord(model, row) for row in rows or ()]
+    return cast(List[LazyRecord[M]], records)
@@ -0,0 +1,162 @@
+"""Persistent bearer-token cache shared between processes.
+
+Short-lived processes (cron jobs, CLI invocations, worker pools) would
+otherwise each pay an ``/authenticate`` round-trip before their first real
+request, even though a token stays valid for 15 minutes.  Pass a
+:class:`FileTokenCache` to ``MetquayClient(token_cache=...)`` to reuse a
+still-valid token obtained by an earlier process.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import IO, Dict, Iterator, Optional, Tuple
+
+if sys.platform == "win32":
+    import msvcrt
+
+    def _lock(handle: IO[bytes]) -> None:
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+
+    def _unlock(handle: IO[bytes]) -> None:
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _lock(handle: IO[bytes]) -> None:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+
+    def _unlock(handle: IO[bytes]) -> None:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+def _default_path() -> str:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "pymetquay", "tokens.json")
+
+
+def _parse_entry(entry: object) -> Optional[Tuple[str, float, int]]:
+    if not isinstance(entry, dict):
+        return None
+    try:
+        return (
+            str(entry["access_token"]),
+            float(entry["acquired_at"]),
+            int(entry["expires_in"]),
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _is_live(parsed: Optional[Tuple[str, float, int]], now: float) -> bool:
+    return parsed is not None and parsed[1] + parsed[2] > now
+
+
+class FileTokenCache:
+    """Tokens stored in a JSON file, one entry per host and access key.
+
+    Entries are keyed by a SHA-256 digest of the host and access key, so the
+    access key itself is never written to disk.  The file and its lock file
+    are created with mode ``0600`` inside a ``0700`` directory, and every
+    read and write holds an exclusive lock so concurrent processes never see
+    a half-written file.  Timestamps are wall-clock (``time.time()``) because
+    they must be comparable across processes.
+
+    :param path: Cache file location.  Defaults to
+        ``$XDG_CACHE_HOME/pymetquay/tokens.json`` (``~/.cache/...``).
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        self.path = path or _default_path()
+        self._lock_path = self.path + ".lock"
+
+    @staticmethod
+    def key(host: str, access_key: str) -> str:
+        """Cache key for a host and access key pair."""
+        digest = hashlib.sha256()
+        digest.update(host.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(access_key.encode("utf-8"))
+        return digest.hexdigest()
+
+    @contextlib.contextmanager
+    def _locked(self) -> Iterator[None]:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+        fd = os.open(self._lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        with os.fdopen(fd, "r+b") as handle:
+            _lock(handle)
+            try:
+                yield
+            finally:
+                _unlock(handle)
+
+    def _read(self) -> Dict[str, object]:
+        try:
+            with open(self.path, "rb") as handle:
+                data = json.load(handle)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _write(self, entries: Dict[str, object]) -> None:
+        directory = os.path.dirname(self.path) or "."
+        # mkstemp creates the file with mode 0600.
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tokens-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(entries, handle)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+            raise
+
+    def get(self, key: str) -> Optional[Tuple[str, float, int]]:
+        """Return ``(access_token, acquired_at, expires_in)`` or None.
+
+        Expired entries are reported as missing.
+        """
+        with self._locked():
+            parsed = _parse_entry(self._read().get(key))
+        return parsed if _is_live(parsed, time.time()) else None
+
+    def set(
+        self, key: str, access_token: str, acquired_at: float, expires_in: int
+    ) -> None:
+        """Store a token, dropping any entries that have already expired."""
+        now = time.time()
+        with self._locked():
+            entries = {
+                k: v
+                for k, v in self._read().items()
+                if _is_live(_parse_entry(v), now)
+            }
+            entries[key] = {
+                "access_token": access_token,
+                "acquired_at": acquired_at,
+                "expires_in": expires_in,
+            }
+            self._write(entries)
+
+    def clear(self, key: Optional[str] = None) -> None:
+        """Forget one entry, or every entry when ``key`` is None."""
+        with self._locked():
+            entries = {} if key is None else self._read()
+            entries.pop(key or "", None)
+            self._write(entries)
+
+    def __repr__(self) -> str:
+        return "FileTokenCache(path={0!r})".format(self.path)
@@ -30,6 +30,11 @@ REQUIRES = [
     "typing-extensions >= 4.7.1",
     "python-dotenv >= 0.19.0",
 ]
+EXTRAS_REQUIRE = {
+    "async": ["aiohttp >= 3.8"],
+    "fast": ["orjson >= 3.6"],
+    "parquet": ["pyarrow >= 10"],
+}
 
 setup(
     name=NAME,
@@ -40,6 +45,7 @@ setup(
     url="",
     keywords=["OpenAPI", "OpenAPI-Generator", "Metquay CRUD API"],
     install_requires=REQUIRES,
+    extras_require=EXTRAS_REQUIRE,
     packages=find_packages(exclude=["test", "tests"]),
     include_package_data=True,
     license="Apache 2.0",
@@ -49,6 +55,6 @@ setup(
     """,  # noqa: E501
     package_data={  # type: ignore[arg-type]  # setuptools stubs _DictLike vs dict
         "openapi_client": ["py.typed"],
-        "pymetquay": ["py.typed"],
+        "pymetquay": ["py.typed", "openapi.json"],
     },
 )
@@ -0,0 +1,176 @@
+"""
+Unit tests for ``pymetquay.aio.AsyncMetquayClient``.
+These tests are NOT automatically generated.  They run the client against a
+small in-process aiohttp server, so no credentials or network are needed.
+"""
+
+import asyncio
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web  # noqa: E402
+
+from openapi_client.exceptions import ApiException  # noqa: E402
+from openapi_client.models.work_request import WorkRequest  # noqa: E402
+from pymetquay.aio import AsyncMetquayClient  # noqa: E402
+
+TOTAL_WORKS = 130
+
+
+def _make_app(state):
+    async def authenticate(request):
+        state["auth_calls"] += 1
+        await asyncio.sleep(0.01)
+        return web.json_response(
+            {"accessToken": "tok", "tokenType": "Bearer", "expiresIn": 900}
+        )
+
+    async def get_works(request):
+        assert request.headers["Authorization"] == "Bearer tok"
+        first = int(request.query.get("first", 0))
+        limit = int(request.query.get("limit", 50))
+        state["pages"].append(first)
+        end = min(first + limit, TOTAL_WORKS)
+        return web.json_response(
+            [
+                {"id": i, "workNo": f"W{i}", "dueDate": "03-01-2025"}
+                for i in range(first, end)
+            ]
+        )
+
+    async def create_work(request):
+        body = await request.json()
+        if body["customerInstrumentId"] < 0:
+            return web.json_response({"code": 422, "message": "invalid"}, status=422)
+        return web.json_response({"metquayId": 42}, status=201)
+
+    async def update_work(request):
+        state["updated"].append(int(request.match_info["metquay_id"]))
+        return web.Response(status=200)
+
+    app = web.Application()
+    app.router.add_post("/api/v1/authenticate", authenticate)
+    app.router.add_get("/api/v1/works", get_works)
+    app.router.add_post("/api/v1/works", create_work)
+    app.router.add_put("/api/v1/works/{metquay_id}", update_work)
+    return app
+
+
+def _run(scenario):
+    """Start the fake server, run ``scenario(client, state)`` against it."""
+    state = {"auth_calls": 0, "pages": [], "updated": []}
+
+    async def main():
+        runner = web.AppRunner(_make_app(state))
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        try:
+            async with AsyncMetquayClient(
+                access_key="ak",
+                secret_key="sk",
+                host="x.test",
+                rate_limit_per_minute=None,
+            ) as client:
+                client._configuration.host = f"http://127.0.0.1:{port}/api/v1"
+                return await scenario(client, state)
+        finally:
+            await runner.cleanup()
+
+    return asyncio.run(main()), state
+
+
+class TestAsyncMetquayClient:
+    """AsyncMetquayClient against an in-process server."""
+
+    def test_list_works_single_page(self):
+        async def scenario(client, state):
+            return await client.list_works(first=0, limit=5)
+
+        works, state = _run(scenario)
+        assert [w.id for w in works] == [0, 1, 2, 3, 4]
+        assert works[0].due_date.isoformat() == "2025-03-01"
+        assert state["auth_calls"] == 1
+
+    def test_concurrent_calls_share_one_authentication(self):
+        async def scenario(client, state):
+            return await asyncio.gather(
+                *(client.list_works(first=i, limit=1) for i in range(10))
+            )
+
+        _, state = _run(scenario)
+        assert state["auth_calls"] == 1
+
+    @pytest.mark.parametrize("concurrency", [1, 4])
+    def test_paginate_all(self, concurrency):
+        async def scenario(client, state):
+            return await client.list_works(paginate_all=True, concurrency=concurrency)
+
+        works, _ = _run(scenario)
+        assert [w.id for w in works] == list(range(TOTAL_WORKS))
+
+    def test_iter_works(self):
+        async def scenario(client, state):
+            return [w.id async for w in client.iter_works(page_size=50)]
+
+        ids, state = _run(scenario)
+        assert ids == list(range(TOTAL_WORKS))
+        assert state["pages"] == [0, 50, 100]
+
+    def test_create_and_update(self):
+        async def scenario(client, state):
+            request = WorkRequest(customerInstrumentId=1)
+            created = await client.create_work(request)
+            await client.update_work(7, request)
+            return created
+
+        created, state = _run(scenario)
+        assert created.metquay_id == 42
+        assert state["updated"] == [7]
+
+    def test_error_status_raises_api_exception(self):
+        async def scenario(client, state):
+            with pytest.raises(ApiException) as excinfo:
+                await client.create_work(WorkRequest(customerInstrumentId=-1))
+            return excinfo.value
+
+        error, _ = _run(scenario)
+        assert error.status == 422
+
+    def test_metrics_per_operation(self):
+        async def scenario(client, state):
+            await asyncio.gather(*(client.list_works(first=i, limit=2) for i in range(5)))
+            with pytest.raises(ApiException):
+                await client.create_work(WorkRequest(customerInstrumentId=-1))
+            return client.metrics.summary()
+
+        summary, _ = _run(scenario)
+        assert summary["GET /works"]["requests"] == 5
+        assert summary["GET /works"]["by_status"] == {200: 5}
+        assert summary["GET /works"]["phases"]["network"]["mean"] > 0
+        assert summary["POST /works"]["errors"] == 1
+        assert summary["POST /authenticate"]["requests"] == 1
+
+    def test_gather_bounds_concurrency(self):
+        async def scenario(client, state):
+            active = 0
+            peak = 0
+
+            async def job(i):
+                nonlocal active, peak
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.005)
+                active -= 1
+                return i
+
+            results = await client.gather(
+                *(job(i) for i in range(12)), concurrency=3
+            )
+            return results, peak
+
+        (results, peak), _ = _run(scenario)
+        assert results == list(range(12))
+        assert peak == 3
@@ -0,0 +1,145 @@
+"""
+Unit tests for the hand-written parts of ``openapi_client.api_client``.
+These tests are NOT automatically generated.
+"""
+
+import io
+import json
+from unittest.mock import MagicMock
+
+import pytest
+import urllib3
+from pydantic import ValidationError
+
+from openapi_client.api_client import ApiClient
+from openapi_client.exceptions import NotFoundException
+from openapi_client.instrumentation import RequestEvent
+from openapi_client.models.customer_instrument_response import (
+    CustomerInstrumentResponse,
+)
+from openapi_client.models.customer_response import CustomerResponse
+from openapi_client.models.work_response import WorkResponse
+from openapi_client.rest import RESTResponse
+
+PAGES = {
+    CustomerResponse: [
+        {"id": 1, "companyName": "Acme", "isInactive": False},
+        {"id": 2, "companyName": "Globex", "unknownField": "dropped"},
+    ],
+    CustomerInstrumentResponse: [
+        {"id": 3, "tagNo": "T-1", "dueDate": "03-01-2025", "projectNames": ["a"]},
+        {"id": 4, "calibrationCost": 12.5, "calibratedDate": "2025-02-28"},
+    ],
+    WorkResponse: [
+        {"id": 5, "workNo": "W5", "dueDate": "03-01-2025", "accreditation": True},
+        {},
+    ],
+}
+
+
+class TestListDeserialization:
+    """``List[Model]`` responses are validated in one pass."""
+
+    def setup_method(self):
+        self.api_client = ApiClient()
+
+    def _deserialize(self, data, model):
+        return self.api_client.deserialize(
+            json.dumps(data), "List[{0}]".format(model.__name__), "application/json"
+        )
+
+    @pytest.mark.parametrize("model", list(PAGES))
+    def test_matches_per_record_from_dict(self, model):
+        data = PAGES[model]
+        expected = [model.from_dict(item) for item in data]
+        result = self._deserialize(data, model)
+        assert result == expected
+        assert all(type(item) is model for item in result)
+        for got, want in zip(result, expected):
+            assert got.model_fields_set == want.model_fields_set
+            assert got.to_dict() == want.to_dict()
+
+    def test_null_elements_and_empty_page(self):
+        assert self._deserialize([None, {"id": 1}], CustomerResponse)[0] is None
+        assert self._deserialize([], CustomerResponse) == []
+
+    def test_invalid_record_raises(self):
+        with pytest.raises(ValidationError):
+            self._deserialize([{"id": 1}, {"id": "not-an-int"}], CustomerResponse)
+
+    def test_lists_of_primitives_are_unchanged(self):
+        result = self.api_client.deserialize("[1, 2]", "List[int]", "application/json")
+        assert result == [1, 2]
+
+
+WORK_TYPES = {"200": "List[WorkResponse]", "404": "ErrorResponse"}
+
+
+def _streamed(payload, status=200, content_type="application/json"):
+    http_resp = urllib3.HTTPResponse(
+        body=io.BytesIO(json.dumps(payload).encode()),
+        headers={"Content-Type": content_type},
+        status=status,
+        preload_content=False,
+    )
+    http_resp.release_conn = MagicMock()
+    return RESTResponse(http_resp)
+
+
+class TestIterResponseItems:
+    """``List[Model]`` responses deserialized element by element."""
+
+    def setup_method(self):
+        self.api_client = ApiClient()
+
+    def test_matches_whole_page_deserialization(self):
+        page = PAGES[WorkResponse] + [None]
+        items = list(self.api_client.iter_response_items(_streamed(page), WORK_TYPES))
+        assert items == self.api_client.deserialize(
+            json.dumps(page), "List[WorkResponse]", "application/json"
+        )
+        assert items[0].model_fields_set == set(WorkResponse.model_fields)
+
+    def test_reads_the_body_in_chunks(self):
+        response = _streamed([{"id": i} for i in range(100)])
+        items = self.api_client.iter_response_items(
+            response, WORK_TYPES, chunk_size=16
+        )
+        assert next(items).id == 0
+        assert response.data is None
+        assert response.response.tell() < 100
+        assert [w.id for w in items] == list(range(1, 100))
+        response.response.release_conn.assert_called_once_with()
+
+    def test_closing_early_closes_the_connection(self):
+        response = _streamed([{"id": i} for i in range(100)])
+        items = self.api_client.iter_response_items(response, WORK_TYPES, 16)
+        next(items)
+        items.close()
+        assert response.response.closed
+        response.response.release_conn.assert_called_once_with()
+
+    def test_error_status_raises_at_once(self):
+        response = _streamed({"code": 404, "message": "missing"}, status=404)
+        with pytest.raises(NotFoundException):
+            self.api_client.iter_response_items(response, WORK_TYPES)
+
+    def test_non_utf8_body_falls_back_to_whole_page(self):
+        response = _streamed(
+            [{"id": 1}], content_type="application/json; charset=latin-1"
+        )
+        (item,) = self.api_client.iter_response_items(response, WORK_TYPES)
+        assert item.id == 1
+        assert response.data is not None
+
+    def test_request_event_is_finished_when_exhausted(self):
+        events = []
+        self.api_client.configuration.request_hooks = [events.append]
+        response = _streamed([{"id": 1}])
+        response.request_event = RequestEvent("GET", "GET /works")
+        items = self.api_client.iter_response_items(response, WORK_TYPES)
+        assert events == []
+        list(items)
+        (event,) = events
+        assert (event.status, event.response_bytes) == (200, len(b'[{"id": 1}]'))
+        assert event.deserialize_seconds > 0
@@ -0,0 +1,133 @@
+"""
+Unit tests for ``pymetquay.bulk`` and the ``MetquayClient.bulk_*`` methods.
+These tests are NOT automatically generated; the transport is mocked.
+"""
+
+import io
+import json
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+import urllib3
+
+from openapi_client.exceptions import ApiException
+from openapi_client.models.created_response import CreatedResponse
+from openapi_client.models.customer_instrument_request import CustomerInstrumentRequest
+from openapi_client.models.work_request import WorkRequest
+from openapi_client.rest import RESTResponse
+from pymetquay import MetquayClient
+from pymetquay.bulk import run_bulk
+
+
+def _response(payload, status):
+    return RESTResponse(
+        urllib3.HTTPResponse(
+            body=io.BytesIO(json.dumps(payload).encode()),
+            headers={"Content-Type": "application/json"},
+            status=status,
+            preload_content=False,
+        )
+    )
+
+
+class TestRunBulk:
+    def test_collects_successes_and_failures(self):
+        def call(n):
+            if n % 3 == 0:
+                raise ApiException(status=422, reason="Unprocessable")
+            return CreatedResponse(metquayId=n * 10)
+
+        seen = []
+        report = run_bulk("create", call, range(1, 10), on_result=seen.append)
+        assert report.total == 9
+        assert report.created_ids == [10, 20, 40, 50, 70, 80]
+        assert sorted(r.item for r in report.failed) == [3, 6, 9]
+        assert report.failures_by_status == {422: 3}
+        assert sorted(r.index for r in seen) == list(range(9))
+        assert report.throughput > 0
+
+    def test_non_api_errors_are_reported(self):
+        def call(n):
+            raise ConnectionError("reset")
+
+        report = run_bulk("delete", call, [1])
+        assert report.failed[0].status is None
+        assert isinstance(report.failed[0].error, ConnectionError)
+
+    def test_concurrency_is_bounded_and_input_streamed(self):
+        lock = threading.Lock()
+        active = peak = 0
+        consumed = []
+
+        def items():
+            for n in range(40):
+                consumed.append(n)
+                yield n
+
+        def call(n):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+                # Never more than 2 * concurrency submitted ahead of completion.
+                assert len(consumed) - n <= 2 * 3
+            time.sleep(0.002)
+            with lock:
+                active -= 1
+
+        report = run_bulk("update", call, items(), concurrency=3)
+        assert report.total == 40
+        assert peak <= 3
+
+    def test_concurrency_must_be_positive(self):
+        with pytest.raises(ValueError):
+            run_bulk("create", lambda n: n, [1], concurrency=0)
+
+
+class TestClientBulk:
+    def setup_method(self):
+        self.client = MetquayClient(
+            access_key="ak", secret_key="sk", host="x.test", rate_limit_per_minute=None
+        )
+        self.client._ensure_authenticated = MagicMock()
+        self.client._api_client.rest_client = MagicMock()
+
+    def test_bulk_create_is_never_retried(self):
+        rest = self.client._api_client.rest_client
+        rest.request.side_effect = [
+            _response({"metquayId": 1}, 201),
+            _response({"code": 503, "message": "busy"}, 503),
+            _response({"metquayId": 3}, 201),
+        ]
+        report = self.client.bulk_create_instruments(
+            [
+                CustomerInstrumentRequest(
+                    name=str(n), companyId="C1", instrumentCategoryName="Gauge"
+                )
+                for n in range(3)
+            ],
+            concurrency=1,
+        )
+        assert rest.request.call_count == 3
+        assert report.created_ids == [1, 3]
+        assert report.failed[0].index == 1
+        assert report.failed[0].status == 503
+        assert self.client.retry_stats.retries == 0
+
+    def test_bulk_update_works_passes_ids(self):
+        self.client.update_work = MagicMock()
+        updates = [(n, WorkRequest(customerInstrumentId=n)) for n in (5, 6)]
+        report = self.client.bulk_update_works(updates, concurrency=2)
+        assert len(report.succeeded) == 2
+        called = sorted(c.args[0] for c in self.client.update_work.call_args_list)
+        assert called == [5, 6]
+
+    def test_bulk_delete_customers(self):
+        self.client.delete_customer = MagicMock(
+            side_effect=[None, ApiException(status=404, reason="Not Found")]
+        )
+        report = self.client.bulk_delete_customers([1, 2], concurrency=1)
+        assert [r.item for r in report.succeeded] == [1]
+        assert report.failures_by_status == {404: 1}
@@ -0,0 +1,235 @@
+"""
+Unit tests for ``pymetquay.cache`` and the client's use of it.
+These tests are NOT automatically generated.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from openapi_client.api_response import ApiResponse
+from openapi_client.exceptions import ApiException
+from pymetquay import MetquayClient, ResponseCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _key(endpoint="customers", first=0, limit=50, workspace_code=None):
+    return (endpoint, workspace_code, first, limit)
+
+
+class TestResponseCache:
+    def setup_method(self):
+        self.clock = FakeClock()
+
+    def test_hit_after_put(self):
+        cache = ResponseCache(ttl=10, clock=self.clock)
+        assert cache.get(_key()) is None
+        cache.put(_key(), [1, 2], 100)
+        assert cache.get(_key()) == [1, 2]
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert cache.hit_rate == 0.5
+
+    def test_get_returns_a_copy_of_the_page(self):
+        cache = ResponseCache(ttl=10, clock=self.clock)
+        cache.put(_key(), [1, 2], 100)
+        cache.get(_key()).append(3)
+        assert cache.get(_key()) == [1, 2]
+
+    def test_entries_expire_after_ttl(self):
+        cache = ResponseCache(ttl=10, clock=self.clock)
+        cache.put(_key(), [1], 100)
+        self.clock.now += 9.9
+        assert cache.get(_key()) == [1]
+        self.clock.now += 0.1
+        assert cache.get(_key()) is None
+        assert len(cache) == 0
+        assert cache.size_bytes == 0
+
+    def test_per_endpoint_ttl(self):
+        cache = ResponseCache(
+            ttl=60, ttl_by_endpoint={"works": 5, "instruments": 0}, clock=self.clock
+        )
+        cache.put(_key("customers"), [1], 10)
+        cache.put(_key("works"), [2], 10)
+        cache.put(_key("instruments"), [3], 10)
+        assert cache.get(_key("instruments")) is None
+        self.clock.now += 6
+        assert cache.get(_key("works")) is None
+        assert cache.get(_key("customers")) == [1]
+
+    def test_key_includes_paging_and_workspace(self):
+        cache = ResponseCache(clock=self.clock)
+        cache.put(_key(first=0), [1], 10)
+        assert cache.get(_key(first=50)) is None
+        assert cache.get(_key(limit=10)) is None
+        assert cache.get(_key(workspace_code="ws")) is None
+        assert cache.get(_key()) == [1]
+
+    def test_lru_eviction_by_entries(self):
+        cache = ResponseCache(max_entries=2, clock=self.clock)
+        cache.put(_key(first=0), [0], 10)
+        cache.put(_key(first=50), [50], 10)
+        cache.get(_key(first=0))  # now most recently used
+        cache.put(_key(first=100), [100], 10)
+        assert cache.get(_key(first=50)) is None
+        assert cache.get(_key(first=0)) == [0]
+        assert cache.get(_key(first=100)) == [100]
+        assert cache.evictions == 1
+
+    def test_lru_eviction_by_bytes(self):
+        cache = ResponseCache(max_bytes=250, clock=self.clock)
+        cache.put(_key(first=0), [0], 100)
+        cache.put(_key(first=50), [50], 100)
+        cache.put(_key(first=100), [100], 100)
+        assert len(cache) == 2
+        assert cache.size_bytes == 200
+        assert cache.get(_key(first=0)) is None
+
+    def test_oversized_page_is_not_cached(self):
+        cache = ResponseCache(max_bytes=100, clock=self.clock)
+        cache.put(_key(first=0), [0], 50)
+        cache.put(_key(first=50), [50], 101)
+        assert cache.get(_key(first=0)) == [0]
+        assert cache.get(_key(first=50)) is None
+        assert cache.evictions == 0
+
+    def test_replacing_an_entry_keeps_byte_count(self):
+        cache = ResponseCache(clock=self.clock)
+        cache.put(_key(), [1], 100)
+        cache.put(_key(), [2], 30)
+        assert cache.size_bytes == 30
+        assert cache.get(_key()) == [2]
+
+    def test_invalidate_only_drops_one_endpoint(self):
+        cache = ResponseCache(clock=self.clock)
+        cache.put(_key("customers", first=0), [1], 10)
+        cache.put(_key("customers", first=50), [2], 10)
+        cache.put(_key("works"), [3], 10)
+        assert cache.invalidate("customers") == 2
+        assert cache.get(_key("works")) == [3]
+        assert cache.size_bytes == 10
+
+    def test_page_requested_before_invalidate_is_not_stored(self):
+        cache = ResponseCache(clock=self.clock)
+        generation = cache.generation("customers")
+        cache.invalidate("customers")
+        cache.put(_key(), [1], 10, generation)
+        assert cache.get(_key()) is None
+        cache.put(_key(), [2], 10, cache.generation("customers"))
+        assert cache.get(_key()) == [2]
+
+    def test_generation_is_per_endpoint(self):
+        cache = ResponseCache(clock=self.clock)
+        generation = cache.generation("works")
+        cache.invalidate("customers")
+        cache.put(_key("works"), [1], 10, generation)
+        assert cache.get(_key("works")) == [1]
+        cache.clear()
+        cache.put(_key("works"), [2], 10, generation)
+        assert cache.get(_key("works")) is None
+
+    def test_clear(self):
+        cache = ResponseCache(clock=self.clock)
+        cache.put(_key(), [1], 10)
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.size_bytes == 0
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"ttl": -1},
+            {"ttl_by_endpoint": {"works": -1}},
+            {"max_entries": 0},
+            {"max_bytes": 0},
+        ],
+    )
+    def test_rejects_bad_arguments(self, kwargs):
+        with pytest.raises(ValueError):
+            ResponseCache(**kwargs)
+
+
+class TestClientResponseCache:
+    def setup_method(self):
+        self.cache = ResponseCache(ttl=60)
+        self.client = MetquayClient(
+            access_key="ak", secret_key="sk", host="x.test", response_cache=self.cache
+        )
+        self.client._ensure_authenticated = MagicMock()
+        self.client._customers_api = MagicMock()
+        self.client._customers_api.get_customers_with_http_info.side_effect = (
+            lambda **kwargs: ApiResponse(
+                status_code=200, data=["c1", "c2"], raw_data=b"[{}, {}]"
+            )
+        )
+        self.list_fn = self.client._customers_api.get_customers_with_http_info
+
+    def test_repeated_list_is_served_from_cache(self):
+        assert self.client.list_customers(first=0, limit=50) == ["c1", "c2"]
+        assert self.client.list_customers(first=0, limit=50) == ["c1", "c2"]
+        assert self.list_fn.call_count == 1
+        assert self.cache.size_bytes == len(b"[{}, {}]")
+
+    def test_different_pages_are_separate_entries(self):
+        self.client.list_customers(first=0, limit=50)
+        self.client.list_customers(first=50, limit=50)
+        assert self.list_fn.call_count == 2
+
+    def test_paginate_all_bypasses_cache(self):
+        self.client._customers_api.get_customers.return_value = []
+        self.client.list_customers(paginate_all=True)
+        self.list_fn.assert_not_called()
+        assert len(self.cache) == 0
+
+    @pytest.mark.parametrize(
+        "call",
+        [
+            lambda c: c.create_customer(MagicMock()),
+            lambda c: c.update_customer(1, MagicMock()),
+            lambda c: c.delete_customer(1),
+        ],
+    )
+    def test_writes_invalidate_the_entity(self, call):
+        self.client.list_customers(first=0, limit=50)
+        self.cache.put(("works", None, 0, 50), ["w"], 10)
+        call(self.client)
+        self.client.list_customers(first=0, limit=50)
+        assert self.list_fn.call_count == 2
+        assert self.cache.get(("works", None, 0, 50)) == ["w"]
+
+    def test_failed_write_still_invalidates(self):
+        self.client.list_customers(first=0, limit=50)
+        self.client._customers_api.delete_customer.side_effect = ApiException(500)
+        with pytest.raises(ApiException):
+            self.client.delete_customer(1)
+        assert len(self.cache) == 0
+
+    def test_write_during_a_list_is_not_hidden_by_the_cache(self):
+        def list_racing_a_write(**kwargs):
+            # The page is read, then a write lands before the response is
+            # handed back and cached.
+            self.client.delete_customer(1)
+            return ApiResponse(status_code=200, data=["stale"], raw_data=b"[{}]")
+
+        self.list_fn.side_effect = list_racing_a_write
+        assert self.client.list_customers(first=0, limit=50) == ["stale"]
+        assert len(self.cache) == 0
+
+    def test_bulk_writes_invalidate(self):
+        self.client.list_customers(first=0, limit=50)
+        report = self.client.bulk_delete_customers([1, 2])
+        assert len(report.succeeded) == 2
+        assert len(self.cache) == 0
+
+    def test_client_without_cache_always_fetches(self):
+        self.client.response_cache = None
+        self.client.list_customers(first=0, limit=50)
+        self.client.list_customers(first=0, limit=50)
+        assert self.list_fn.call_count == 2
@@ -0,0 +1,362 @@
+"""
+Unit tests for the hand-written ``pymetquay.MetquayClient`` wrapper.
+These tests are NOT automatically generated; the generated API classes are
+replaced with mocks so no network access or credentials are needed.
+"""
+
+import io
+import json
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+import urllib3
+from pydantic import ValidationError
+
+from openapi_client.exceptions import ApiException
+from openapi_client.json_codec import iter_json_array
+from openapi_client.models.error_response import ErrorResponse
+from openapi_client.rest import RESTResponse
+from pymetquay import MetquayClient
+
+
+def _json_response(payload, status=200, headers=None):
+    """Build a RESTResponse carrying ``payload`` as a JSON body."""
+    all_headers = {"Content-Type": "application/json"}
+    all_headers.update(headers or {})
+    return RESTResponse(
+        urllib3.HTTPResponse(
+            body=io.BytesIO(json.dumps(payload).encode()),
+            headers=all_headers,
+            status=status,
+            preload_content=False,
+        )
+    )
+
+
+def _fake_list_fn(total, *, delay=0.0):
+    """Return a list endpoint stand-in serving ``range(total)``."""
+    calls = []
+    lock = threading.Lock()
+
+    def list_fn(first=0, limit=50, workspace_code=None):
+        with lock:
+            calls.append(first)
+        if delay:
+            time.sleep(delay)
+        return list(range(first, min(first + limit, total)))
+
+    list_fn.calls = calls
+    return list_fn
+
+
+class TestPaginateAll:
+    """Serial and concurrent ``_paginate_all`` behaviour."""
+
+    def setup_method(self):
+        self.client = MetquayClient(access_key="ak", secret_key="sk", host="x.test")
+        self.client._ensure_authenticated = MagicMock()
+
+    def test_serial_returns_all_records(self):
+        list_fn = _fake_list_fn(120)
+        result = self.client._paginate_all(list_fn, page_size=50)
+        assert result == list(range(120))
+        assert list_fn.calls == [0, 50, 100]
+
+    @pytest.mark.parametrize("total", [0, 1, 49, 50, 51, 500, 537])
+    def test_concurrent_matches_serial(self, total):
+        list_fn = _fake_list_fn(total, delay=0.001)
+        result = self.client._paginate_all(list_fn, page_size=50, concurrency=4)
+        assert result == list(range(total))
+
+    def test_concurrent_stops_after_short_page(self):
+        list_fn = _fake_list_fn(120)
+        self.client._paginate_all(list_fn, page_size=50, concurrency=3)
+        # Once the short page at offset 100 is seen nothing new is submitted,
+        # so at most ``concurrency`` windows can lie past it.
+        assert sorted(list_fn.calls)[:3] == [0, 50, 100]
+        assert max(list_fn.calls) < 100 + 3 * 50
+
+    def test_concurrent_propagates_errors(self):
+        def failing(first=0, limit=50, workspace_code=None):
+            if first == 100:
+                raise RuntimeError("boom")
+            return list(range(first, first + limit))
+
+        with pytest.raises(RuntimeError, match="boom"):
+            self.client._paginate_all(failing, page_size=50, concurrency=2)
+
+    def test_concurrency_must_be_positive(self):
+        with pytest.raises(ValueError):
+            self.client._paginate_all(_fake_list_fn(1), concurrency=0)
+
+    def test_list_works_forwards_concurrency(self):
+        self.client._works_api = MagicMock()
+        self.client._works_api.get_works.side_effect = _fake_list_fn(75)
+        result = self.client.list_works(paginate_all=True, concurrency=2)
+        assert result == list(range(75))
+
+
+class TestIterators:
+    """Streaming ``iter_*`` generators."""
+
+    def setup_method(self):
+        self.client = MetquayClient(access_key="ak", secret_key="sk", host="x.test")
+        self.client._ensure_authenticated = MagicMock()
+
+    def test_iter_works_yields_records_lazily(self):
+        list_fn = _fake_list_fn(120)
+        self.client._works_api = MagicMock()
+        self.client._works_api.get_works.side_effect = list_fn
+        records = self.client.iter_works(page_size=50)
+        assert list_fn.calls == []
+        assert next(records) == 0
+        assert list_fn.calls == [0]
+        assert list(records) == list(range(1, 120))
+        assert list_fn.calls == [0, 50, 100]
+
+    def test_iter_instrument_pages_yields_pages(self):
+        self.client._instruments_api = MagicMock()
+        self.client._instruments_api.get_customer_instruments.side_effect = (
+            _fake_list_fn(100)
+        )
+        pages = list(self.client.iter_instrument_pages(page_size=50))
+        # An exact multiple of page_size ends with an empty page, not yielded.
+        assert [len(p) for p in pages] == [50, 50]
+
+    def test_iter_customers_reauthenticates_per_page(self):
+        self.client._customers_api = MagicMock()
+        self.client._customers_api.get_customers.side_effect = _fake_list_fn(60)
+        list(self.client.iter_customers(page_size=25, workspace_code="WS"))
+        assert self.client._ensure_authenticated.call_count == 3
+        kwargs = self.client._customers_api.get_customers.call_args.kwargs
+        assert kwargs == {"first": 50, "limit": 25, "workspace_code": "WS"}
+
+    def test_iter_starts_at_first(self):
+        self.client._works_api = MagicMock()
+        self.client._works_api.get_works.side_effect = _fake_list_fn(30)
+        assert list(self.client.iter_works(first=25, page_size=10)) == list(
+            range(25, 30)
+        )
+
+
+class TestStreamedIterators:
+    """``iter_*(stream=True)`` parses records from the response as it is read."""
+
+    def setup_method(self):
+        self.client = MetquayClient(
+            access_key="ak", secret_key="sk", host="x.test", rate_limit_per_minute=None
+        )
+        self.client._ensure_authenticated = MagicMock()
+        self.client._api_client.rest_client = MagicMock()
+        self.request = self.client._api_client.rest_client.request
+
+    def test_pages_until_a_short_page(self):
+        self.request.side_effect = [
+            _json_response([{"id": i, "dueDate": "03-01-2025"} for i in range(3)]),
+            _json_response([{"id": 3}]),
+        ]
+        works = list(self.client.iter_works(page_size=3, stream=True))
+        assert [w.id for w in works] == [0, 1, 2, 3]
+        assert str(works[0].due_date) == "2025-03-01"
+        urls = [call.args[1] for call in self.request.call_args_list]
+        assert urls[1].endswith("/works?first=3&limit=3")
+
+    @pytest.mark.parametrize("fields", [None, ["tag_no"]])
+    def test_pages_are_parsed_incrementally(self, fields):
+        self.request.side_effect = [
+            _json_response([{"id": i, "tagNo": "T"} for i in range(2)]),
+            _json_response([]),
+        ]
+        with patch(
+            "openapi_client.api_client.iter_json_array", wraps=iter_json_array
+        ) as spy:
+            instruments = list(
+                self.client.iter_instruments(fields=fields, page_size=2, stream=True)
+            )
+        assert [i.tag_no for i in instruments] == ["T", "T"]
+        assert spy.call_count == 2
+
+    def test_with_fields(self):
+        self.request.return_value = _json_response([{"id": 1, "tagNo": "T"}])
+        (instrument,) = self.client.iter_instruments(
+            fields=["tag_no"], page_size=5, stream=True
+        )
+        assert instrument.tag_no == "T"
+        assert list(type(instrument).model_fields) == ["tag_no"]
+
+    def test_nothing_is_requested_until_iterated(self):
+        customers = self.client.iter_customers(stream=True)
+        self.request.assert_not_called()
+        self.request.return_value = _json_response([])
+        assert list(customers) == []
+
+
+class TestRawListCalls:
+    """Lazy, projected and streamed lists go through the generated methods."""
+
+    CALLS = {
+        "lazy": lambda client, **kw: client.list_works_lazy(**kw),
+        "projected": lambda client, **kw: client.list_works(fields=["id"], **kw),
+        "streamed": lambda client, **kw: list(
+            client.iter_works(stream=True, **kw)
+        ),
+        "streamed_projected": lambda client, **kw: list(
+            client.iter_works(stream=True, fields=["id"], **kw)
+        ),
+    }
+
+    def setup_method(self):
+        self.client = MetquayClient(
+            access_key="ak",
+            secret_key="sk",
+            host="x.test",
+            rate_limit_per_minute=None,
+            retry_policy=None,
+        )
+        self.client._ensure_authenticated = MagicMock()
+        self.client._api_client.rest_client = MagicMock()
+        self.request = self.client._api_client.rest_client.request
+
+    @pytest.mark.parametrize("call", CALLS)
+    def test_server_error_body_is_deserialized(self, call):
+        self.request.return_value = _json_response(
+            {"code": 500, "message": "boom"}, status=500
+        )
+        with pytest.raises(ApiException) as raised:
+            self.CALLS[call](self.client)
+        assert raised.value.status == 500
+        assert isinstance(raised.value.data, ErrorResponse)
+        assert raised.value.data.message == "boom"
+
+    @pytest.mark.parametrize("call", CALLS)
+    @pytest.mark.parametrize(
+        "arguments",
+        [{"first": -1}, {"workspace_code": 7}, {"limit": 0}],
+        ids=["first", "workspace_code", "limit"],
+    )
+    def test_arguments_are_validated_before_sending(self, call, arguments):
+        if call.startswith("streamed") and "limit" in arguments:
+            arguments = {"page_size": 0}
+        with pytest.raises(ValidationError):
+            self.CALLS[call](self.client, **arguments)
+        self.request.assert_not_called()
+
+
+class TestRateLimiting:
+    """The client's requests share the ApiClient's token bucket."""
+
+    def test_default_limiter_matches_api_quota(self):
+        client = MetquayClient(access_key="ak", secret_key="sk", host="x.test")
+        assert client.rate_limiter is not None
+        assert client.rate_limiter.rate_per_minute == 100
+        assert client.rate_limiter.burst == 1
+
+    def test_limiter_can_be_configured_or_disabled(self):
+        client = MetquayClient(
+            access_key="ak",
+            secret_key="sk",
+            host="x.test",
+            rate_limit_per_minute=600,
+            rate_limit_burst=5,
+        )
+        assert client.rate_limiter.burst == 5
+        disabled = MetquayClient(
+            access_key="ak", secret_key="sk", host="x.test", rate_limit_per_minute=None
+        )
+        assert disabled.rate_limiter is None
+
+    def test_authenticate_goes_through_limiter(self):
+        client = MetquayClient(access_key="ak", secret_key="sk", host="x.test")
+        client._api_client.rate_limiter = MagicMock()
+        client._api_client.rest_client = MagicMock()
+        client._api_client.rest_client.request.return_value = _json_response(
+            {"accessToken": "tok", "tokenType": "Bearer"}
+        )
+        client.authenticate()
+        client._api_client.rate_limiter.acquire.assert_called_once_with()
+        assert client._token == "tok"
+
+
+class TestTokenRefresh:
+    """Single-flight and background token renewal."""
+
+    def _client(self, **kwargs):
+        client = MetquayClient(
+            access_key="ak", secret_key="sk", host="x.test", **kwargs
+        )
+        client._auth_api = MagicMock()
+        return client
+
+    @staticmethod
+    def _token_response(expires_in=900):
+        response = MagicMock()
+        response.access_token = "tok"
+        response.expires_in = expires_in
+        return response
+
+    def test_concurrent_callers_share_one_refresh(self):
+        client = self._client()
+
+        def slow_auth(request):
+            time.sleep(0.05)
+            return self._token_response()
+
+        client._auth_api.get_access_token.side_effect = slow_auth
+        threads = [
+            threading.Thread(target=client._ensure_authenticated) for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert client._auth_api.get_access_token.call_count == 1
+        assert client._configuration.access_token == "tok"
+
+    def test_expiring_token_is_refreshed(self):
+        client = self._client()
+        client._auth_api.get_access_token.return_value = self._token_response()
+        client._ensure_authenticated()
+        client._token_acquired_at -= 800
+        client._ensure_authenticated()
+        assert client._auth_api.get_access_token.call_count == 2
+
+    def test_background_renewal_runs_until_close(self, monkeypatch):
+        monkeypatch.setattr("pymetquay.client._BACKGROUND_RETRY_SECONDS", 0.01)
+        renewed = threading.Event()
+        calls = []
+
+        def auth(request):
+            calls.append(request)
+            if len(calls) >= 3:
+                renewed.set()
+            return self._token_response(expires_in=1)
+
+        with self._client(auto_refresh=True) as client:
+            client._auth_api.get_access_token.side_effect = auth
+            client.authenticate()
+            assert renewed.wait(5)
+            thread = client._refresh_thread
+        assert client._refresh_thread is None
+        assert not thread.is_alive()
+
+    def test_no_background_thread_by_default(self):
+        client = self._client()
+        client._auth_api.get_access_token.return_value = self._token_response()
+        client.authenticate()
+        assert client._refresh_thread is None
+
+
+class TestHost:
+    """``host`` may be a bare host name or a full base URL."""
+
+    def test_bare_host_uses_https(self):
+        client = MetquayClient(access_key="ak", secret_key="sk", host="acme.test")
+        assert client._configuration.host == "https://acme.test/api/v1"
+
+    def test_url_keeps_its_scheme(self):
+        client = MetquayClient(
+            access_key="ak", secret_key="sk", host="http://127.0.0.1:8080/"
+        )
+        assert client._configuration.host == "http://127.0.0.1:8080/api/v1"
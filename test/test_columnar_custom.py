@@ -0,0 +1,133 @@
+"""
+Unit tests for ``pymetquay.columnar``.
+These tests are NOT automatically generated.
+"""
+
+from datetime import date
+from unittest.mock import MagicMock
+
+import pytest
+
+from openapi_client.models.customer_instrument_response import (
+    CustomerInstrumentResponse,
+)
+from openapi_client.models.work_response import WorkResponse
+from pymetquay import ColumnarResult, MetquayClient
+
+
+def _work(index, **overrides):
+    values = {
+        "id": index,
+        "workNo": "W-{0:05d}".format(index),
+        "status": ["Open", "Closed"][index % 2],
+        "inDate": "03-{0:02d}-2025".format(index % 28 + 1),
+        "accreditation": [True, False, None][index % 3],
+        "customerInstrumentId": None if index % 4 == 0 else index * 10,
+    }
+    values.update(overrides)
+    return WorkResponse.from_dict(values)
+
+
+def _works(count):
+    return [_work(i) for i in range(count)]
+
+
+class TestColumnarResult:
+    def setup_method(self):
+        self.records = _works(10)
+        self.result = ColumnarResult.from_records(WorkResponse, self.records)
+
+    def test_length_and_fields(self):
+        assert len(self.result) == 10
+        assert self.result.fields == tuple(WorkResponse.model_fields)
+
+    def test_storage_kinds_follow_field_types(self):
+        assert self.result.kind("work_no") == "str"
+        assert self.result.kind("in_date") == "date"
+        assert self.result.kind("id") == "int"
+        assert self.result.kind("accreditation") == "bool"
+
+    def test_object_column_for_unions_and_lists(self):
+        result = ColumnarResult(CustomerInstrumentResponse)
+        assert result.kind("calibration_cost") == "object"
+        assert result.kind("project_names") == "object"
+
+    def test_rows_round_trip(self):
+        for index, record in enumerate(self.records):
+            row = self.result.row(index)
+            for name in WorkResponse.model_fields:
+                assert row[name] == getattr(record, name)
+
+    def test_values_keep_their_types(self):
+        assert self.result.value(0, "in_date") == date(2025, 3, 1)
+        assert self.result.value(0, "accreditation") is True
+        assert self.result.value(1, "accreditation") is False
+        assert self.result.value(2, "accreditation") is None
+        assert self.result.value(0, "customer_instrument_id") is None
+        assert self.result.value(1, "customer_instrument_id") == 10
+        assert self.result.value(0, "remarks") is None
+
+    def test_negative_and_out_of_range_indexes(self):
+        assert self.result[-1]["id"] == 9
+        with pytest.raises(IndexError):
+            self.result.row(10)
+
+    def test_column(self):
+        assert self.result.column("status") == ["Open", "Closed"] * 5
+
+    def test_unknown_field(self):
+        with pytest.raises(KeyError, match="no field 'nope'"):
+            self.result.column("nope")
+
+    def test_to_model(self):
+        model = self.result.to_model(3)
+        assert isinstance(model, WorkResponse)
+        assert model == self.records[3]
+        assert model.to_dict() == self.records[3].to_dict()
+
+    def test_to_models(self):
+        assert self.result.to_models() == self.records
+
+    def test_iteration_yields_rows(self):
+        assert [row["id"] for row in self.result] == list(range(10))
+
+    def test_strings_are_stored_once(self):
+        column = self.result._columns["status"]
+        assert column.values == [None, "Open", "Closed"]
+        assert column._lookup is None  # dropped once built
+
+    def test_from_pages(self):
+        pages = [self.records[:4], self.records[4:8], self.records[8:]]
+        result = ColumnarResult.from_pages(WorkResponse, iter(pages))
+        assert result.to_models() == self.records
+
+    def test_empty(self):
+        result = ColumnarResult.from_records(WorkResponse, [])
+        assert len(result) == 0
+        assert result.column("id") == []
+
+    def test_smaller_than_models(self):
+        from pymetquay.index import _deep_sizeof
+
+        records = _works(500)
+        result = ColumnarResult.from_records(WorkResponse, records)
+        assert result.memory_footprint() * 3 < _deep_sizeof(records, set())
+
+
+class TestClientColumnar:
+    def test_list_works_columnar_pages_through_the_api(self):
+        client = MetquayClient(access_key="ak", secret_key="sk", host="x.test")
+        client._ensure_authenticated = MagicMock()
+        records = _works(120)
+
+        def get_works(first=0, limit=50, workspace_code=None):
+            return records[first:][:limit]
+
+        client._works_api = MagicMock()
+        client._works_api.get_works.side_effect = get_works
+
+        result = client.list_works_columnar(page_size=50)
+
+        assert len(result) == 120
+        assert result.column("id") == list(range(120))
+        assert client._works_api.get_works.call_count == 3
@@ -0,0 +1,68 @@
+"""
+Unit tests for ``openapi_client.dates.parse_api_date``.
+These tests are NOT automatically generated.
+"""
+
+from datetime import date, datetime
+
+import pytest
+
+from openapi_client.dates import DATE_FORMATS, parse_api_date
+from openapi_client.models.work_response import WorkResponse
+
+
+def _strptime_reference(value):
+    """The parsing the model validators did before the shared parser."""
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+class TestParseApiDate:
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "03-01-2025",
+            "12-31-1999",
+            "02-29-2024",
+            "3-1-2025",
+            "2025-03-01",
+            "2025-3-1",
+            "02-30-2025",
+            "13-01-2025",
+            "2025-13-01",
+            "2025/03/01",
+            "03-01-25",
+            "0a-01-2025",
+            "١٢-01-2025",
+            "",
+            "not a date",
+        ],
+    )
+    def test_matches_strptime(self, value):
+        assert parse_api_date(value) == _strptime_reference(value)
+
+    def test_repeated_values_hit_the_cache(self):
+        parse_api_date.cache_clear()
+        for _ in range(3):
+            assert parse_api_date("07-04-2025") == date(2025, 7, 4)
+        info = parse_api_date.cache_info()
+        assert (info.hits, info.misses) == (2, 1)
+        assert info.maxsize is not None
+
+
+class TestModelValidators:
+    def test_work_response_date_fields(self):
+        work = WorkResponse.from_dict(
+            {"dueDate": "03-01-2025", "inDate": "2025-02-01", "workDate": None}
+        )
+        assert work.due_date == date(2025, 3, 1)
+        assert work.in_date == date(2025, 2, 1)
+        assert work.work_date is None
+
+    def test_unparseable_date_still_fails_validation(self):
+        with pytest.raises(ValueError):
+            WorkResponse.from_dict({"dueDate": "sometime"})
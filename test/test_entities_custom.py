@@ -0,0 +1,44 @@
+"""
+Unit tests for ``pymetquay.entities``.
+These tests are NOT automatically generated.
+"""
+
+import datetime
+from typing import List, Optional, Union
+
+import pytest
+from pydantic import Field
+from typing_extensions import Annotated
+
+from openapi_client.models.work_response import WorkResponse
+from pymetquay.client import MetquayClient
+from pymetquay.entities import ENTITIES, base_types, lookup_entity
+
+
+class TestEntities:
+    def test_lookup(self):
+        assert lookup_entity("works") == (WorkResponse, "iter_work_pages")
+
+    def test_unknown_entity(self):
+        with pytest.raises(ValueError, match="expected one of customers"):
+            lookup_entity("widgets")
+
+    def test_page_iterators_exist(self):
+        for _, method in ENTITIES.values():
+            assert callable(getattr(MetquayClient, method))
+
+
+class TestBaseTypes:
+    @pytest.mark.parametrize(
+        "annotation, expected",
+        [
+            (int, {int}),
+            (Optional[str], {str}),
+            (Union[int, float, None], {int, float}),
+            (Annotated[Optional[datetime.date], Field(alias="x")], {datetime.date}),
+            (Optional[List[str]], {List[str]}),
+            (type(None), set()),
+        ],
+    )
+    def test_strips_optional_and_annotated(self, annotation, expected):
+        assert base_types(annotation) == expected
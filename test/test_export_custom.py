@@ -0,0 +1,198 @@
+"""
+Unit tests for ``pymetquay.export``.
+These tests are NOT automatically generated.
+"""
+
+import csv
+import json
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from openapi_client.models.customer_instrument_response import (
+    CustomerInstrumentResponse,
+)
+from openapi_client.models.work_response import WorkResponse
+from pymetquay import MetquayClient, export_entity, export_pages
+
+
+def _work(index):
+    return WorkResponse.from_dict(
+        {
+            "id": index,
+            "workNo": "W-{0}".format(index),
+            "inDate": "03-01-2025",
+            "accreditation": index % 2 == 0,
+            "remarks": None if index % 3 else 'has "quotes", commas',
+        }
+    )
+
+
+def _pages(total, page_size=4):
+    records = [_work(i) for i in range(total)]
+    return [records[i:][:page_size] for i in range(0, total, page_size)]
+
+
+class TestJsonl:
+    def test_one_object_per_record(self, tmp_path):
+        path = str(tmp_path / "works.jsonl")
+        report = export_pages(WorkResponse, _pages(10), path)
+
+        with open(path, encoding="utf-8") as handle:
+            lines = [json.loads(line) for line in handle]
+        assert len(lines) == 10
+        assert lines[0] == {
+            "id": 0,
+            "workNo": "W-0",
+            "inDate": "2025-03-01",
+            "accreditation": True,
+            "remarks": 'has "quotes", commas',
+        }
+        assert "remarks" not in lines[1]
+        assert (report.rows, report.pages, report.format) == (10, 3, "jsonl")
+        assert report.bytes == os.path.getsize(path)
+
+    def test_round_trips_through_from_json(self, tmp_path):
+        path = str(tmp_path / "works.ndjson")
+        export_pages(WorkResponse, _pages(5), path)
+        with open(path, encoding="utf-8") as handle:
+            records = [WorkResponse.from_json(line) for line in handle]
+        assert records == [r for page in _pages(5) for r in page]
+
+
+class TestCsv:
+    def test_header_uses_api_names(self, tmp_path):
+        path = str(tmp_path / "works.csv")
+        export_pages(WorkResponse, _pages(6), path)
+
+        with open(path, newline="", encoding="utf-8") as handle:
+            rows = list(csv.DictReader(handle))
+        assert len(rows) == 6
+        assert list(rows[0]) == [
+            info.alias or name for name, info in WorkResponse.model_fields.items()
+        ]
+        assert rows[0]["workNo"] == "W-0"
+        assert rows[0]["inDate"] == "2025-03-01"
+        assert rows[0]["accreditation"] == "true"
+        assert rows[1]["accreditation"] == "false"
+        assert rows[0]["remarks"] == 'has "quotes", commas'
+        assert rows[1]["remarks"] == ""
+
+    def test_lists_are_written_as_json(self, tmp_path):
+        path = str(tmp_path / "instruments.csv")
+        record = CustomerInstrumentResponse.from_dict(
+            {"id": 1, "projectNames": ["a", "b"]}
+        )
+        export_pages(CustomerInstrumentResponse, [[record]], path)
+        with open(path, newline="", encoding="utf-8") as handle:
+            (row,) = csv.DictReader(handle)
+        assert json.loads(row["projectNames"]) == ["a", "b"]
+
+
+class TestAtomicity:
+    def test_failed_export_keeps_previous_file(self, tmp_path):
+        path = tmp_path / "works.jsonl"
+        path.write_text("previous\n")
+
+        def pages():
+            yield _pages(4)[0]
+            raise RuntimeError("connection lost")
+
+        with pytest.raises(RuntimeError):
+            export_pages(WorkResponse, pages(), str(path))
+        assert path.read_text() == "previous\n"
+        assert os.listdir(str(tmp_path)) == ["works.jsonl"]
+
+    def test_replaces_existing_file(self, tmp_path):
+        path = tmp_path / "works.jsonl"
+        path.write_text("previous\n")
+        export_pages(WorkResponse, _pages(2), str(path))
+        assert len(path.read_text().splitlines()) == 2
+
+
+class TestOptions:
+    def test_progress_callback_per_page(self, tmp_path):
+        seen = []
+        export_pages(
+            WorkResponse,
+            _pages(10),
+            str(tmp_path / "works.jsonl"),
+            on_progress=lambda report: seen.append(report.rows),
+        )
+        assert seen == [4, 8, 10]
+
+    @pytest.mark.parametrize("suffix", ["jsonl", "csv", "parquet"])
+    def test_null_records_are_skipped(self, tmp_path, suffix):
+        if suffix == "parquet":
+            pytest.importorskip("pyarrow")
+        pages = [[_work(0), None, _work(1)], [None]]
+        path = str(tmp_path / "works.{0}".format(suffix))
+        report = export_pages(WorkResponse, pages, path)
+        assert report.rows == 2
+        assert report.pages == 2
+        if suffix == "jsonl":
+            with open(path) as handle:
+                assert [json.loads(line)["id"] for line in handle] == [0, 1]
+        elif suffix == "csv":
+            with open(path, newline="") as handle:
+                assert [row["id"] for row in csv.DictReader(handle)] == ["0", "1"]
+
+    def test_explicit_format_overrides_suffix(self, tmp_path):
+        path = str(tmp_path / "works.txt")
+        report = export_pages(WorkResponse, _pages(2), path, format="csv")
+        assert report.format == "csv"
+        with open(path, encoding="utf-8") as handle:
+            assert handle.readline().startswith("id,workNo,")
+
+    def test_unknown_suffix(self, tmp_path):
+        with pytest.raises(ValueError, match="Cannot infer"):
+            export_pages(WorkResponse, [], str(tmp_path / "works.txt"))
+
+    def test_unknown_format(self, tmp_path):
+        with pytest.raises(ValueError, match="Unknown export format"):
+            export_pages(WorkResponse, [], str(tmp_path / "w.csv"), format="xml")
+
+
+class TestParquet:
+    def test_round_trip(self, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = str(tmp_path / "works.parquet")
+        export_pages(WorkResponse, _pages(10), path)
+        table = pq.read_table(path)
+        assert table.num_rows == 10
+        assert table.column("workNo").to_pylist()[0] == "W-0"
+        assert str(table.schema.field("inDate").type) == "date32[day]"
+
+    def test_missing_pyarrow_is_reported(self, tmp_path):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            pass
+        else:
+            pytest.skip("pyarrow is installed")
+        path = tmp_path / "works.parquet"
+        with pytest.raises(ImportError, match=r"pymetquay\[parquet\]"):
+            export_pages(WorkResponse, _pages(1), str(path))
+        assert not path.exists()
+        assert os.listdir(str(tmp_path)) == []
+
+
+class TestExportEntity:
+    def test_pages_through_the_client(self, tmp_path):
+        client = MetquayClient(access_key="ak", secret_key="sk", host="x.test")
+        client.iter_work_pages = MagicMock(return_value=iter(_pages(7)))
+        report = export_entity(
+            client, "works", str(tmp_path / "works.jsonl"), page_size=4
+        )
+        client.iter_work_pages.assert_called_once_with(
+            page_size=4, workspace_code=None
+        )
+        assert report.rows == 7
+        assert report.entity == "works"
+        assert report.rows_per_second > 0
+
+    def test_unknown_entity(self, tmp_path):
+        client = MetquayClient(access_key="ak", secret_key="sk", host="x.test")
+        with pytest.raises(ValueError, match="Unknown entity"):
+            export_entity(client, "categories", str(tmp_path / "c.jsonl"))
@@ -0,0 +1,275 @@
+"""
+Unit tests for ``pymetquay.fake_server``.
+These tests are NOT automatically generated.
+"""
+
+import json
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from openapi_client.exceptions import UnauthorizedException
+from openapi_client.models.work_request import WorkRequest
+from pymetquay import MetquayClient
+from pymetquay.fake_server import FakeMetquayServer, load_spec, synthetic_value
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _call(server, method, path, body=None, token=None):
+    headers = {"Authorization": "Bearer " + token} if token else {}
+    raw = json.dumps(body).encode() if body is not None else b""
+    status, response_headers, payload = server.handle(
+        method, "/api/v1" + path, headers, raw
+    )
+    return status, response_headers, json.loads(payload) if payload else None
+
+
+def _token(server, access_key="ak"):
+    status, _, body = _call(
+        server, "POST", "/authenticate", {"accessKey": access_key, "secretKey": "sk"}
+    )
+    assert status == 200
+    return body["accessToken"]
+
+
+class TestAuthentication:
+    def test_token_required(self):
+        server = FakeMetquayServer(seed_records=1)
+        assert _call(server, "GET", "/works")[0] == 401
+        assert _call(server, "GET", "/works", token=_token(server))[0] == 200
+
+    def test_credentials_are_checked(self):
+        server = FakeMetquayServer(credentials={"ak": "right"})
+        status, _, body = _call(
+            server, "POST", "/authenticate", {"accessKey": "ak", "secretKey": "x"}
+        )
+        assert status == 401
+        assert "secret key" in body["message"]
+
+    def test_tokens_expire(self):
+        clock = FakeClock()
+        server = FakeMetquayServer(token_ttl=60, clock=clock)
+        token = _token(server)
+        clock.now += 59
+        assert _call(server, "GET", "/works", token=token)[0] == 200
+        clock.now += 1
+        assert _call(server, "GET", "/works", token=token)[0] == 401
+
+    def test_missing_required_fields(self):
+        server = FakeMetquayServer()
+        status, _, body = _call(server, "POST", "/authenticate", {"accessKey": "ak"})
+        assert status == 422
+        assert "secretKey" in body["message"]
+
+
+class TestListing:
+    def test_pagination_uses_spec_parameters(self):
+        server = FakeMetquayServer(seed_records={"/works": 7})
+        token = _token(server)
+        _, _, page = _call(server, "GET", "/works?first=5&limit=5", token=token)
+        assert [r["id"] for r in page] == [6, 7]
+        _, _, page = _call(server, "GET", "/works", token=token)
+        assert len(page) == 7
+
+    def test_page_cap(self):
+        server = FakeMetquayServer(seed_records=20, page_cap=3)
+        token = _token(server)
+        _, _, page = _call(server, "GET", "/customers?limit=10", token=token)
+        assert len(page) == 3
+
+    def test_workspace_filter(self):
+        server = FakeMetquayServer(seed_records={"/works": 6})
+        token = _token(server)
+        workspace = server.records("/works")[0]["workspaceCode"]
+        _, _, page = _call(
+            server, "GET", "/works?workspaceCode=" + workspace, token=token
+        )
+        assert page
+        assert all(r["workspaceCode"] == workspace for r in page)
+
+    def test_bad_paging_arguments(self):
+        server = FakeMetquayServer()
+        token = _token(server)
+        assert _call(server, "GET", "/works?limit=0", token=token)[0] == 400
+        assert _call(server, "GET", "/works?first=x", token=token)[0] == 400
+
+    def test_unknown_route_and_method(self):
+        server = FakeMetquayServer()
+        assert _call(server, "GET", "/nowhere")[0] == 404
+        assert _call(server, "PATCH", "/works")[0] == 405
+
+
+class TestWrites:
+    def test_create_update_delete(self):
+        server = FakeMetquayServer()
+        token = _token(server)
+        status, _, body = _call(
+            server, "POST", "/customers", {"companyName": "Acme"}, token=token
+        )
+        assert status == 201
+        customer_id = body["metquayId"]
+        assert server.records("/customers")[0]["companyName"] == "Acme"
+
+        status, _, _ = _call(
+            server,
+            "PUT",
+            "/customers/{0}".format(customer_id),
+            {"companyName": "Acme Ltd"},
+            token=token,
+        )
+        assert status == 200
+        assert server.records("/customers")[0]["companyName"] == "Acme Ltd"
+
+        path = "/customers/{0}".format(customer_id)
+        assert _call(server, "DELETE", path, token=token)[0] == 200
+        assert server.records("/customers") == []
+        assert _call(server, "DELETE", path, token=token)[0] == 404
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            {},
+            {"companyName": 12},
+            {"companyName": "Acme", "isInactive": "no"},
+            [],
+        ],
+    )
+    def test_invalid_bodies_are_rejected(self, body):
+        server = FakeMetquayServer()
+        status, _, _ = _call(server, "POST", "/customers", body, token=_token(server))
+        assert status == 422
+        assert server.records("/customers") == []
+
+    def test_malformed_json(self):
+        server = FakeMetquayServer()
+        status, _, _ = server.handle(
+            "POST",
+            "/api/v1/customers",
+            {"Authorization": "Bearer " + _token(server)},
+            b"{",
+        )
+        assert status == 400
+
+    @pytest.mark.parametrize("raw", [b"", b"[1]", b'"text"'])
+    def test_non_object_body_without_schema(self, raw):
+        spec = load_spec()
+        del spec["paths"]["/customers"]["post"]["requestBody"]
+        server = FakeMetquayServer(spec=spec)
+        status, _, payload = server.handle(
+            "POST",
+            "/api/v1/customers",
+            {"Authorization": "Bearer " + _token(server)},
+            raw,
+        )
+        assert status == 400
+        assert "JSON object" in json.loads(payload)["message"]
+
+    def test_unexpected_errors_answer_500(self, monkeypatch):
+        server = FakeMetquayServer(seed_records=1)
+        token = _token(server)
+        monkeypatch.setattr(server, "_dispatch", MagicMock(side_effect=KeyError("x")))
+        status, _, payload = _call(server, "GET", "/works", token=token)
+        assert status == 500
+        assert payload["code"] == 500
+
+
+class TestFaults:
+    def test_rate_limit_with_retry_after(self):
+        clock = FakeClock()
+        server = FakeMetquayServer(rate_limit_per_minute=2, clock=clock)
+        token = _token(server)
+        assert _call(server, "GET", "/works", token=token)[0] == 200
+        clock.now += 20
+        assert _call(server, "GET", "/works", token=token)[0] == 200
+        status, headers, body = _call(server, "GET", "/works", token=token)
+        assert status == 429
+        assert headers["Retry-After"] == "40"
+        assert "rate limit" in body["message"]
+
+        # Each access key has its own window.
+        assert _call(server, "GET", "/works", token=_token(server, "other"))[0] == 200
+        clock.now += 40
+        assert _call(server, "GET", "/works", token=token)[0] == 200
+
+    def test_fail_next_targets_an_operation(self):
+        server = FakeMetquayServer()
+        token = _token(server)
+        server.fail_next(503, count=2, operation_id="getWorks")
+        assert _call(server, "GET", "/customers", token=token)[0] == 200
+        assert _call(server, "GET", "/works", token=token)[0] == 503
+        assert _call(server, "GET", "/works", token=token)[0] == 503
+        assert _call(server, "GET", "/works", token=token)[0] == 200
+
+    def test_error_rate_is_reproducible(self):
+        def statuses():
+            server = FakeMetquayServer(error_rate=0.5, random_seed=7)
+            return [_call(server, "GET", "/works")[0] for _ in range(20)]
+
+        first = statuses()
+        assert first == statuses()
+        assert {500, 502, 503} & set(first)
+        assert 401 in first
+
+    def test_error_rate_is_validated(self):
+        with pytest.raises(ValueError, match="error_rate"):
+            FakeMetquayServer(error_rate=2)
+
+    def test_stats(self):
+        server = FakeMetquayServer()
+        _call(server, "GET", "/works")
+        _token(server)
+        assert server.stats() == {
+            "requests": {"getWorks": 1, "getAccessToken": 1},
+            "statuses": {"401": 1, "200": 1},
+        }
+
+
+class TestSyntheticValues:
+    def test_dates_use_the_api_format(self):
+        value = synthetic_value("inDate", {"type": "string", "format": "date"}, 3)
+        month, day, year = value.split("-")
+        assert len(year) == 4 and 1 <= int(month) <= 12 and 1 <= int(day) <= 31
+
+    def test_enums_cycle_through_values(self):
+        schema = {"type": "string", "enum": ["a", "b"]}
+        assert [synthetic_value("x", schema, i) for i in range(3)] == ["a", "b", "a"]
+
+
+class TestSpec:
+    def test_packaged_spec_matches_the_checkout(self):
+        root = os.path.join(os.path.dirname(os.path.dirname(__file__)), "1.0.json")
+        with open(root, encoding="utf-8") as handle:
+            assert load_spec() == json.load(handle)
+
+
+class TestWithClient:
+    def test_round_trip_over_http(self):
+        with FakeMetquayServer(seed_records=12) as server:
+            client = MetquayClient(
+                access_key="ak",
+                secret_key="sk",
+                host=server.url,
+                rate_limit_per_minute=None,
+            )
+            with client:
+                pages = list(client.iter_work_pages(page_size=5))
+                assert [len(page) for page in pages] == [5, 5, 2]
+                works = [work for page in pages for work in page]
+                client.create_work(WorkRequest(customer_instrument_id=works[0].id))
+                assert len(client.list_works(paginate_all=True)) == 13
+
+                server.fail_next(503, operation_id="getCustomers")
+                assert len(client.list_customers(limit=3)) == 3
+
+                server.expire_tokens()
+                with pytest.raises(UnauthorizedException):
+                    client.list_works(limit=1)
+            assert server.stats()["requests"]["getCustomers"] == 2
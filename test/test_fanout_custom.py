@@ -0,0 +1,153 @@
+"""
+Unit tests for ``pymetquay.fanout``.
+These tests are NOT automatically generated.
+"""
+
+import gc
+import threading
+import time
+
+import pytest
+
+from pymetquay import MetquayClient
+from pymetquay.fake_server import FakeMetquayServer
+from pymetquay.fanout import FanOut, FanOutReport, fan_out
+
+INSTRUMENTS = "/customer-instrument-details"
+
+
+def _pages(records_by_code, page_size=2):
+    def pages(code):
+        records = records_by_code[code]
+        for start in range(0, len(records), page_size):
+            yield records[start:][:page_size]
+
+    return pages
+
+
+def _fan_out(pages, codes, concurrency=2):
+    return FanOut(pages, FanOutReport(None, codes), concurrency)
+
+
+class TestFanOut:
+    def test_merges_and_tags_records(self):
+        records = {"A": [1, 2, 3], "B": [10, 20], "C": []}
+        listing = _fan_out(_pages(records), ["A", "B", "C"])
+        pairs = list(listing)
+        assert sorted(pairs) == [("A", 1), ("A", 2), ("A", 3), ("B", 10), ("B", 20)]
+        assert [r for c, r in pairs if c == "A"] == [1, 2, 3]
+
+        report = listing.report
+        assert list(report.workspaces) == ["A", "B", "C"]
+        assert [w.records for w in report.workspaces.values()] == [3, 2, 0]
+        assert report.workspaces["A"].pages == 2
+        assert report.records == 5
+        assert report.finished_at >= report.started_at > 0
+        assert all(w.elapsed >= 0 for w in report.workspaces.values())
+
+    def test_workspaces_are_paged_concurrently(self):
+        running = []
+        peak = []
+        lock = threading.Lock()
+
+        def pages(code):
+            with lock:
+                running.append(code)
+                peak.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.remove(code)
+            yield [code]
+
+        listing = _fan_out(pages, ["A", "B", "C", "D"], concurrency=3)
+        assert len(list(listing)) == 4
+        assert max(peak) == 3
+
+    def test_failed_workspace_does_not_stop_others(self):
+        def pages(code):
+            yield [code + "1"]
+            if code == "B":
+                raise RuntimeError("boom")
+            yield [code + "2"]
+
+        listing = _fan_out(pages, ["A", "B"])
+        assert sorted(r for _, r in listing) == ["A1", "A2", "B1"]
+        (failed,) = listing.report.failed
+        assert failed.workspace_code == "B"
+        assert failed.records == 1
+        assert "boom" in repr(failed)
+
+    def test_close_stops_paging(self):
+        requested = []
+
+        def pages(code):
+            for page in range(1000):
+                requested.append(page)
+                yield [page]
+
+        with _fan_out(pages, ["A"], concurrency=1) as listing:
+            assert next(listing) == ("A", 0)
+        assert len(requested) < 10
+        assert listing.report.finished_at > 0
+
+    def test_breaking_out_stops_the_workers(self):
+        def pages(code):
+            for page in range(1000):
+                yield [page]
+
+        for _ in _fan_out(pages, ["A", "B", "C"], concurrency=2):
+            break
+        gc.collect()
+        workers = [
+            thread
+            for thread in threading.enumerate()
+            if thread.name.startswith("pymetquay-fanout")
+        ]
+        assert workers == []
+
+    def test_nothing_runs_until_iterated(self):
+        listing = _fan_out(_pages({}), ["A"])
+        assert listing.report.started_at == 0.0
+
+    def test_no_workspaces(self):
+        assert list(_fan_out(_pages({}), [])) == []
+
+    def test_concurrency_must_be_positive(self):
+        with pytest.raises(ValueError):
+            _fan_out(_pages({}), ["A"], concurrency=0)
+
+
+class TestFanOutFunction:
+    def test_lists_each_workspace_from_the_api(self):
+        server = FakeMetquayServer(seed_records={INSTRUMENTS: 9})
+        store = server.stores[INSTRUMENTS]
+        for n, record_id in enumerate(list(store.ids)):
+            record = store.records[record_id][0]
+            store.put(record_id, dict(record, workspaceCode="LAB{0}".format(n % 3)))
+        with server:
+            client = MetquayClient(
+                access_key="ak",
+                secret_key="sk",
+                host=server.url,
+                rate_limit_per_minute=None,
+            )
+            with client:
+                listing = fan_out(
+                    client,
+                    "instruments",
+                    ["LAB0", "LAB1", "LAB2"],
+                    page_size=2,
+                    fields=["id", "workspace_code"],
+                )
+                pairs = list(listing)
+        assert len(pairs) == 9
+        assert all(code == record.workspace_code for code, record in pairs)
+        assert [w.records for w in listing.report.workspaces.values()] == [3, 3, 3]
+        assert server.stats()["requests"]["getCustomerInstruments"] == 6
+
+    def test_invalid_arguments(self):
+        client = MetquayClient(access_key="ak", secret_key="sk", host="x.test")
+        with pytest.raises(ValueError, match="Unknown entity"):
+            fan_out(client, "widgets", ["A"])
+        with pytest.raises(ValueError, match="repeat"):
+            fan_out(client, "works", ["A", "A"])
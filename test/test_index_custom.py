@@ -0,0 +1,133 @@
+"""
+Unit tests for ``pymetquay.index``.
+These tests are NOT automatically generated; the client is a MagicMock.
+"""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from openapi_client.models.customer_instrument_response import (
+    CustomerInstrumentResponse,
+)
+from openapi_client.models.customer_response import CustomerResponse
+from pymetquay.index import (
+    CustomerIndex,
+    DuplicateKeyError,
+    InstrumentIndex,
+    RecordIndex,
+)
+
+
+def _instrument(id, tag=None, serial=None, barcode=None, control=None):
+    return CustomerInstrumentResponse.from_dict(
+        {
+            "id": id,
+            "tagNo": tag,
+            "serialNo": serial,
+            "barcode": barcode,
+            "controlNo": control,
+        }
+    )
+
+
+@pytest.fixture
+def client():
+    client = MagicMock()
+    client.list_instruments.return_value = [
+        _instrument(1, tag="T-1", serial="S-1", barcode="B-1", control="C-1"),
+        _instrument(2, tag="T-2", serial="S-1", barcode=" B-2 "),
+        _instrument(3, tag="", barcode="B-3"),
+    ]
+    client.list_customers.return_value = [
+        CustomerResponse.from_dict({"id": 10, "companyCode": "ACME"}),
+        CustomerResponse.from_dict({"id": 11, "companyCode": "GLOBEX"}),
+    ]
+    return client
+
+
+class TestInstrumentIndex:
+    def test_lookups_by_each_field(self, client):
+        index = InstrumentIndex(client, workspace_code="WS", concurrency=4)
+        client.list_instruments.assert_called_once_with(
+            paginate_all=True, workspace_code="WS", concurrency=4
+        )
+        assert index.get("tag_no", "T-2").id == 2
+        assert index.get("barcode", "B-2").id == 2
+        assert index.get("control_no", "C-1").id == 1
+        assert index.get("barcode", "missing") is None
+        assert len(index) == 3
+
+    def test_keys_are_stripped(self, client):
+        index = InstrumentIndex(client)
+        assert index.get("barcode", "  B-3\n").id == 3
+        assert "T-1" in index
+
+    def test_blank_keys_are_not_indexed(self, client):
+        assert InstrumentIndex(client).get("tag_no", "") is None
+
+    def test_find_searches_every_field(self, client):
+        index = InstrumentIndex(client)
+        assert index.find("C-1").id == 1
+        assert index.find("B-3").id == 3
+        assert index.find("nothing") is None
+
+    def test_unknown_field(self, client):
+        with pytest.raises(KeyError, match="not indexed"):
+            InstrumentIndex(client).get("make", "x")
+
+
+class TestDuplicatePolicy:
+    def test_first_wins_by_default(self, client):
+        index = InstrumentIndex(client)
+        assert index.get("serial_no", "S-1").id == 1
+        assert [r.id for r in index.get_all("serial_no", "S-1")] == [1, 2]
+        assert list(index.duplicates["serial_no"]) == ["S-1"]
+        assert index.get_all("tag_no", "T-1")[0].id == 1
+
+    def test_last_wins(self, client):
+        index = InstrumentIndex(client, on_duplicate="last")
+        assert index.get("serial_no", "S-1").id == 2
+
+    def test_error_policy_keeps_previous_state(self, client):
+        client.list_instruments.return_value = [_instrument(1, serial="S-1")]
+        index = InstrumentIndex(client, on_duplicate="error")
+        client.list_instruments.return_value = [
+            _instrument(1, serial="S-1"),
+            _instrument(2, serial="S-1"),
+        ]
+        with pytest.raises(DuplicateKeyError) as excinfo:
+            index.refresh()
+        assert (excinfo.value.field, excinfo.value.key) == ("serial_no", "S-1")
+        assert len(index) == 1
+
+    def test_invalid_policy(self, client):
+        with pytest.raises(ValueError):
+            InstrumentIndex(client, on_duplicate="merge")
+
+
+class TestRefreshAndFootprint:
+    def test_refresh_reloads(self, client):
+        index = CustomerIndex(client)
+        assert index.get("company_code", "ACME").id == 10
+        client.list_customers.return_value = [
+            CustomerResponse.from_dict({"id": 12, "companyCode": "ACME"})
+        ]
+        index.refresh()
+        assert index.get("company_code", "ACME").id == 12
+        assert index.get("company_code", "GLOBEX") is None
+
+    def test_memory_footprint(self, client):
+        index = InstrumentIndex(client)
+        keys_only = index.memory_footprint(include_records=False)
+        assert 0 < keys_only < index.memory_footprint()
+
+    def test_lookup_is_constant_time(self):
+        records = [_instrument(i, barcode="B-{0}".format(i)) for i in range(20000)]
+        index = RecordIndex(lambda: records, ["barcode"])
+        start = time.perf_counter()
+        for i in range(0, 20000, 20):
+            assert index.get("barcode", "B-{0}".format(i)) is records[i]
+        per_lookup = (time.perf_counter() - start) / 1000
+        assert per_lookup < 1e-4
@@ -0,0 +1,222 @@
+"""
+Unit tests for ``openapi_client.instrumentation`` and the request events
+``ApiClient`` produces.  These tests are NOT automatically generated; the
+transport is mocked and sleeping is replaced by a recorder.
+"""
+
+import io
+import json
+import logging
+from unittest.mock import MagicMock
+
+import pytest
+import urllib3
+
+from openapi_client.api.works_api import WorksApi
+from openapi_client.api_client import ApiClient
+from openapi_client.configuration import Configuration
+from openapi_client.exceptions import NotFoundException
+from openapi_client.instrumentation import (
+    LatencyHistogram,
+    RequestEvent,
+    RequestMetrics,
+)
+from openapi_client.retry import RetryPolicy
+from openapi_client.rest import RESTResponse
+from pymetquay import MetquayClient
+
+
+def _response(payload, status=200):
+    return RESTResponse(
+        urllib3.HTTPResponse(
+            body=io.BytesIO(json.dumps(payload).encode()),
+            headers={"Content-Type": "application/json"},
+            status=status,
+            preload_content=False,
+        )
+    )
+
+
+def _event(operation="GET /works", status=200, **phases):
+    event = RequestEvent(operation.split()[0], operation)
+    event.status = status
+    event.attempts = 1
+    for name, seconds in phases.items():
+        setattr(event, name + "_seconds", seconds)
+    return event
+
+
+class TestLatencyHistogram:
+    def test_buckets_and_percentiles(self):
+        histogram = LatencyHistogram(buckets=(0.01, 0.1, 1.0))
+        for value in [0.005] * 90 + [0.05] * 9 + [3.0]:
+            histogram.observe(value)
+        assert histogram.counts == [90, 9, 0, 1]
+        assert histogram.percentile(50) == 0.01
+        assert histogram.percentile(95) == 0.1
+        assert histogram.percentile(100) == 3.0
+        assert histogram.min == 0.005
+        assert histogram.mean == pytest.approx((0.45 + 0.45 + 3.0) / 100)
+
+    def test_bounds_are_inclusive(self):
+        histogram = LatencyHistogram(buckets=(0.01, 0.1))
+        histogram.observe(0.01)
+        assert histogram.counts == [1, 0, 0]
+
+    def test_percentile_never_exceeds_max(self):
+        histogram = LatencyHistogram(buckets=(1.0,))
+        histogram.observe(0.2)
+        assert histogram.percentile(99) == 0.2
+
+    def test_empty(self):
+        assert LatencyHistogram().percentile(50) == 0.0
+
+    def test_invalid_percentile(self):
+        with pytest.raises(ValueError):
+            LatencyHistogram().percentile(101)
+
+
+class TestRequestMetrics:
+    def test_groups_by_operation(self):
+        metrics = RequestMetrics()
+        metrics.record(_event(network=0.02, deserialize=0.01))
+        metrics.record(_event(status=503, network=0.04))
+        metrics.record(_event("PUT /works/{metquayId}", network=0.1))
+
+        summary = metrics.summary()
+        works = summary["GET /works"]
+        assert works["requests"] == 2
+        assert works["by_status"] == {200: 1, 503: 1}
+        assert works["latency"]["max"] == pytest.approx(0.04)
+        assert works["phases"]["network"]["mean"] == pytest.approx(0.03)
+        assert works["phases"]["deserialize"]["max"] == pytest.approx(0.01)
+        assert summary["PUT /works/{metquayId}"]["requests"] == 1
+        json.dumps(summary)  # serializable as is
+
+    def test_format_has_one_line_per_operation(self):
+        metrics = RequestMetrics()
+        metrics.record(_event())
+        metrics.record(_event("POST /works"))
+        lines = metrics.format().splitlines()
+        assert lines[0].split()[:3] == ["operation", "count", "err"]
+        assert [line.split()[:2] for line in lines[1:]] == [
+            ["GET", "/works"],
+            ["POST", "/works"],
+        ]
+
+    def test_reset(self):
+        metrics = RequestMetrics()
+        metrics.record(_event())
+        metrics.reset()
+        assert metrics.summary() == {}
+
+
+class TestApiClientEvents:
+    def setup_method(self):
+        self.sleeps = []
+        self.events = []
+        config = Configuration(host="https://x.test/api/v1")
+        config.rate_limit_per_minute = None
+        config.retry_policy = RetryPolicy(
+            max_retries=2, random_fn=lambda: 1.0, sleep=self.sleeps.append
+        )
+        config.request_hooks = [self.events.append]
+        self.api_client = ApiClient(config)
+        self.api_client.rest_client = MagicMock()
+        self.works = WorksApi(self.api_client)
+
+    def test_successful_list(self):
+        self.api_client.rest_client.request.return_value = _response(
+            [{"id": 1, "workNo": "W-1"}]
+        )
+        self.works.get_works(first=0, limit=1)
+
+        (event,) = self.events
+        assert event.operation == "GET /works"
+        assert event.url == "https://x.test/api/v1/works?first=0&limit=1"
+        assert event.status == 200
+        assert event.attempts == 1
+        assert event.error is None
+        assert event.response_bytes == len(b'[{"id": 1, "workNo": "W-1"}]')
+        assert event.serialize_seconds > 0
+        assert event.deserialize_seconds > 0
+        assert event.duration == pytest.approx(sum(event.phases().values()))
+        assert self.api_client.metrics.summary()["GET /works"]["requests"] == 1
+
+    def test_path_template_is_the_operation(self):
+        self.api_client.rest_client.request.return_value = _response(None)
+        self.works.update_work(7, {"customerInstrumentId": 1})
+        assert self.events[0].operation == "PUT /works/{metquayId}"
+        assert self.events[0].url.endswith("/works/7")
+
+    def test_retries_are_one_event(self):
+        self.api_client.rest_client.request.side_effect = [
+            _response({}, status=503),
+            _response([]),
+        ]
+        self.works.get_works()
+        (event,) = self.events
+        assert (event.attempts, event.retries, event.status) == (2, 1, 200)
+        assert event.backoff_seconds == self.sleeps[0] == 0.5
+
+    def test_error_status_is_recorded(self):
+        self.api_client.rest_client.request.return_value = _response(
+            {"code": 404, "message": "missing"}, status=404
+        )
+        with pytest.raises(NotFoundException):
+            self.works.update_work(7, {"customerInstrumentId": 1})
+        (event,) = self.events
+        assert event.status == 404
+        assert isinstance(event.error, NotFoundException)
+        assert self.api_client.metrics.summary()["PUT /works/{metquayId}"][
+            "errors"
+        ] == 1
+
+    def test_transport_error_is_recorded(self):
+        self.api_client.rest_client.request.side_effect = urllib3.exceptions.HTTPError(
+            "connection reset"
+        )
+        with pytest.raises(urllib3.exceptions.HTTPError):
+            self.works.get_works()
+        (event,) = self.events
+        assert event.status is None
+        assert isinstance(event.error, urllib3.exceptions.HTTPError)
+
+    def test_rate_limiter_wait_is_its_own_phase(self):
+        limiter = MagicMock()
+        self.api_client.rate_limiter = limiter
+        self.api_client.rest_client.request.return_value = _response([])
+        self.works.get_works()
+        limiter.acquire.assert_called_once_with()
+        assert self.events[0].rate_limit_seconds >= 0
+
+    def test_failing_hook_does_not_break_the_request(self, caplog):
+        def broken(event):
+            raise RuntimeError("exporter down")
+
+        self.api_client.configuration.request_hooks.insert(0, broken)
+        self.api_client.rest_client.request.return_value = _response([])
+        with caplog.at_level(logging.ERROR):
+            assert self.works.get_works() == []
+        assert "Request hook" in caplog.text
+        assert len(self.events) == 1
+
+
+class TestClientIntegration:
+    def test_hooks_and_metrics_on_metquay_client(self):
+        events = []
+        client = MetquayClient(
+            access_key="ak",
+            secret_key="sk",
+            host="x.test",
+            rate_limit_per_minute=None,
+            request_hooks=[events.append],
+        )
+        client._api_client.rest_client = MagicMock()
+        client._api_client.rest_client.request.side_effect = [
+            _response({"accessToken": "tok", "tokenType": "Bearer"}),
+            _response([{"id": 1}]),
+        ]
+        client.list_works(limit=1)
+        assert [e.operation for e in events] == ["POST /authenticate", "GET /works"]
+        assert set(client.metrics.summary()) == {"POST /authenticate", "GET /works"}
@@ -0,0 +1,161 @@
+"""
+Unit tests for ``openapi_client.json_codec`` and its use for request and
+response bodies.  These tests are NOT automatically generated.
+"""
+
+import io
+import json
+from unittest.mock import MagicMock
+
+import pytest
+import urllib3
+
+from openapi_client.api_client import ApiClient
+from openapi_client.configuration import Configuration
+from openapi_client.exceptions import ApiException
+from openapi_client.json_codec import JsonCodec, get_json_codec, iter_json_array
+from openapi_client.rest import RESTClientObject, RESTResponse
+
+
+def _codec(name):
+    try:
+        return get_json_codec(name)
+    except ImportError:
+        pytest.skip("{0} is not installed".format(name))
+
+
+CODEC_NAMES = ["json", "pydantic", "orjson"]
+DOCUMENT = {"id": 1, "name": "Résumé", "tags": ["a", "b"], "cost": 1.5, "ok": None}
+
+
+def _response(payload, status=200, content_type="application/json"):
+    return RESTResponse(
+        urllib3.HTTPResponse(
+            body=io.BytesIO(payload),
+            headers={"Content-Type": content_type},
+            status=status,
+            preload_content=False,
+        )
+    )
+
+
+class TestCodecs:
+    @pytest.mark.parametrize("name", CODEC_NAMES)
+    def test_round_trip_from_str_and_bytes(self, name):
+        codec = _codec(name)
+        text = codec.dumps(DOCUMENT)
+        assert isinstance(text, str)
+        assert json.loads(text) == DOCUMENT
+        assert codec.loads(text) == DOCUMENT
+        assert codec.loads(text.encode("utf-8")) == DOCUMENT
+
+    @pytest.mark.parametrize("name", CODEC_NAMES)
+    def test_invalid_json_raises_value_error(self, name):
+        with pytest.raises(ValueError):
+            _codec(name).loads(b"{not json")
+
+    def test_auto_prefers_an_accelerated_backend(self):
+        assert get_json_codec().name in ("orjson", "pydantic")
+
+    def test_unknown_codec(self):
+        with pytest.raises(ValueError, match="Unknown JSON codec"):
+            get_json_codec("simdjson")
+
+    def test_configuration_default(self):
+        assert isinstance(Configuration().json_codec, JsonCodec)
+
+
+class TestApiClientCodec:
+    @pytest.mark.parametrize("name", CODEC_NAMES)
+    def test_response_parsed_from_bytes_with_configured_codec(self, name):
+        api_client = ApiClient()
+        api_client.configuration.json_codec = _codec(name)
+        response = _response(b'[{"id": 1, "companyName": "Acme"}]')
+        response.read()
+        result = api_client.response_deserialize(
+            response, {"200": "List[CustomerResponse]"}
+        )
+        assert [c.company_name for c in result.data] == ["Acme"]
+
+    def test_codec_is_used_on_bytes(self):
+        api_client = ApiClient()
+        codec = MagicMock(wraps=JsonCodec())
+        api_client.configuration.json_codec = codec
+        response = _response(b'{"accessToken": "tok", "tokenType": "Bearer"}')
+        response.read()
+        api_client.response_deserialize(response, {"200": "AuthenticationResponse"})
+        codec.loads.assert_called_once()
+        assert isinstance(codec.loads.call_args[0][0], bytes)
+
+    def test_error_body_is_still_text(self):
+        api_client = ApiClient()
+        response = _response(b'{"code": 404, "message": "missing"}', status=404)
+        response.read()
+        with pytest.raises(ApiException) as excinfo:
+            api_client.response_deserialize(response, {"4XX": "ErrorResponse"})
+        assert excinfo.value.body == '{"code": 404, "message": "missing"}'
+        assert excinfo.value.data.message == "missing"
+
+    def test_text_response_is_decoded(self):
+        api_client = ApiClient()
+        response = _response(b"plain", content_type="text/plain")
+        response.read()
+        result = api_client.response_deserialize(response, {"200": "str"})
+        assert result.data == "plain"
+
+
+def _pieces(data, size):
+    stream = io.BytesIO(data)
+    return list(iter(lambda: stream.read(size), b""))
+
+
+class TestIterJsonArray:
+    DOCUMENTS = [
+        [],
+        [DOCUMENT, None, "x" * 500, [True, False]],
+        [0, -1, 12345678901234567890, 2.5, -3e10, 1e-05],
+        ["Résumé ☃ 😀"],
+    ]
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 7, 4096])
+    @pytest.mark.parametrize("document", DOCUMENTS)
+    def test_any_split_matches_json_loads(self, document, size):
+        body = json.dumps(document, ensure_ascii=False).encode("utf-8")
+        assert list(iter_json_array(_pieces(body, size))) == document
+
+    def test_whitespace_and_null_body(self):
+        assert list(iter_json_array([b" \n[ 1 ,\n 2 ]\n "])) == [1, 2]
+        assert list(iter_json_array([b"nu", b"ll"])) == []
+
+    def test_elements_arrive_before_the_body_ends(self):
+        def pieces():
+            yield b'[{"id": 1}, {"id'
+            raise AssertionError("read past the first element")
+
+        assert next(iter_json_array(pieces())) == {"id": 1}
+
+    @pytest.mark.parametrize(
+        "body",
+        [b"", b"{}", b"5", b"[", b"[1", b"[1,]", b"[1 2]", b"[1]x", b"[tru]", b"\xff"],
+    )
+    def test_invalid_body_raises_value_error(self, body):
+        for size in (1, 100):
+            with pytest.raises(ValueError):
+                list(iter_json_array(_pieces(body, size)))
+
+
+class TestRestClientCodec:
+    def test_request_body_uses_configured_codec(self):
+        config = Configuration()
+        config.json_codec = MagicMock(wraps=JsonCodec())
+        rest_client = RESTClientObject(config)
+        rest_client.pool_manager = MagicMock()
+        rest_client.request(
+            "POST",
+            "https://x.test/api/v1/works",
+            headers={"Content-Type": "application/json"},
+            body={"customerInstrumentId": 1},
+        )
+        config.json_codec.dumps.assert_called_once_with({"customerInstrumentId": 1})
+        sent = rest_client.pool_manager.request.call_args.kwargs["body"]
+        assert json.loads(sent) == {"customerInstrumentId": 1}
@@ -0,0 +1,97 @@
+"""
+Tests for the lazy package exports in ``pymetquay`` and ``openapi_client``.
+These tests are NOT automatically generated.  Import checks run in a fresh
+interpreter, since this process has long since imported everything.
+"""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+import openapi_client
+import openapi_client.api
+import openapi_client.models
+import pymetquay
+
+
+def _loaded_after(statement):
+    """Modules loaded by ``statement`` in a new interpreter."""
+    probe = "import json, sys\n{0}\nprint(json.dumps(sorted(sys.modules)))".format(
+        statement
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", probe], check=True, capture_output=True, text=True
+    ).stdout
+    return set(json.loads(output))
+
+
+def _generated(modules):
+    return {
+        m
+        for m in modules
+        if m.startswith(("openapi_client.api.", "openapi_client.models."))
+    }
+
+
+class TestImportCost:
+    def test_import_pymetquay_loads_no_dependencies(self):
+        modules = _loaded_after("import pymetquay")
+        heavy = {"pydantic", "urllib3", "dotenv", "dateutil"}
+        assert not heavy & modules
+        assert "openapi_client.api_client" not in modules
+        assert not _generated(modules)
+
+    def test_importing_the_client_loads_no_dependencies(self):
+        modules = _loaded_after("from pymetquay import MetquayClient")
+        assert not {"pydantic", "urllib3", "dotenv"} & modules
+        assert "openapi_client.api_client" not in modules
+        assert not {m for m in modules if m.startswith("pymetquay.")} - {
+            "pymetquay._version",
+            "pymetquay.client",
+        }
+
+    def test_client_loads_api_classes_on_first_use(self):
+        modules = _loaded_after(
+            "from pymetquay import MetquayClient\n"
+            "MetquayClient('ak', 'sk', host='x.test')"
+        )
+        assert not _generated(modules)
+        assert "dotenv" in modules
+
+    def test_one_model_loads_only_that_model(self):
+        modules = _loaded_after("from pymetquay import WorkResponse")
+        assert _generated(modules) == {"openapi_client.models.work_response"}
+
+
+class TestExports:
+    @pytest.mark.parametrize("name", pymetquay.__all__)
+    def test_every_public_name_resolves(self, name):
+        assert getattr(pymetquay, name) is not None
+        assert name in dir(pymetquay)
+
+    @pytest.mark.parametrize(
+        "package", [openapi_client, openapi_client.api, openapi_client.models]
+    )
+    def test_generated_packages(self, package):
+        for name in package._EXPORTS:
+            value = getattr(package, name)
+            assert value.__name__ == name
+            assert name in dir(package)
+
+    def test_same_objects_as_defining_modules(self):
+        from openapi_client.api.works_api import WorksApi
+        from openapi_client.models.work_response import WorkResponse
+
+        assert pymetquay.WorksApi is openapi_client.WorksApi is WorksApi
+        assert openapi_client.models.WorkResponse is WorkResponse
+
+    def test_unknown_name(self):
+        with pytest.raises(AttributeError, match="has no attribute 'Nope'"):
+            pymetquay.Nope  # noqa: B018
+
+    def test_from_import(self):
+        from pymetquay import MetquayClient
+
+        assert MetquayClient.__module__ == "pymetquay.client"
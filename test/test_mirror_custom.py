@@ -0,0 +1,136 @@
+"""
+Unit tests for ``pymetquay.mirror.MetquayMirror``.
+These tests are NOT automatically generated; the client is a stand-in that
+serves pages from in-memory lists.
+"""
+
+import pytest
+
+from openapi_client.models.customer_instrument_response import (
+    CustomerInstrumentResponse,
+)
+from openapi_client.models.customer_response import CustomerResponse
+from openapi_client.models.work_response import WorkResponse
+from pymetquay.mirror import MetquayMirror
+
+
+class FakeClient:
+    """Serves ``iter_*_pages`` from lists of records."""
+
+    def __init__(self):
+        self.customers = []
+        self.instruments = []
+        self.works = []
+        self.fail_after_pages = None
+        self.calls = []
+
+    def _pages(self, records, page_size, workspace_code):
+        self.calls.append((page_size, workspace_code))
+        for index, start in enumerate(range(0, len(records), page_size)):
+            if self.fail_after_pages is not None and index >= self.fail_after_pages:
+                raise RuntimeError("connection lost")
+            end = start + page_size
+            yield records[start:end]
+
+    def iter_customer_pages(self, *, page_size, workspace_code=None):
+        return self._pages(self.customers, page_size, workspace_code)
+
+    def iter_instrument_pages(self, *, page_size, workspace_code=None):
+        return self._pages(self.instruments, page_size, workspace_code)
+
+    def iter_work_pages(self, *, page_size, workspace_code=None):
+        return self._pages(self.works, page_size, workspace_code)
+
+
+def _works(n, status="Open"):
+    return [
+        WorkResponse.from_dict(
+            {
+                "id": i,
+                "workNo": "W{0}".format(i),
+                "dueDate": "03-01-2025",
+                "status": status,
+            }
+        )
+        for i in range(1, n + 1)
+    ]
+
+
+@pytest.fixture
+def client():
+    fake = FakeClient()
+    fake.customers = [CustomerResponse.from_dict({"id": 1, "companyName": "Acme"})]
+    fake.instruments = [
+        CustomerInstrumentResponse.from_dict(
+            {"id": 7, "tagNo": "T-7", "projectNames": ["a"], "calibrationCost": 12.5}
+        )
+    ]
+    fake.works = _works(5)
+    return fake
+
+
+@pytest.fixture
+def mirror(client, tmp_path):
+    with MetquayMirror(client, str(tmp_path / "mirror.db"), page_size=2) as m:
+        yield m
+
+
+class TestMetquayMirror:
+    def test_first_sync_adds_everything(self, mirror, client):
+        reports = mirror.sync()
+        assert set(reports) == {"customers", "instruments", "works"}
+        assert reports["works"].added == [1, 2, 3, 4, 5]
+        assert reports["works"].total == 5
+        assert mirror.count("works") == 5
+        assert client.calls[0] == (2, None)
+
+    def test_records_round_trip(self, mirror, client):
+        mirror.sync()
+        assert mirror.all("works") == client.works
+        assert mirror.get("instruments", 7) == client.instruments[0]
+        assert mirror.get("customers", 1).company_name == "Acme"
+        assert mirror.get("works", 99) is None
+
+    def test_incremental_sync_reports_changes(self, mirror, client):
+        mirror.sync()
+        client.works = _works(5)
+        client.works[1].status = "Closed"
+        del client.works[3]
+        client.works.append(_works(6)[-1])
+
+        report = mirror.sync_entity("works")
+        assert report.added == [6]
+        assert report.changed == [2]
+        assert report.removed == [4]
+        assert report.unchanged == 3
+        assert mirror.get("works", 2).status == "Closed"
+        assert mirror.get("works", 4) is None
+
+    def test_unchanged_sync_writes_nothing(self, mirror, client):
+        mirror.sync()
+        report = mirror.sync_entity("works")
+        assert (report.added, report.changed, report.removed) == ([], [], [])
+        assert report.unchanged == 5
+
+    def test_failed_sync_rolls_back(self, mirror, client):
+        mirror.sync()
+        client.works = _works(5, status="Closed")
+        client.fail_after_pages = 1
+        with pytest.raises(RuntimeError):
+            mirror.sync_entity("works")
+        assert mirror.count("works") == 5
+        assert {w.status for w in mirror.all("works")} == {"Open"}
+
+    def test_sync_history_and_persistence(self, client, tmp_path):
+        path = str(tmp_path / "mirror.db")
+        with MetquayMirror(client, path) as first:
+            assert first.last_synced("works") is None
+            first.sync(["works"])
+        with MetquayMirror(client, path) as reopened:
+            assert reopened.count("works") == 5
+            assert reopened.last_synced("works") is not None
+            assert reopened.last_synced("customers") is None
+
+    def test_unknown_entity(self, mirror):
+        with pytest.raises(ValueError, match="Unknown entity"):
+            mirror.sync(["gauges"])
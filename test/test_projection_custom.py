@@ -0,0 +1,139 @@
+"""
+Unit tests for ``pymetquay.projection`` and the ``fields=`` argument of the
+client's list and iterator methods.  These tests are NOT automatically
+generated; the transport is mocked so no network access is needed.
+"""
+
+import datetime
+import io
+import json
+from unittest.mock import MagicMock
+
+import pytest
+import urllib3
+from pydantic import ValidationError
+
+from openapi_client.models.customer_instrument_response import (
+    CustomerInstrumentResponse,
+)
+from openapi_client.models.work_response import WorkResponse
+from openapi_client.rest import RESTResponse
+from pymetquay import MetquayClient
+from pymetquay.projection import project_rows, projection
+
+INSTRUMENT = {
+    "id": 3,
+    "tagNo": "T-3",
+    "dueDate": "01-02-2026",
+    "calibratedDate": "01-02-2025",
+    "make": "Fluke",
+    "calibrationFrequency": "12",
+}
+
+
+def _json_response(payload):
+    return RESTResponse(
+        urllib3.HTTPResponse(
+            body=io.BytesIO(json.dumps(payload).encode()),
+            headers={"Content-Type": "application/json"},
+            status=200,
+            preload_content=False,
+        )
+    )
+
+
+class TestProjection:
+    def test_only_requested_fields(self):
+        fields = ["id", "tag_no", "due_date"]
+        projected = projection(CustomerInstrumentResponse, fields)
+        assert list(projected.model_fields) == ["id", "tag_no", "due_date"]
+        assert projected.__name__ == "CustomerInstrumentResponseProjection"
+
+    def test_values_match_full_model(self):
+        names = ["id", "tag_no", "calibrated_date", "due_date"]
+        (record,) = project_rows(
+            projection(CustomerInstrumentResponse, names), [INSTRUMENT]
+        )
+        full = CustomerInstrumentResponse.from_dict(INSTRUMENT)
+        assert record.due_date == datetime.date(2026, 1, 2)
+        assert {n: getattr(record, n) for n in names} == {
+            n: getattr(full, n) for n in names
+        }
+        assert not hasattr(record, "make")
+
+    def test_api_names_and_order_share_one_projection(self):
+        first = projection(CustomerInstrumentResponse, ["due_date", "id", "tag_no"])
+        again = projection(CustomerInstrumentResponse, ["id", "tagNo", "dueDate"])
+        assert again is first
+
+    def test_unrequested_fields_are_not_validated(self):
+        projected = projection(WorkResponse, ["id"])
+        (record,) = project_rows(projected, [{"id": 1, "dueDate": "never"}])
+        assert record.id == 1
+        with pytest.raises(ValidationError):
+            project_rows(
+                projection(WorkResponse, ["due_date"]), [{"dueDate": "never"}]
+            )
+
+    def test_nulls_and_fields_set(self):
+        projected = projection(WorkResponse, ["id", "work_no"])
+        record, missing = project_rows(projected, [{"id": 1}, None])
+        assert missing is None
+        assert record.model_fields_set == {"id", "work_no"}
+        assert project_rows(projected, None) == []
+
+    def test_aliases_round_trip(self):
+        projected = projection(WorkResponse, ["work_no"])
+        (record,) = project_rows(projected, [{"workNo": "W-1"}])
+        assert record.model_dump(by_alias=True) == {"workNo": "W-1"}
+
+    @pytest.mark.parametrize(
+        "fields, error",
+        [(["nope"], ValueError), ([], ValueError), ("id", TypeError)],
+    )
+    def test_invalid_fields(self, fields, error):
+        with pytest.raises(error):
+            projection(WorkResponse, fields)
+
+
+class TestClientFields:
+    def setup_method(self):
+        self.client = MetquayClient(
+            access_key="ak", secret_key="sk", host="x.test", rate_limit_per_minute=None
+        )
+        self.client._ensure_authenticated = MagicMock()
+        self.client._api_client.rest_client = MagicMock()
+        self.request = self.client._api_client.rest_client.request
+
+    def test_list_single_page(self):
+        self.request.return_value = _json_response([INSTRUMENT])
+        (record,) = self.client.list_instruments(limit=1, fields=["id", "due_date"])
+        assert (record.id, record.due_date) == (3, datetime.date(2026, 1, 2))
+        url = self.request.call_args[0][1]
+        assert url.endswith("/customer-instrument-details?limit=1")
+
+    def test_list_paginate_all(self):
+        pages = [[{"id": i} for i in range(50)], [{"id": 50}]]
+        self.request.side_effect = [_json_response(page) for page in pages]
+        works = self.client.list_works(paginate_all=True, fields=["id"])
+        assert [w.id for w in works] == list(range(51))
+
+    def test_iterators(self):
+        self.request.side_effect = [
+            _json_response([{"id": 1, "companyName": "Acme"}, {"id": 2}]),
+            _json_response([]),
+        ]
+        customers = list(self.client.iter_customers(page_size=2, fields=["id"]))
+        assert [c.id for c in customers] == [1, 2]
+        assert list(type(customers[0]).model_fields) == ["id"]
+
+    def test_response_cache_is_bypassed(self):
+        self.client.response_cache = MagicMock()
+        self.request.return_value = _json_response([INSTRUMENT])
+        self.client.list_instruments(limit=1, fields=["id"])
+        self.client.response_cache.get.assert_not_called()
+
+    def test_unknown_field_fails_before_any_request(self):
+        with pytest.raises(ValueError, match="has no field 'nope'"):
+            self.client.list_works(fields=["nope"])
+        self.request.assert_not_called()
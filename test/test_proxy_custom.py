@@ -0,0 +1,154 @@
+"""
+Unit tests for ``pymetquay.proxy`` and the ``list_*_lazy`` client methods.
+These tests are NOT automatically generated; the transport is mocked so no
+network access or credentials are needed.
+"""
+
+import datetime
+import io
+import json
+from typing import List, Optional
+from unittest.mock import MagicMock
+
+import pytest
+import urllib3
+from pydantic import BaseModel, Field, ValidationError
+
+from openapi_client.models.customer_response import CustomerResponse
+from openapi_client.models.work_response import WorkResponse
+from openapi_client.rest import RESTResponse
+from pymetquay import LazyRecord, MetquayClient
+from pymetquay.proxy import lazy_records
+
+WORK = {
+    "id": 7,
+    "workNo": "W-7",
+    "dueDate": "03-15-2025",
+    "revisionNo": 2,
+    "customerInstrumentId": 11,
+}
+
+
+class Sample(BaseModel):
+    name: str
+    tags: List[str] = Field(default_factory=list)
+    note: Optional[str] = None
+    code: Optional[str] = Field(default=None, max_length=3)
+
+
+def _json_response(payload):
+    return RESTResponse(
+        urllib3.HTTPResponse(
+            body=io.BytesIO(json.dumps(payload).encode()),
+            headers={"Content-Type": "application/json"},
+            status=200,
+            preload_content=False,
+        )
+    )
+
+
+class TestLazyRecord:
+    def test_fields_use_model_validators(self):
+        work = LazyRecord(WorkResponse, dict(WORK))
+        assert work.due_date == datetime.date(2025, 3, 15)
+        assert work.work_no == "W-7"
+        assert work.revision_no == 2
+
+    def test_only_read_fields_are_validated(self):
+        work = LazyRecord(WorkResponse, dict(WORK))
+        work.due_date
+        assert set(work._values) == {"due_date"}
+
+    def test_values_are_cached(self):
+        work = LazyRecord(WorkResponse, dict(WORK))
+        first = work.due_date
+        work.raw["dueDate"] = "not a date"
+        assert work.due_date is first
+
+    def test_missing_fields_take_defaults(self):
+        record = LazyRecord(Sample, {"name": "a"})
+        assert record.note is None
+        assert record.tags == []
+        assert record.tags is record.tags  # default factory called once
+
+    def test_missing_required_field_raises_on_access(self):
+        record = LazyRecord(Sample, {})
+        with pytest.raises(ValidationError):
+            record.name
+
+    def test_field_constraints_apply(self):
+        assert LazyRecord(Sample, {"name": "a", "code": "abc"}).code == "abc"
+        with pytest.raises(ValidationError):
+            LazyRecord(Sample, {"name": "a", "code": "abcd"}).code
+
+    def test_invalid_value_raises_on_access_only(self):
+        work = LazyRecord(WorkResponse, dict(WORK, revisionNo="two"))
+        assert work.work_no == "W-7"
+        with pytest.raises(ValidationError):
+            work.revision_no
+
+    def test_unknown_attribute(self):
+        work = LazyRecord(WorkResponse, dict(WORK))
+        with pytest.raises(AttributeError, match="has no field 'nope'"):
+            work.nope  # noqa: B018
+        assert not hasattr(work, "_private")
+
+    def test_read_only(self):
+        work = LazyRecord(WorkResponse, dict(WORK))
+        with pytest.raises(AttributeError):
+            work.work_no = "W-8"
+
+    def test_to_model_matches_eager_deserialization(self):
+        work = LazyRecord(WorkResponse, dict(WORK))
+        model = work.to_model()
+        assert model == WorkResponse.model_validate(WORK)
+        assert model.model_fields_set == set(WorkResponse.model_fields)
+
+    def test_equality_repr_and_dir(self):
+        work = LazyRecord(WorkResponse, dict(WORK))
+        assert work == LazyRecord(WorkResponse, dict(WORK))
+        assert work != LazyRecord(CustomerResponse, dict(WORK))
+        assert repr(work).startswith("LazyRecord[WorkResponse]({'id': 7")
+        assert {"due_date", "to_model"} <= set(dir(work))
+        with pytest.raises(TypeError):
+            hash(work)
+
+    def test_lazy_records_keeps_nulls(self):
+        records = lazy_records(WorkResponse, [WORK, None])
+        assert records[0].work_no == "W-7"
+        assert records[1] is None
+        assert lazy_records(WorkResponse, None) == []
+
+
+class TestClientLazyLists:
+    def setup_method(self):
+        self.client = MetquayClient(
+            access_key="ak", secret_key="sk", host="x.test", rate_limit_per_minute=None
+        )
+        self.client._ensure_authenticated = MagicMock()
+        self.client._api_client.rest_client = MagicMock()
+        self.request = self.client._api_client.rest_client.request
+
+    def test_single_page(self):
+        self.request.return_value = _json_response([WORK])
+        (work,) = self.client.list_works_lazy(first=0, limit=1)
+        assert isinstance(work, LazyRecord)
+        assert work.model is WorkResponse
+        assert work.due_date == datetime.date(2025, 3, 15)
+        assert self.request.call_args[0][1].endswith("/works?first=0&limit=1")
+
+    def test_paginate_all(self):
+        pages = [
+            [dict(WORK, id=i) for i in range(50)],
+            [dict(WORK, id=i) for i in range(50, 60)],
+        ]
+        self.request.side_effect = [_json_response(page) for page in pages]
+        works = self.client.list_works_lazy(paginate_all=True)
+        assert [w.id for w in works] == list(range(60))
+        assert self.request.call_count == 2
+
+    def test_customers(self):
+        self.request.return_value = _json_response([{"id": 1, "companyName": "Acme"}])
+        (customer,) = self.client.list_customers_lazy()
+        assert customer.company_name == "Acme"
+        assert customer.model is CustomerResponse
@@ -0,0 +1,106 @@
+"""
+Unit tests for ``openapi_client.rate_limiter.RateLimiter``.
+These tests are NOT automatically generated; the limiter is hand-written and
+driven here by a fake clock.
+"""
+
+import threading
+
+import pytest
+
+from openapi_client.api_client import ApiClient
+from openapi_client.configuration import Configuration
+from openapi_client.rate_limiter import RateLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+class TestRateLimiter:
+    """Token bucket behaviour."""
+
+    def setup_method(self):
+        self.clock = FakeClock()
+
+    def _limiter(self, rate_per_minute=60, burst=1):
+        return RateLimiter(
+            rate_per_minute, burst, clock=self.clock, sleep=self.clock.sleep
+        )
+
+    def test_first_request_is_free(self):
+        limiter = self._limiter()
+        assert limiter.acquire() == 0.0
+        assert self.clock.slept == []
+
+    def test_requests_are_spaced_at_the_sustained_rate(self):
+        limiter = self._limiter(rate_per_minute=120)
+        for _ in range(5):
+            limiter.acquire()
+        assert self.clock.slept == pytest.approx([0.5, 0.5, 0.5, 0.5])
+
+    def test_burst_allows_back_to_back_requests(self):
+        limiter = self._limiter(rate_per_minute=60, burst=3)
+        assert [limiter.acquire() for _ in range(4)] == pytest.approx(
+            [0.0, 0.0, 0.0, 1.0]
+        )
+
+    def test_idle_time_refills_up_to_burst(self):
+        limiter = self._limiter(rate_per_minute=60, burst=2)
+        limiter.acquire()
+        limiter.acquire()
+        self.clock.now += 100
+        assert limiter.wait_time == 0.0
+        assert [limiter.reserve() for _ in range(3)] == pytest.approx([0, 0, 1.0])
+
+    def test_reservations_queue_up(self):
+        limiter = self._limiter(rate_per_minute=60)
+        assert [limiter.reserve() for _ in range(3)] == pytest.approx([0, 1, 2])
+        assert limiter.wait_time == pytest.approx(3.0)
+
+    def test_invalid_settings(self):
+        with pytest.raises(ValueError):
+            RateLimiter(0)
+        with pytest.raises(ValueError):
+            RateLimiter(60, burst=0)
+
+    def test_thread_safe_reservations(self):
+        limiter = self._limiter(rate_per_minute=60)
+        delays = []
+        lock = threading.Lock()
+
+        def worker():
+            for _ in range(50):
+                delay = limiter.reserve()
+                with lock:
+                    delays.append(delay)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert sorted(delays) == pytest.approx([float(i) for i in range(400)])
+
+
+class TestApiClientRateLimiter:
+    """ApiClient builds its limiter from the Configuration."""
+
+    def test_default_configuration(self):
+        limiter = ApiClient(Configuration()).rate_limiter
+        assert limiter is not None
+        assert limiter.rate_per_minute == 100
+
+    def test_disabled(self):
+        config = Configuration()
+        config.rate_limit_per_minute = None
+        assert ApiClient(config).rate_limiter is None
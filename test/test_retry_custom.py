@@ -0,0 +1,119 @@
+"""
+Unit tests for ``openapi_client.retry`` and the retry loop in
+``ApiClient.call_api``.  These tests are NOT automatically generated; the
+transport is mocked and sleeping is replaced by a recorder.
+"""
+
+import email.utils
+import io
+import time
+from unittest.mock import MagicMock
+
+import pytest
+import urllib3
+
+from openapi_client.api_client import ApiClient
+from openapi_client.configuration import Configuration
+from openapi_client.retry import RetryPolicy, RetryStats, parse_retry_after
+from openapi_client.rest import RESTResponse
+
+
+def _response(status, headers=None):
+    return RESTResponse(
+        urllib3.HTTPResponse(
+            body=io.BytesIO(b"[]"),
+            headers=headers or {},
+            status=status,
+            preload_content=False,
+        )
+    )
+
+
+class TestParseRetryAfter:
+    def test_seconds(self):
+        assert parse_retry_after("7") == 7.0
+
+    def test_http_date(self):
+        value = email.utils.formatdate(time.time() + 30, usegmt=True)
+        assert 25 <= parse_retry_after(value) <= 30
+
+    @pytest.mark.parametrize("value", [None, "", "soon"])
+    def test_missing_or_invalid(self, value):
+        assert parse_retry_after(value) is None
+
+
+class TestRetryPolicy:
+    def test_idempotent_methods_on_transient_statuses(self):
+        policy = RetryPolicy(max_retries=2)
+        assert policy.should_retry("GET", 503, 0)
+        assert policy.should_retry("put", 429, 1)
+        assert policy.should_retry("DELETE", 502, 0)
+        assert not policy.should_retry("GET", 503, 2)
+        assert not policy.should_retry("GET", 404, 0)
+
+    @pytest.mark.parametrize("status", [429, 500, 502, 503, 504])
+    def test_post_is_never_retried(self, status):
+        assert not RetryPolicy().should_retry("POST", status, 0)
+
+    def test_backoff_is_jittered_exponential_and_capped(self):
+        policy = RetryPolicy(backoff_factor=1.0, max_backoff=5.0, random_fn=lambda: 1.0)
+        assert [policy.backoff(n) for n in range(5)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+        policy.random_fn = lambda: 0.25
+        assert policy.backoff(2) == 1.0
+
+    def test_backoff_honors_retry_after(self):
+        policy = RetryPolicy(random_fn=lambda: 0.0)
+        assert policy.backoff(0, "12") == 12.0
+
+
+class TestApiClientRetries:
+    def setup_method(self):
+        self.sleeps = []
+        config = Configuration()
+        config.rate_limit_per_minute = None
+        config.retry_policy = RetryPolicy(
+            max_retries=3, random_fn=lambda: 1.0, sleep=self.sleeps.append
+        )
+        self.api_client = ApiClient(config)
+        self.api_client.rest_client = MagicMock()
+
+    def _call(self, method):
+        return self.api_client.call_api(method, "https://x.test/api/v1/works")
+
+    def test_transient_get_is_retried_until_success(self):
+        self.api_client.rest_client.request.side_effect = [
+            _response(503),
+            _response(429, {"Retry-After": "3"}),
+            _response(200),
+        ]
+        assert self._call("GET").status == 200
+        assert self.sleeps == [0.5, 3.0]
+        stats = self.api_client.retry_stats
+        assert stats.retries == 2
+        assert stats.backoff_seconds == pytest.approx(3.5)
+        assert stats.by_status == {503: 1, 429: 1}
+
+    def test_gives_up_after_max_retries(self):
+        self.api_client.rest_client.request.return_value = _response(503)
+        assert self._call("PUT").status == 503
+        assert self.api_client.rest_client.request.call_count == 4
+
+    def test_post_is_sent_once(self):
+        self.api_client.rest_client.request.return_value = _response(503)
+        assert self._call("POST").status == 503
+        assert self.api_client.rest_client.request.call_count == 1
+        assert self.api_client.retry_stats.retries == 0
+
+    def test_disabled_policy(self):
+        self.api_client.configuration.retry_policy = None
+        self.api_client.rest_client.request.return_value = _response(503)
+        self._call("GET")
+        assert self.api_client.rest_client.request.call_count == 1
+
+
+class TestRetryStats:
+    def test_reset(self):
+        stats = RetryStats()
+        stats.record(503, 1.5)
+        stats.reset()
+        assert (stats.retries, stats.backoff_seconds, stats.by_status) == (0, 0.0, {})
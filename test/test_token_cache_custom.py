@@ -0,0 +1,159 @@
+"""
+Unit tests for ``pymetquay.token_cache.FileTokenCache`` and its use by
+``MetquayClient``.  These tests are NOT automatically generated.
+"""
+
+import os
+import stat
+import sys
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from openapi_client.exceptions import UnauthorizedException
+from pymetquay import MetquayClient
+from pymetquay.fake_server import FakeMetquayServer
+from pymetquay.token_cache import FileTokenCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return FileTokenCache(str(tmp_path / "cache" / "tokens.json"))
+
+
+class TestFileTokenCache:
+    def test_round_trip(self, cache):
+        now = time.time()
+        cache.set("k", "tok", now, 900)
+        assert cache.get("k") == ("tok", now, 900)
+        assert cache.get("other") is None
+
+    def test_expired_entries_are_missing_and_pruned(self, cache):
+        cache.set("old", "stale", time.time() - 1000, 900)
+        assert cache.get("old") is None
+        cache.set("new", "tok", time.time(), 900)
+        assert "old" not in cache._read()
+
+    def test_key_hides_access_key(self, cache):
+        key = FileTokenCache.key("x.test", "secret-access-key")
+        assert key != FileTokenCache.key("y.test", "secret-access-key")
+        cache.set(key, "tok", time.time(), 900)
+        with open(cache.path) as handle:
+            assert "secret-access-key" not in handle.read()
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+    def test_restrictive_permissions(self, cache):
+        cache.set("k", "tok", time.time(), 900)
+        assert stat.S_IMODE(os.stat(cache.path).st_mode) == 0o600
+        assert stat.S_IMODE(os.stat(cache._lock_path).st_mode) == 0o600
+        assert stat.S_IMODE(os.stat(os.path.dirname(cache.path)).st_mode) == 0o700
+
+    def test_corrupt_file_reads_as_empty(self, cache):
+        cache.set("k", "tok", time.time(), 900)
+        with open(cache.path, "w") as handle:
+            handle.write("{not json")
+        assert cache.get("k") is None
+        cache.set("k", "tok2", time.time(), 900)
+        assert cache.get("k")[0] == "tok2"
+
+    def test_clear(self, cache):
+        cache.set("a", "tok", time.time(), 900)
+        cache.set("b", "tok", time.time(), 900)
+        cache.clear("a")
+        assert cache.get("a") is None and cache.get("b") is not None
+        cache.clear()
+        assert cache.get("b") is None
+
+    def test_concurrent_writers_keep_every_entry(self, cache):
+        threads = [
+            threading.Thread(target=cache.set, args=(str(i), "tok", time.time(), 900))
+            for i in range(16)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert sorted(cache._read(), key=int) == [str(i) for i in range(16)]
+
+
+class TestClientTokenCache:
+    def _client(self, cache):
+        client = MetquayClient(
+            access_key="ak", secret_key="sk", host="x.test", token_cache=cache
+        )
+        client._auth_api = MagicMock()
+        response = MagicMock()
+        response.access_token = "fresh"
+        response.expires_in = 900
+        client._auth_api.get_access_token.return_value = response
+        return client
+
+    def test_authenticate_populates_cache(self, cache):
+        self._client(cache)._ensure_authenticated()
+        token, _, expires_in = cache.get(FileTokenCache.key("x.test", "ak"))
+        assert (token, expires_in) == ("fresh", 900)
+
+    def test_valid_cached_token_skips_authenticate(self, cache):
+        cache.set(FileTokenCache.key("x.test", "ak"), "cached", time.time() - 60, 900)
+        client = self._client(cache)
+        client._ensure_authenticated()
+        client._auth_api.get_access_token.assert_not_called()
+        assert client._configuration.access_token == "cached"
+        assert 700 < client._token_remaining() <= 840
+
+    def test_authenticate_reuses_cached_token(self, cache):
+        cache.set(FileTokenCache.key("x.test", "ak"), "cached", time.time() - 60, 900)
+        client = self._client(cache)
+        response = client.authenticate()
+        client._auth_api.get_access_token.assert_not_called()
+        assert response.access_token == "cached"
+        assert 700 < response.expires_in <= 840
+
+    def test_authenticate_force_requests_a_new_token(self, cache):
+        key = FileTokenCache.key("x.test", "ak")
+        cache.set(key, "cached", time.time() - 60, 900)
+        client = self._client(cache)
+        assert client.authenticate(force=True).access_token == "fresh"
+        client._auth_api.get_access_token.assert_called_once()
+        assert cache.get(key)[0] == "fresh"
+
+    def test_cached_token_near_expiry_is_not_reused(self, cache):
+        cache.set(FileTokenCache.key("x.test", "ak"), "cached", time.time() - 850, 900)
+        client = self._client(cache)
+        client._ensure_authenticated()
+        client._auth_api.get_access_token.assert_called_once()
+        assert client._configuration.access_token == "fresh"
+
+
+class TestRejectedCachedToken:
+    def _client(self, server, cache):
+        return MetquayClient(
+            access_key="ak",
+            secret_key="sk",
+            host=server.url,
+            rate_limit_per_minute=None,
+            token_cache=cache,
+        )
+
+    def test_revoked_token_is_replaced_once(self, cache):
+        with FakeMetquayServer(seed_records=3) as server:
+            key = FileTokenCache.key(server.url, "ak")
+            cache.set(key, "revoked", time.time(), 900)
+            with self._client(server, cache) as client:
+                assert len(client.list_works()) == 3
+                assert client._token != "revoked"
+            assert cache.get(key)[0] == client._token
+            requests = server.stats()["requests"]
+        assert requests["getAccessToken"] == 1
+        assert requests["getWorks"] == 2
+
+    def test_own_token_is_not_retried(self, cache):
+        with FakeMetquayServer(seed_records=3) as server:
+            with self._client(server, cache) as client:
+                client.list_works()
+                server.expire_tokens()
+                with pytest.raises(UnauthorizedException):
+                    client.list_works()
+            assert server.stats()["requests"]["getAccessToken"] == 1
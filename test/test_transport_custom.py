@@ -0,0 +1,100 @@
+"""
+Unit tests for ``openapi_client.transport`` and clients sharing a Transport.
+These tests are NOT automatically generated; they run against a local
+``FakeMetquayServer``.
+"""
+
+import copy
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from openapi_client.configuration import Configuration
+from openapi_client.transport import PoolStats, Transport
+from pymetquay import MetquayClient
+from pymetquay.fake_server import FakeMetquayServer
+
+
+def _client(server, transport=None, **kwargs):
+    return MetquayClient(
+        access_key="ak",
+        secret_key="sk",
+        host=server.url,
+        rate_limit_per_minute=None,
+        transport=transport,
+        **kwargs,
+    )
+
+
+class TestPoolStats:
+    def test_checkout_and_checkin(self):
+        stats = PoolStats()
+        stats.checkout(reused=False, wait_seconds=None)
+        stats.checkout(reused=True, wait_seconds=0.5)
+        stats.checkin()
+        assert stats.as_dict() == {
+            "opened": 1,
+            "reused": 1,
+            "waited": 1,
+            "wait_seconds": 0.5,
+            "in_use": 1,
+            "peak_in_use": 2,
+        }
+        assert "opened=1" in repr(stats)
+
+
+class TestTransport:
+    def test_max_connections_must_be_positive(self):
+        with pytest.raises(ValueError):
+            Transport(max_connections=0)
+
+    def test_clients_share_connections(self):
+        with FakeMetquayServer(seed_records=5) as server, Transport() as transport:
+            for _ in range(3):
+                with _client(server, transport) as client:
+                    assert len(client.list_works(limit=2)) == 2
+            # Three clients, six requests (a token and a page each), one socket.
+            assert transport.stats.opened == 1
+            assert transport.stats.reused == 5
+            assert transport.stats.in_use == 0
+
+    def test_requests_wait_for_a_free_connection(self):
+        with FakeMetquayServer(seed_records=5, latency=0.05) as server:
+            with Transport(max_connections=1) as transport:
+                clients = [_client(server, transport) for _ in range(3)]
+                threads = [
+                    threading.Thread(target=client.list_works, kwargs={"limit": 1})
+                    for client in clients
+                ]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+                assert transport.stats.opened == 1
+                assert transport.stats.peak_in_use == 1
+                assert transport.stats.waited > 0
+                assert transport.stats.wait_seconds > 0
+
+    def test_client_close_leaves_shared_transport_open(self):
+        with FakeMetquayServer(seed_records=1) as server, Transport() as transport:
+            transport.pool_manager.clear = MagicMock()
+            with _client(server, transport) as client:
+                client.list_works(limit=1)
+            transport.pool_manager.clear.assert_not_called()
+            assert client.transport is transport
+
+    def test_client_close_closes_its_own_pool(self):
+        with FakeMetquayServer(seed_records=1) as server:
+            client = _client(server)
+            client.list_works(limit=1)
+            pool_manager = client._api_client.rest_client.pool_manager
+            assert len(pool_manager.pools) == 1
+            client.close()
+            assert len(pool_manager.pools) == 0
+
+    def test_configuration_copies_share_the_pool(self):
+        transport = Transport()
+        configuration = Configuration()
+        configuration.pool_manager = transport.pool_manager
+        assert copy.deepcopy(configuration).pool_manager is transport.pool_manager